@@ -1,7 +1,15 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.framebuffer import Framebuffer, headless_path
+from raster.line import DDA
+from raster.submit import PointBuffer
+
 # Window size
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
@@ -12,31 +20,9 @@ X1, Y1 = 220, 230
 # Will hold generated points from DDA
 POINTS = []
 
+# The points stay on the GPU between frames
+POINT_BUFFER = PointBuffer()
 
-def DDA(x0, y0, x1, y1):
-    points = []
-
-    dx = x1 - x0
-    dy = y1 - y0
-    steps = int(max(abs(dx), abs(dy)))
-
-    if steps == 0:
-        # Single point (degenerate line)
-        points.append((int(round(x0)), int(round(y0))))
-        return points
-
-    x_inc = dx / float(steps)
-    y_inc = dy / float(steps)
-
-    x = float(x0)
-    y = float(y0)
-
-    for _ in range(steps + 1):
-        points.append((int(round(x)), int(round(y))))
-        x += x_inc
-        y += y_inc
-
-    return points
 
 def display():
     glClear(GL_COLOR_BUFFER_BIT)
@@ -44,13 +30,15 @@ def display():
     # ----- Draw DDA points -----
     glColor3f(1.0, 1.0, 0.0)
     glPointSize(2.0)
-    glBegin(GL_POINTS)
-    for (xi, yi) in POINTS:
-        glVertex2i(xi, yi)
-    glEnd()
+    POINT_BUFFER.draw(POINTS)
     glutSwapBuffers()
 
 
+def render(fb):
+    # Same picture as display(), drawn into a Framebuffer without GL
+    fb.plot(POINTS, (255, 255, 0), size=2)
+
+
 def reshape(width, height):
     glViewport(0, 0, width, height)
     glMatrixMode(GL_PROJECTION)
@@ -78,6 +66,14 @@ def main():
     print("Generated DDA points:")
     print(POINTS)
 
+    # "--headless out.png" saves the picture instead of opening a window
+    path = headless_path(sys.argv)
+    if path:
+        fb = Framebuffer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        render(fb)
+        fb.save(path)
+        return
+
     # Start GLUT
     init_glut_window()
     glutMainLoop()
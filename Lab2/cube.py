@@ -1,107 +1,25 @@
+import os
+import sys
+
 from OpenGL.GL import *             # Core OpenGL functions (glBegin, glVertex, glClear, etc.)
 from OpenGL.GLU import *            # Utility library (gluOrtho2D)
 from OpenGL.GLUT import *           # GLUT functions (window creation, main loop)
 import math
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.framebuffer import Framebuffer, headless_path
+from raster.line import midPoint
+from raster.submit import PointBuffer
+
 
 # Window size constants (used for the orthographic projection and viewport)
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 
-
-# Line endpoints for demonstration (you can change these or make them interactive)
-# Coordinates are given in window pixel coordinates (0..WINDOW_WIDTH-1, 0..WINDOW_HEIGHT-1)
-def find_zone(x1, y1, x2, y2):
-    dx = x2 - x1
-    dy = y2 - y1
-    if abs(dx) >= abs(dy):
-        if dx >= 0 and dy >= 0:
-            return 0
-        elif dx < 0 and dy >= 0:
-            return 3
-        elif dx < 0 and dy < 0:
-            return 4
-        else:
-            return 7
-    else:
-        if dx >= 0 and dy >= 0:
-            return 1
-        elif dx < 0 and dy >= 0:
-            return 2
-        elif dx < 0 and dy < 0:
-            return 5
-        else:
-            return 6
-
-
-def to_zone0(x, y, zone):
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return y, -x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return -y, x
-    elif zone == 7:
-        return x, -y
-
-
-def from_zone0(x, y, zone):
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return -y, x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return y, -x
-    elif zone == 7:
-        return x, -y
-
-def midPoint(x1, y1, x2, y2):
-    zone = find_zone(x1, y1, x2, y2)
-    nx1, ny1 = to_zone0(x1, y1, zone)
-    nx2, ny2 = to_zone0(x2, y2, zone)
-
-    dx = nx2 - nx1
-    dy = ny2 - ny1
-
-    d = 2 * dy - dx
-    E = 2 * dy
-    NE = 2 * (dy - dx)
-
-    x, y = nx1, ny1
-    points = [(x, y)]
-
-    while x < nx2:
-        if d < 0:
-            d += E
-            x += 1
-        else:
-            d += NE
-            x += 1
-            y += 1
-        points.append((x, y))
-
-    
-    final_points = []
-    for px, py in points:
-        final_points.append(from_zone0(px, py, zone))
-    return final_points
-
+# Edge and corner pixels stay on the GPU; they are only re-uploaded if the
+# cube changes
+EDGE_BUFFER = PointBuffer()
+VERTEX_BUFFER = PointBuffer()
 
 
 def reshape(width, height):
@@ -117,13 +35,7 @@ def reshape(width, height):
 
 
 
-def display():
-    glClear(GL_COLOR_BUFFER_BIT)
-
-    # Set color and point size
-    glPointSize(4.0)
-    glColor3f(1.0, 0.0, 0.0)  # red lines
-
+def cube_points():
     # --- Define vertices and edges ---
     vertices = {
         'A': (2, 2), 'B': (5, 2), 'C': (5, 5), 'D': (2, 5),
@@ -139,8 +51,8 @@ def display():
     # Scale up coordinates for better visibility
     scale = 50
 
-    # --- Draw cube edges using DDA or midpoint line ---
-    glBegin(GL_POINTS)
+    # --- Cube edges using the midpoint line ---
+    edge_points = []
     for edge in edges:
         x0, y0 = vertices[edge[0]]
         x1, y1 = vertices[edge[1]]
@@ -149,23 +61,39 @@ def display():
         x0, y0 = x0 * scale, y0 * scale
         x1, y1 = x1 * scale, y1 * scale
 
-        # Draw line points using your midPoint function
-        points = midPoint(int(x0), int(y0), int(x1), int(y1))
-        for p in points:
-            glVertex2i(int(p[0]), int(p[1]))
-    glEnd()
+        # Line points using your midPoint function
+        edge_points += midPoint(int(x0), int(y0), int(x1), int(y1))
+
+    vertex_points = [(int(v[0] * scale), int(v[1] * scale)) for v in vertices.values()]
+    return edge_points, vertex_points
+
+
+def display():
+    glClear(GL_COLOR_BUFFER_BIT)
+    edge_points, vertex_points = cube_points()
+
+    # Set color and point size
+    glPointSize(4.0)
+    glColor3f(1.0, 0.0, 0.0)  # red lines
+
+    # --- Draw cube edges using DDA or midpoint line ---
+    EDGE_BUFFER.draw(edge_points)
 
     # --- Draw vertex points in green ---
     glPointSize(6.0)
     glColor3f(0.0, 1.0, 0.0)
-    glBegin(GL_POINTS)
-    for v in vertices.values():
-        glVertex2i(int(v[0] * scale), int(v[1] * scale))
-    glEnd()
+    VERTEX_BUFFER.draw(vertex_points)
 
     glutSwapBuffers()
 
 
+def render(fb):
+    # Same picture as display(), drawn into a Framebuffer without GL
+    edge_points, vertex_points = cube_points()
+    fb.plot(edge_points, (255, 0, 0), size=4)
+    fb.plot(vertex_points, (0, 255, 0), size=6)
+
+
 def init_glut_window():
  
 
@@ -199,7 +127,14 @@ def init_glut_window():
 
 
 def main():
-   
+    # "--headless out.png" saves the picture instead of opening a window
+    path = headless_path(sys.argv)
+    if path:
+        fb = Framebuffer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        render(fb)
+        fb.save(path)
+        return
+
     init_glut_window()
     glutMainLoop()
 
@@ -1,109 +1,21 @@
+import os
+import sys
+
 from OpenGL.GL import *             # Core OpenGL functions (glBegin, glVertex, glClear, etc.)
 from OpenGL.GLU import *            # Utility library (gluOrtho2D)
 from OpenGL.GLUT import *           # GLUT functions (window creation, main loop)
 import math
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.line import midPoint
+from raster.submit import draw_point_array, pack_points
+
 
 # Window size constants (used for the orthographic projection and viewport)
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 
 
-# Line endpoints for demonstration (you can change these or make them interactive)
-# Coordinates are given in window pixel coordinates (0..WINDOW_WIDTH-1, 0..WINDOW_HEIGHT-1)
-def find_zone(x1, y1, x2, y2):
-    dx = x2 - x1
-    dy = y2 - y1
-    if abs(dx) >= abs(dy):
-        if dx >= 0 and dy >= 0:
-            return 0
-        elif dx < 0 and dy >= 0:
-            return 3
-        elif dx < 0 and dy < 0:
-            return 4
-        else:
-            return 7
-    else:
-        if dx >= 0 and dy >= 0:
-            return 1
-        elif dx < 0 and dy >= 0:
-            return 2
-        elif dx < 0 and dy < 0:
-            return 5
-        else:
-            return 6
-
-
-def to_zone0(x, y, zone):
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return y, -x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return -y, x
-    elif zone == 7:
-        return x, -y
-
-
-def from_zone0(x, y, zone):
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return -y, x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return y, -x
-    elif zone == 7:
-        return x, -y
-
-def midPoint(x1, y1, x2, y2):
-    zone = find_zone(x1, y1, x2, y2)
-    nx1, ny1 = to_zone0(x1, y1, zone)
-    nx2, ny2 = to_zone0(x2, y2, zone)
-
-    dx = nx2 - nx1
-    dy = ny2 - ny1
-
-    d = 2 * dy - dx
-    E = 2 * dy
-    NE = 2 * (dy - dx)
-
-    x, y = nx1, ny1
-    points = [(x, y)]
-
-    while x < nx2:
-        if d < 0:
-            d += E
-            x += 1
-        else:
-            d += NE
-            x += 1
-            y += 1
-        points.append((x, y))
-
-    
-    final_points = []
-    for px, py in points:
-        final_points.append(from_zone0(px, py, zone))
-    return final_points
-
-
-
 def reshape(width, height):
     glViewport(0, 0, width, height)  # Set viewport to cover the new window size
 
@@ -147,21 +59,14 @@ def display():
     ]
 
     # --- Draw each edge using the midpoint line algorithm ---
-    glBegin(GL_POINTS)
-    for (x0, y0, x1, y1) in edges:
-        points = midPoint(x0, y0, x1, y1)
-        for p in points:
-            glVertex2i(int(p[0]), int(p[1]))
-    glEnd()
+    # (all edges in one vertex array)
+    lines = [midPoint(x0, y0, x1, y1) for (x0, y0, x1, y1) in edges]
+    draw_point_array(pack_points(*lines))
 
     # --- Draw vertex points in green for clarity ---
     glPointSize(5.0)
     glColor3f(0.0, 1.0, 0.0)
-    glBegin(GL_POINTS)
-    for (x0, y0, x1, y1) in edges:
-        glVertex2i(int(x0), int(y0))
-        glVertex2i(int(x1), int(y1))
-    glEnd()
+    draw_point_array([((x0, y0), (x1, y1)) for (x0, y0, x1, y1) in edges])
 
     # --- Swap Buffers ---
     glutSwapBuffers()
@@ -1,48 +1,26 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.clip import window_rect
+from raster.line import Bresenham
+from raster.submit import PointBuffer
+
 # Window size
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 
 
-# Will hold generated points from DDA
+# Will hold generated points from Bresenham
 POINTS = []
 
-# Bresenham function for line generation 
-def Bresenham(X1,Y1,X2,Y2): 
-    # calculate dx & dy 
-    dx = X2 - X1 
-    dy = Y2 - Y1 
-
-    # initial value of decision parameter d 
-    d = dy - (dx/2) 
-    x = X1
-    y = Y1 
-
-    # Plot initial given point 
-    # putpixel(x,y) can be used to print pixel 
-    # of line in graphics 
-    POINTS.append((x, y))
-    # iterate through value of X 
-    while (x < X2):
-        x=x+1
-        # E or East is chosen
-        if(d < 0):
-            d = d + dy 
-
-        # NE or North East is chosen 
-        else:
-            d = d + (dy - dx) 
-            y=y+1
-    
+# The points stay on the GPU between frames
+POINT_BUFFER = PointBuffer()
 
-        # Plot intermediate points 
-        # putpixel(x,y) is used to print pixel 
-        # of line in graphics 
-        POINTS.append((x, y))
-    return POINTS
 
 def display():
     glClear(GL_COLOR_BUFFER_BIT)
@@ -50,12 +28,7 @@ def display():
     # ----- Draw Bresenham points -----
     glColor3f(1.0, 1.0, 0.0)
     glPointSize(2.0)
-    glBegin(GL_POINTS)
-    for (xi, yi) in POINTS:
-        glVertex2i(xi, yi)
-
-    POINTS.clear()
-    glEnd()
+    POINT_BUFFER.draw(POINTS)
     glutSwapBuffers()
     
 
@@ -83,7 +56,7 @@ def init_glut_window():
 def main():
     global POINTS
 
-    POINTS = Bresenham(100, 100, 220, 230)
+    POINTS = Bresenham(100, 100, 220, 230, clip=window_rect(WINDOW_WIDTH, WINDOW_HEIGHT))
     print("Generated Bresenham points:")
     print(POINTS)
 
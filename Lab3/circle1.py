@@ -1,43 +1,17 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.circle import MidpointCircle
+from raster.submit import PointBatch
 
-def MidpointCircle(radius, x0, y0):
-    # actual midpoint circle algorithm
-    d = 1 - radius
-    x = 0
-    y = radius
-    Circlepoints(x, y, x0, y0)
-    while x < y:
-        if d < 0:
-            d = d + 2 * x + 3
-            x = x + 1
-        else:
-            d = d + 2 * x - 2 * y + 5
-            x = x + 1
-            y = y - 1
-        Circlepoints(x, y, x0, y0)
-
-    
-def Circlepoints(x, y, x0, y0):
-    # 8-way symmetry around (x0, y0)
-    draw_points(x0 + x, y0 + y)
-    draw_points(x0 + y, y0 + x)
-    draw_points(x0 - y, y0 + x)
-    draw_points(x0 - x, y0 + y)
-    draw_points(x0 - x, y0 - y)
-    draw_points(x0 - y, y0 - x)
-    draw_points(x0 + y, y0 - x)
-    draw_points(x0 + x, y0 - y)
 
-
-def draw_points(x, y):
-    # Draw a single point at (x, y)
-    glPointSize(3) #pixel size. by default 1 thake
-    glBegin(GL_POINTS)
-    glVertex2f(x,y) #jekhane show korbe pixel
-    glEnd()
+# The circle's pixels, flushed with one glDrawArrays per frame
+POINTS = PointBatch(size=3) #pixel size. by default 1 thake
 
 
 def iterate():
@@ -67,8 +41,10 @@ def showScreen():
     x = 400
     y = 300
     radius = 150
-    MidpointCircle(radius, x, y)
-   
+    # actual midpoint circle algorithm (offsets cached per radius)
+    POINTS.extend(MidpointCircle(radius, x, y))
+    POINTS.flush()
+
     glutSwapBuffers()
 
 
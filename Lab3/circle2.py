@@ -1,7 +1,17 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.submit import PointBatch
+
+
+# Circlepoints() queues its 8 mirrored pixels here instead of drawing them
+POINTS = PointBatch(size=3)
+
 
 def MidpointCircle(radius, x0, y0):
     # actual midpoint circle algorithm
@@ -34,11 +44,8 @@ def Circlepoints(x, y, x0, y0):
 
 
 def draw_points(x, y):
-    # Draw a single point at (x, y)
-    glPointSize(3) #pixel size. by default 1 thake
-    glBegin(GL_POINTS)
-    glVertex2f(x,y) #jekhane show korbe pixel
-    glEnd()
+    # Queue a point at (x, y); showScreen draws the whole batch at once
+    POINTS.add(x, y)
 
 
 def iterate():
@@ -69,6 +76,7 @@ def showScreen():
     radius = 150
     MidpointCircle(radius, x, y)
    
+    POINTS.flush()
     glutSwapBuffers()
 
 
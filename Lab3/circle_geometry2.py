@@ -1,7 +1,17 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.submit import PointBatch
+
+
+# Pixels of the big circle and the eight on its rim, drawn together at the end of showScreen
+POINTS = PointBatch(size=3)
+
 
 def MidpointCircle(radius, x0, y0):
     d = 1 - radius
@@ -32,10 +42,8 @@ def Circlepoints(x, y, x0, y0):
 
 
 def draw_points(x, y):
-    glPointSize(3) #pixel size. by default 1 thake
-    glBegin(GL_POINTS)
-    glVertex2f(x,y) #jekhane show korbe pixel
-    glEnd()
+    # Queue a point at (x, y); showScreen draws the whole batch at once
+    POINTS.add(x, y)
 
 
 def iterate():
@@ -99,6 +107,7 @@ def showScreen():
     MidpointCircle(radius9, x9, y9)
 
    
+    POINTS.flush()
     glutSwapBuffers()
 
 
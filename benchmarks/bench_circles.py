@@ -0,0 +1,232 @@
+"""
+Circle rasterizer benchmarks.
+
+Run from the repository root:
+
+    python benchmarks/bench_circles.py
+"""
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raster.circle import (
+    MidpointArc, MidpointCircle, OctantCache, circle_fan, circle_offsets, circle_ring,
+    lod_segments,
+)
+from raster.ellipse import MidpointEllipse, ellipse_outline, ellipse_quadrant
+from raster.line import spans_to_pixels
+
+
+# Radii and centers of the circles practice/snowman.py draws per redraw
+SNOWMAN = [
+    (130, 400, 140), (90, 400, 360), (60, 400, 510),
+    (8, 382, 520), (8, 418, 520), (25, 400, 490),
+    (8, 400, 382), (8, 400, 338),
+]
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_octant_cache(frames=200):
+    print("MidpointCircle with and without the octant cache, %d snowman redraws" % frames)
+
+    def uncached():
+        for _ in range(frames):
+            for radius, x0, y0 in SNOWMAN:
+                circle_offsets(radius) + (x0, y0)
+
+    cache = OctantCache()
+
+    def cached():
+        for _ in range(frames):
+            for radius, x0, y0 in SNOWMAN:
+                MidpointCircle(radius, x0, y0, cache=cache)
+
+    t_uncached = best_of(uncached, repeat=3)
+    t_cached = best_of(cached, repeat=3)
+    print("  uncached %.3fs  cached %.3fs  (%.1fx, %d radii, %d bytes, %d hits / %d misses)"
+          % (t_uncached, t_cached, t_uncached / t_cached, len(cache), cache.nbytes,
+             cache.hits, cache.misses))
+
+
+def check_ring(max_radius=400):
+    print("circle_ring vs 8-way MidpointCircle output, radii 0..%d" % max_radius)
+    emitted = 0
+    unique = 0
+    for radius in range(max_radius + 1):
+        full = MidpointCircle(radius, 0, 0)
+        ring = MidpointCircle(radius, 0, 0, unique=True)
+        full_set = set(map(tuple, full.tolist()))
+        ring_list = list(map(tuple, ring.tolist()))
+        assert set(ring_list) == full_set, "pixel set differs for radius %d" % radius
+        assert len(ring_list) == len(full_set), "duplicates left for radius %d" % radius
+        if radius > 0:
+            angles = np.arctan2(ring[:, 1], ring[:, 0]) % (2 * np.pi)
+            assert np.all(np.diff(angles) > 0), "not in angular order for radius %d" % radius
+        emitted += len(full)
+        unique += len(ring)
+    print("  %d points emitted, %d unique: %d duplicates removed (%.1f%%)"
+          % (emitted, unique, emitted - unique, 100.0 * (emitted - unique) / emitted))
+
+    for radius in (8, 25, 60, 150):
+        full = len(circle_offsets(radius))
+        ring = len(circle_ring(radius))
+        print("  radius %3d: %4d -> %4d points" % (radius, full, ring))
+
+
+def bench_arcs(max_radius=300, frames=2000):
+    print("MidpointArc half-planes vs full circle + filter")
+    x0, y0 = 400, 300
+    filters = {
+        "upper": lambda p: p[1] >= y0,
+        "lower": lambda p: p[1] <= y0,
+        "left": lambda p: p[0] <= x0,
+        "right": lambda p: p[0] >= x0,
+    }
+    for radius in range(max_radius + 1):
+        full = MidpointCircle(radius, x0, y0, unique=True).tolist()
+        for half, keep in filters.items():
+            arc = MidpointArc(radius, x0, y0, half=half).tolist()
+            expected = [p for p in full if keep(p)]
+            assert sorted(arc) == sorted(expected) and len(arc) == len(expected), \
+                "arc %s differs for radius %d" % (half, radius)
+
+    # The half circles of practice/heart_shape.py and practice/car_shape.py
+    arcs = [(90, 310, 430), (90, 490, 430), (50, 350, 430), (50, 450, 430),
+            (70, 240, 350), (90, 240, 350)]
+
+    def filtered():
+        for _ in range(frames):
+            for radius, cx, cy in arcs:
+                [p for p in MidpointCircle(radius, cx, cy).tolist() if p[1] >= cy]
+
+    def sliced():
+        for _ in range(frames):
+            for radius, cx, cy in arcs:
+                MidpointArc(radius, cx, cy, half="upper").tolist()
+
+    t_filtered = best_of(filtered, repeat=3)
+    t_sliced = best_of(sliced, repeat=3)
+    print("  %d frames: filter %.3fs  arc %.3fs  (%.1fx)"
+          % (frames, t_filtered, t_sliced, t_filtered / t_sliced))
+
+
+def check_ellipse(max_axis=80):
+    print("MidpointEllipse outline and fill, semi-axes 0..%d" % max_axis)
+    for rx in range(max_axis + 1):
+        for ry in range(max_axis + 1):
+            outline = list(map(tuple, ellipse_outline(rx, ry).tolist()))
+            assert len(set(outline)) == len(outline), "duplicates for (%d, %d)" % (rx, ry)
+            if rx == ry:
+                ring = set(map(tuple, circle_ring(rx).tolist()))
+                assert set(outline) == ring, "ellipse != circle for radius %d" % rx
+            elif rx and ry:
+                # Flat and tall ellipses too reach their tips on both axes
+                assert ellipse_quadrant(rx, ry)[-1].tolist() == [rx, 0], \
+                    "quadrant of (%d, %d) stops short of (rx, 0)" % (rx, ry)
+                xs = [px for px, _ in outline]
+                ys = [py for _, py in outline]
+                assert (min(xs), max(xs), min(ys), max(ys)) == (-rx, rx, -ry, ry), \
+                    "outline of (%d, %d) has the wrong extent" % (rx, ry)
+            fill = spans_to_pixels(MidpointEllipse(rx, ry, 0, 0, filled=True))
+            assert set(outline) <= set(map(tuple, fill.tolist())), \
+                "fill misses outline for (%d, %d)" % (rx, ry)
+    print("  ok")
+
+
+def bench_scene_ellipses(frames=500):
+    print("project/main.py wheels and sun: trig fan vs cached midpoint rim, %d frames" % frames)
+    # (rx, ry) in world units, doubled to pixels like project/main.py does
+    shapes = [(4, 4)] * 6 + [(30, 30)] + [(10, 10)] * 12
+
+    def trig():
+        for _ in range(frames):
+            for rx, ry in shapes:
+                [(rx * math.sin(math.radians(a)), ry * math.cos(math.radians(a))) for a in range(361)]
+
+    cache = OctantCache()
+
+    def cached():
+        for _ in range(frames):
+            for rx, ry in shapes:
+                cache.get(ellipse_outline, 2 * rx, 2 * ry).tolist()
+
+    t_trig = best_of(trig, repeat=3)
+    t_cached = best_of(cached, repeat=3)
+    before = 361 * len(shapes)
+    after = sum(len(ellipse_outline(2 * rx, 2 * ry)) for rx, ry in shapes)
+    print("  trig %.3fs  cached %.3fs  (%.1fx), %d -> %d rim vertices per frame"
+          % (t_trig, t_cached, t_trig / t_cached, before, after))
+
+
+def bench_clock_circles(frames=2000):
+    print("project/clock.py circles: trig glVertex loop vs unit-circle table, %d frames" % frames)
+    # (r, segments) of the face, bob, center cap and pivot drawn every frame
+    shapes = [(0.22, 80), (0.045, 40), (0.01, 24), (0.01, 24)]
+    cx, cy = 0.0, 0.45
+
+    def trig():
+        for _ in range(frames):
+            for r, segments in shapes:
+                fan = [(cx, cy)]
+                for i in range(segments + 1):
+                    angle = 2.0 * math.pi * i / segments
+                    fan.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+
+    cache = OctantCache()
+
+    def table():
+        for _ in range(frames):
+            for r, segments in shapes:
+                circle_fan(cx, cy, r, segments=segments, cache=cache)
+
+    error = max(
+        np.abs(circle_fan(cx, cy, r, segments=n)[1:] - [
+            (cx + r * math.cos(2.0 * math.pi * i / n), cy + r * math.sin(2.0 * math.pi * i / n))
+            for i in range(n + 1)
+        ]).max()
+        for r, n in shapes
+    )
+    t_trig = best_of(trig, repeat=3)
+    t_table = best_of(table, repeat=3)
+    print("  trig %.3fs  table %.3fs  (%.1fx), max vertex difference %.1e"
+          % (t_trig, t_table, t_trig / t_table, error))
+
+
+def check_lod(tolerance=0.25):
+    # Every chord within tolerance of the arc, and 4 fewer segments would not be
+    for radius in np.linspace(0.5, 1000.0, 4000):
+        n = lod_segments(radius, tolerance, min_segments=4, max_segments=10 ** 6)
+        sagitta = radius * (1.0 - math.cos(math.pi / n))
+        assert sagitta <= tolerance + 1e-9, (radius, n, sagitta)
+        if n > 4:
+            assert radius * (1.0 - math.cos(math.pi / (n - 4))) > tolerance, (radius, n)
+    print("lod_segments: chord error within %.2f px and minimal for radii up to 1000 px" % tolerance)
+    print("  radius 8 px -> %d segments, 60 px -> %d, 98 px -> %d"
+          % (lod_segments(8), lod_segments(60), lod_segments(98)))
+
+
+def main():
+    check_ring()
+    check_ellipse()
+    check_lod()
+    bench_arcs()
+    bench_octant_cache()
+    bench_scene_ellipses()
+    bench_clock_circles()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Software framebuffer benchmarks.
+
+Checks the polygon fill against a per-pixel even-odd test, then times
+headless renders of the practice scenes, the project city scene and a
+wall of instanced grandfather clocks.
+Run from the repository root:
+
+    python benchmarks/bench_framebuffer.py
+"""
+import os
+import runpy
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from raster.framebuffer import Framebuffer
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def even_odd(vertices, width, height):
+    # Reference fill: test every pixel (x, y) against every edge
+    v = np.asarray(vertices, dtype=np.float64)
+    ys, xs = np.mgrid[0:height, 0:width]
+    inside = np.zeros((height, width), dtype=bool)
+    for (x0, y0), (x1, y1) in zip(v, np.roll(v, -1, axis=0)):
+        if y0 == y1:
+            continue
+        crosses = (np.minimum(y0, y1) <= ys) & (ys < np.maximum(y0, y1))
+        x_at = x0 + (ys - y0) * (x1 - x0) / (y1 - y0)
+        inside ^= crosses & (xs >= x_at)
+    return inside
+
+
+def edge_shifted(a, b, reach=2):
+    """
+    Pixels where a and b differ, and whether each of them is explained by
+    edges moving a pixel: the color of a at that pixel occurs in b at most
+    reach pixels away, and the other way round. The default of 2 lets a
+    one-pixel gap between two shifted edges close.
+    """
+    differ = np.any(a != b, axis=2)
+    ys, xs = np.nonzero(differ)
+
+    def near(src, other):
+        padded = np.pad(other, ((reach, reach), (reach, reach), (0, 0)), mode="edge")
+        found = np.zeros(len(ys), dtype=bool)
+        for dy in range(2 * reach + 1):
+            for dx in range(2 * reach + 1):
+                found |= np.all(padded[ys + dy, xs + dx] == src[ys, xs], axis=1)
+        return found
+
+    return int(differ.sum()), bool(np.all(near(a, b)) and np.all(near(b, a)))
+
+
+def check_fill_polygon(count=200, width=64, height=48):
+    print("fill_polygon vs per-pixel even-odd test, %d random polygons" % count)
+    rng = np.random.default_rng(0)
+    for _ in range(count):
+        vertices = rng.integers(-10, 70, size=(rng.integers(3, 9), 2))
+        fb = Framebuffer(width, height)
+        fb.fill_polygon(vertices, (255, 255, 255))
+        got = fb.pixels[:, :, 0] == 255
+        expected = even_odd(vertices, width, height)
+        assert np.array_equal(got, expected), "fill_polygon differs for %r" % (vertices.tolist(),)
+    print("  ok")
+
+
+def bench_scenes(frames=50):
+    print("Headless renders of the practice scenes, %d frames each" % frames)
+    for name in ("snowman", "mickey_mouse", "heart_shape", "car_shape"):
+        scene = runpy.run_path(os.path.join(ROOT, "practice", name + ".py"), run_name="scene")
+        fb = Framebuffer(scene["WINDOW_WIDTH"], scene["WINDOW_HEIGHT"])
+
+        def frame():
+            for _ in range(frames):
+                fb.clear()
+                scene["render"](fb)
+
+        t = best_of(frame, repeat=3)
+        print("  %-13s %.2f ms/frame (%.0f fps)" % (name, 1000 * t / frames, frames / t))
+
+    fb = Framebuffer(800, 600)
+    t_png = best_of(lambda: fb.save_png(os.devnull), repeat=3)
+    t_ppm = best_of(lambda: fb.save_ppm(os.devnull), repeat=3)
+    print("  800x600 save: png %.1f ms  ppm %.1f ms" % (1000 * t_png, 1000 * t_ppm))
+
+
+def bench_city(sizes=((250, 250), (500, 500), (1000, 1000)), frames=10):
+    print("Headless project/main.py frames (software GL), %d frames per size" % frames)
+    sys.path.insert(0, os.path.join(ROOT, "project"))   # for "import clock"
+    city = runpy.run_path(os.path.join(ROOT, "project", "main.py"), run_name="city")
+    for width, height in sizes:
+        def render():
+            for frame in range(0, 40 * frames, 40):
+                city["render_frame"](frame, width, height, start=0.0)
+
+        t = best_of(render, repeat=2)
+        print("  %4dx%-4d %.1f ms/frame (%.1f fps)" % (width, height, 1000 * t / frames, frames / t))
+
+
+def check_fill_triangles(count=400, size=200):
+    # Batched triangles must match filling them one by one, overlaps included
+    rng = np.random.default_rng(3)
+    triangles = rng.uniform(-20, size + 20, (count, 3, 2))
+    triangles[::5] = np.rint(triangles[::5])
+    colors = rng.integers(0, 256, (count, 3))
+    one_by_one = Framebuffer(size, size)
+    batched = Framebuffer(size, size)
+    for triangle, color in zip(triangles, colors):
+        one_by_one.fill_polygon(triangle, tuple(color))
+    batched.fill_triangles(triangles, colors)
+    assert np.array_equal(one_by_one.pixels, batched.pixels), "fill_triangles mismatch"
+    print("fill_triangles matches fill_polygon on %d overlapping triangles" % count)
+
+
+def bench_clock_wall(counts=(25, 100, 400), size=1000):
+    print("Grandfather clock wall at %dx%d: draw_grandfather_clock per clock vs "
+          "draw_grandfather_clocks" % (size, size))
+    sys.path.insert(0, os.path.join(ROOT, "project"))
+    import clock
+    from raster.softgl import GL_MODELVIEW, GL_PROJECTION, SoftGL, install
+
+    for count in counts:
+        columns = int(np.ceil(np.sqrt(count)))
+        cell = size / columns
+        scale = cell / 2.2
+        k = np.arange(count)
+        positions = np.stack([(k % columns + 0.5) * cell, (k // columns) * cell + 0.05 * cell], axis=1)
+        offsets = k * 137.0
+
+        def setup():
+            fb = Framebuffer(size, size, clear_color=(255, 255, 255))
+            ctx = SoftGL(fb)
+            install(ctx, vars(clock))
+            clock.invalidate_static()
+            ctx.glMatrixMode(GL_PROJECTION)
+            ctx.glOrtho(0, size, 0, size)
+            ctx.glMatrixMode(GL_MODELVIEW)
+            return fb
+
+        def single():
+            fb = setup()
+            for (x, y), offset in zip(positions, offsets):
+                clock.draw_grandfather_clock(x, y, scale, now=1e9 + offset)
+            return fb
+
+        def batch():
+            fb = setup()
+            clock.draw_grandfather_clocks(positions, scale, offsets, now=1e9)
+            return fb
+
+        # Both paths must draw the same wall. They transform the vertices
+        # differently (GL matrix stack vs NumPy in world space), so an edge
+        # lying exactly on a pixel center, like the plinths at y = 0.05 *
+        # cell, may round to the other side: allow edges one pixel apart
+        # (see edge_shifted) on at most 0.5% of the pixels, and nothing else.
+        differ, shifted = edge_shifted(single().pixels, batch().pixels)
+        assert shifted and differ <= 0.005 * size * size, \
+            "%d clocks: %d pixels differ between single and batch" % (count, differ)
+
+        t_single = best_of(single, repeat=3)
+        t_batch = best_of(batch, repeat=3)
+        print("  %4d clocks: single %.1f ms  batch %.1f ms  (%.1fx, %.0f fps), "
+              "%.2f%% of the pixels on shifted edges"
+              % (count, 1000 * t_single, 1000 * t_batch, t_single / t_batch, 1 / t_batch,
+                 100.0 * differ / (size * size)))
+
+
+def main():
+    check_fill_polygon()
+    check_fill_triangles()
+    bench_scenes()
+    bench_city()
+    bench_clock_wall()
+
+
+if __name__ == "__main__":
+    main()
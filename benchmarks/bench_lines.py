@@ -0,0 +1,305 @@
+"""
+Line rasterizer benchmarks.
+
+Each benchmark first checks that the compared implementations produce the
+same pixels, then times them. Run from the repository root:
+
+    python benchmarks/bench_lines.py
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from raster.clip import cohenSutherland, liangBarsky, liangBarsky_batch, window_rect
+from raster.line import (
+    Bresenham,
+    Bresenham_batch,
+    DDA,
+    DDA_batch,
+    line_spans,
+    midPoint,
+    midPointDoubleStep,
+    spans_to_pixels,
+)
+
+
+# ---------- Reference implementations ----------
+
+def legacy_find_zone(x1, y1, x2, y2):
+    dx = x2 - x1
+    dy = y2 - y1
+    if abs(dx) >= abs(dy):
+        if dx >= 0 and dy >= 0:
+            return 0
+        elif dx < 0 and dy >= 0:
+            return 3
+        elif dx < 0 and dy < 0:
+            return 4
+        else:
+            return 7
+    else:
+        if dx >= 0 and dy >= 0:
+            return 1
+        elif dx < 0 and dy >= 0:
+            return 2
+        elif dx < 0 and dy < 0:
+            return 5
+        else:
+            return 6
+
+
+def legacy_to_zone0(x, y, zone):
+    if zone == 0:
+        return x, y
+    elif zone == 1:
+        return y, x
+    elif zone == 2:
+        return y, -x
+    elif zone == 3:
+        return -x, y
+    elif zone == 4:
+        return -x, -y
+    elif zone == 5:
+        return -y, -x
+    elif zone == 6:
+        return -y, x
+    elif zone == 7:
+        return x, -y
+
+
+def legacy_from_zone0(x, y, zone):
+    if zone == 0:
+        return x, y
+    elif zone == 1:
+        return y, x
+    elif zone == 2:
+        return -y, x
+    elif zone == 3:
+        return -x, y
+    elif zone == 4:
+        return -x, -y
+    elif zone == 5:
+        return -y, -x
+    elif zone == 6:
+        return y, -x
+    elif zone == 7:
+        return x, -y
+
+
+def legacy_midPoint(x1, y1, x2, y2):
+    # The per-script copy that used to live in Lab2/, Lab4/ and practice/
+    zone = legacy_find_zone(x1, y1, x2, y2)
+    nx1, ny1 = legacy_to_zone0(x1, y1, zone)
+    nx2, ny2 = legacy_to_zone0(x2, y2, zone)
+
+    dx = nx2 - nx1
+    dy = ny2 - ny1
+
+    d = 2 * dy - dx
+    E = 2 * dy
+    NE = 2 * (dy - dx)
+
+    x, y = nx1, ny1
+    points = [(x, y)]
+
+    while x < nx2:
+        if d < 0:
+            d += E
+            x += 1
+        else:
+            d += NE
+            x += 1
+            y += 1
+        points.append((x, y))
+
+    final_points = []
+    for px, py in points:
+        final_points.append(legacy_from_zone0(px, py, zone))
+    return final_points
+
+
+# ---------- Helpers ----------
+
+def best_of(func, repeat=5):
+    # Smallest wall time over a few runs (least disturbed by the OS)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def random_segments(count, extent=800, seed=0, integer=True):
+    rng = np.random.default_rng(seed)
+    seg = rng.uniform(0, extent, size=(count, 4))
+    return np.rint(seg).astype(np.int64) if integer else seg
+
+
+def bench_dda_batch(count=20000):
+    print("DDA vs DDA_batch, %d segments" % count)
+    for integer in (True, False):
+        segments = random_segments(count, integer=integer)
+        rows = segments.tolist()
+
+        pixels, offsets = DDA_batch(segments)
+        for i, row in enumerate(rows):
+            expected = DDA(*row)
+            got = [tuple(p) for p in pixels[offsets[i]:offsets[i + 1]].tolist()]
+            assert got == expected, "DDA_batch mismatch on segment %r" % (row,)
+
+        t_loop = best_of(lambda: [DDA(*row) for row in rows], repeat=3)
+        t_batch = best_of(lambda: DDA_batch(segments))
+        kind = "int" if integer else "float"
+        print("  %-5s endpoints: loop %.3fs  batch %.3fs  (%.1fx, %d pixels)"
+              % (kind, t_loop, t_batch, t_loop / t_batch, len(pixels)))
+
+
+def bench_midpoint(count=20000):
+    print("legacy midPoint vs raster.line.midPoint, %d segments" % count)
+    rows = random_segments(count).tolist()
+    # Make sure every zone and the degenerate cases are covered
+    rows += [[0, 0, 0, 0], [5, 5, 5, 40], [5, 40, 5, 5], [0, 9, 30, 9], [30, 9, 0, 9]]
+    for row in rows:
+        assert midPoint(*row) == legacy_midPoint(*row), "midPoint mismatch on %r" % (row,)
+
+    t_legacy = best_of(lambda: [legacy_midPoint(*row) for row in rows], repeat=3)
+    t_shared = best_of(lambda: [midPoint(*row) for row in rows], repeat=3)
+    print("  legacy %.3fs  shared %.3fs  (%.2fx)" % (t_legacy, t_shared, t_legacy / t_shared))
+
+
+def bench_bresenham(count=20000):
+    print("Bresenham vs DDA vs midPoint, %d segments" % count)
+    rows = random_segments(count).tolist()
+    for row in rows:
+        assert [tuple(p) for p in Bresenham(*row).tolist()] == midPoint(*row), \
+            "Bresenham mismatch on %r" % (row,)
+
+    t_dda = best_of(lambda: [DDA(*row) for row in rows], repeat=3)
+    t_mid = best_of(lambda: [midPoint(*row) for row in rows], repeat=3)
+    t_bres = best_of(lambda: [Bresenham(*row) for row in rows], repeat=3)
+    print("  DDA %.3fs  midPoint %.3fs  Bresenham %.3fs" % (t_dda, t_mid, t_bres))
+
+
+def bench_bresenham_batch(count=20000):
+    print("Bresenham vs Bresenham_batch, %d segments" % count)
+    segments = random_segments(count)
+    rows = segments.tolist() + [[0, 0, 0, 0], [5, 40, 5, 5], [30, 9, 0, 9], [7, 3, -20, -90]]
+    segments = np.array(rows)
+
+    pixels, offsets = Bresenham_batch(segments)
+    for i, row in enumerate(rows):
+        assert np.array_equal(pixels[offsets[i]:offsets[i + 1]], Bresenham(*row)), \
+            "Bresenham_batch mismatch on segment %r" % (row,)
+
+    t_loop = best_of(lambda: [Bresenham(*row) for row in rows], repeat=3)
+    t_batch = best_of(lambda: Bresenham_batch(segments))
+    print("  loop %.3fs  batch %.3fs  (%.1fx, %d pixels)"
+          % (t_loop, t_batch, t_loop / t_batch, len(pixels)))
+
+
+def bench_double_step(lengths=(1000, 10000, 100000), per_length=20):
+    print("midPoint single vs double step, by line length")
+    rng = np.random.default_rng(1)
+    for length in lengths:
+        rows = []
+        for _ in range(per_length):
+            angle = rng.uniform(0, 2 * np.pi)
+            x1, y1 = rng.integers(-1000, 1000, size=2).tolist()
+            x2 = x1 + int(round(length * np.cos(angle)))
+            y2 = y1 + int(round(length * np.sin(angle)))
+            rows.append([x1, y1, x2, y2])
+        for row in rows:
+            got = [tuple(p) for p in midPointDoubleStep(*row).tolist()]
+            assert got == midPoint(*row), "double step mismatch on %r" % (row,)
+
+        t_single = best_of(lambda: [midPoint(*row) for row in rows], repeat=3)
+        t_double = best_of(lambda: [midPointDoubleStep(*row) for row in rows], repeat=3)
+        print("  length %6d: single %.4fs  double %.4fs  (%.2fx)"
+              % (length, t_single, t_double, t_single / t_double))
+
+
+def bench_spans(count=20000):
+    print("Bresenham pixels vs line_spans runs, %d segments" % count)
+    rows = random_segments(count).tolist()
+    pixel_total = 0
+    span_total = 0
+    for row in rows:
+        spans, vertical = line_spans(*row)
+        got = sorted(map(tuple, spans_to_pixels(spans, vertical).tolist()))
+        assert got == sorted(midPoint(*row)), "line_spans mismatch on %r" % (row,)
+        pixel_total += int(spans[:, 2].sum())
+        span_total += len(spans)
+
+    t_pixels = best_of(lambda: [Bresenham(*row) for row in rows], repeat=3)
+    t_spans = best_of(lambda: [line_spans(*row) for row in rows], repeat=3)
+    print("  %d pixels -> %d runs (%.1fx smaller)  pixels %.3fs  spans %.3fs"
+          % (pixel_total, span_total, pixel_total / span_total, t_pixels, t_spans))
+
+
+def bench_clip(count=5000):
+    rect = window_rect(800, 600)
+    xmin, ymin, xmax, ymax = rect
+    print("Clipped vs unclipped walks against the 800x600 window, %d segments" % count)
+    rng = np.random.default_rng(2)
+    rows = rng.integers(-3000, 3800, size=(count, 4)).tolist()
+    for row in rows:
+        full = Bresenham(*row)
+        inside = ((full[:, 0] >= xmin) & (full[:, 0] <= xmax)
+                  & (full[:, 1] >= ymin) & (full[:, 1] <= ymax))
+        expected = full[inside].tolist()
+        assert Bresenham(*row, clip=rect).tolist() == expected, "Bresenham clip on %r" % (row,)
+        assert [list(p) for p in midPoint(*row, clip=rect)] == expected, \
+            "midPoint clip on %r" % (row,)
+        spans, vertical = line_spans(*row, clip=rect)
+        assert sorted(spans_to_pixels(spans, vertical).tolist()) == sorted(expected), \
+            "line_spans clip on %r" % (row,)
+
+        cs = cohenSutherland(*row, rect)
+        lb = liangBarsky(*row, rect)
+        if cs is not None and lb is not None:
+            assert np.allclose(cs, lb), "clippers disagree on %r" % (row,)
+
+    clipped, visible = liangBarsky_batch(rows, rect)
+    for row, got, shown in zip(rows, clipped, visible):
+        lb = liangBarsky(*row, rect)
+        assert shown == (lb is not None), "batch visibility on %r" % (row,)
+        if shown:
+            assert np.allclose(got, lb), "batch endpoints on %r" % (row,)
+
+    t_full = best_of(lambda: [Bresenham(*row) for row in rows], repeat=3)
+    t_clip = best_of(lambda: [Bresenham(*row, clip=rect) for row in rows], repeat=3)
+    t_mid = best_of(lambda: [midPoint(*row) for row in rows], repeat=1)
+    t_mid_clip = best_of(lambda: [midPoint(*row, clip=rect) for row in rows], repeat=3)
+    t_cs = best_of(lambda: [cohenSutherland(*row, rect) for row in rows], repeat=3)
+    t_lb = best_of(lambda: [liangBarsky(*row, rect) for row in rows], repeat=3)
+    t_batch = best_of(lambda: liangBarsky_batch(rows, rect))
+    print("  Bresenham %.3fs -> %.3fs  midPoint %.3fs -> %.3fs  (%d of %d visible)"
+          % (t_full, t_clip, t_mid, t_mid_clip, int(visible.sum()), count))
+    print("  Cohen-Sutherland %.3fs  Liang-Barsky %.3fs  batch %.4fs"
+          % (t_cs, t_lb, t_batch))
+
+    # The segment from the request: two million steps, 800 of them visible
+    row = (-10 ** 6, 0, 10 ** 6, 5)
+    t_full = best_of(lambda: Bresenham(*row), repeat=3)
+    t_clip = best_of(lambda: Bresenham(*row, clip=rect), repeat=3)
+    print("  (-1e6, 0) -> (1e6, 5): %d -> %d pixels, %.4fs -> %.5fs"
+          % (len(Bresenham(*row)), len(Bresenham(*row, clip=rect)), t_full, t_clip))
+
+
+def main():
+    bench_dda_batch()
+    bench_midpoint()
+    bench_bresenham()
+    bench_bresenham_batch()
+    bench_double_step()
+    bench_spans()
+    bench_clip()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Frame profiler benchmarks.
+
+Times a section while the profiler is disabled and enabled, then the
+project city scene with profiling off and on, and checks that the Chrome
+trace covers every recorded section.
+Run from the repository root:
+
+    python benchmarks/bench_profiler.py
+"""
+import os
+import runpy
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from raster.profiler import FrameProfiler
+
+
+def per_call(func, count=200000):
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count
+
+
+def bench_section():
+    profiler = FrameProfiler()
+
+    def section():
+        with profiler.section("work"):
+            pass
+
+    print("Cost of one `with section(...)` block")
+    print("  disabled: %6.0f ns" % (per_call(section) * 1e9))
+    profiler.enable()
+    profiler.begin_frame()
+    print("  enabled:  %6.0f ns" % (per_call(section, 20000) * 1e9))
+
+
+def bench_city(size=500, frames=20):
+    print("Headless project/main.py frames at %dx%d, %d frames" % (size, size, frames))
+    sys.path.insert(0, os.path.join(ROOT, "project"))   # for "import clock"
+    city = runpy.run_path(os.path.join(ROOT, "project", "main.py"), run_name="city")
+    profiler = city["PROFILER"]
+
+    def render():
+        start = time.perf_counter()
+        for frame in range(frames):
+            city["render_frame"](300 + frame, size, size, start=1000.0)
+        return (time.perf_counter() - start) / frames
+
+    render()   # warm up
+    off = render()
+    profiler.enable(city["render_frame"].__globals__, vars(sys.modules["clock"]))
+    on = render()
+    profiler.disable()
+    print("  profiler off: %7.2f ms/frame" % (off * 1000))
+    print("  profiler on:  %7.2f ms/frame (%+.1f%%)" % (on * 1000, 100 * (on - off) / off))
+
+    trace = profiler.chrome_trace()["traceEvents"]
+    sections = sum(len(frame["sections"]) for frame in profiler.frames)
+    assert len(trace) == len(profiler.frames) + sections
+    assert all(event["dur"] >= 0 for event in trace)
+    calls = sum(frame["calls"] for frame in profiler.frames) / len(profiler.frames)
+    print("  %d sections per frame, %.0f GL calls per frame; trace ok"
+          % (sections / len(profiler.frames), calls))
+
+
+def main():
+    bench_section()
+    bench_city()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+GL call recorder benchmarks.
+
+Checks that a project/main.py frame recorded with raster.recorder and
+replayed into the software GL matches rendering it directly, that replay
+maps display-list and buffer ids to the target's own, and that a
+raster.submit.PointBuffer uploads a static scene once. Then times the Lab3
+circle scene drawn one glBegin/glEnd per pixel against a
+raster.submit.PointBatch, and records the lab scripts under the mock
+OpenGL modules to report their per-frame command counts and recording
+speed.
+Run from the repository root:
+
+    python benchmarks/bench_recorder.py
+"""
+import os
+import runpy
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from raster.circle import MidpointCircle
+from raster.framebuffer import Framebuffer
+from raster.recorder import GLRecorder, run_script
+from raster.softgl import SoftGL, install
+
+
+def check_replay(t=4.5, size=500):
+    # Record one city frame, replay it into a fresh software context
+    sys.path.insert(0, os.path.join(ROOT, "project"))   # for "import clock"
+    city = runpy.run_path(os.path.join(ROOT, "project", "main.py"), run_name="city")
+    scene = city["render_time"].__globals__
+    clock = sys.modules["clock"]
+    direct = city["render_time"](t, size, size, start=1000.0)
+
+    recorder = GLRecorder()
+    install(recorder, scene, vars(clock))
+    scene["STATIC_LISTS"].clear()
+    clock.invalidate_static()
+    city["myInit"]()
+    recorder.record_frame(city["display"])
+
+    fb = Framebuffer(size, size)
+    recorder.replay(SoftGL(fb).namespace())
+    assert np.array_equal(fb.pixels, direct.pixels), "replayed frame differs"
+    stats = recorder.frame_stats(0)
+    print("Replay of a recorded city frame matches direct rendering "
+          "(%d calls, %d vertices, %d state changes, %d begin/end pairs, %d draws)"
+          % stats[:5])
+
+
+def check_replay_ids():
+    # A target that numbers lists from 101 and buffers from 501, so a list
+    # id mixed up with a buffer id (both are 1 when recorded) shows
+    recorder = GLRecorder()
+    gl = recorder.namespace()
+    gl["glGenLists"](1)
+    gl["glNewList"](1, gl["GL_COMPILE"])
+    gl["glEndList"]()
+    gl["glGenBuffers"](1)
+    gl["glBindBuffer"](gl["GL_ARRAY_BUFFER"], 1)
+    gl["glCallList"](1)
+    gl["glDeleteBuffers"](1, [1])
+    gl["glDeleteLists"](1, 1)
+
+    log = []
+    target = {}
+    for name in ("glNewList", "glEndList", "glBindBuffer", "glCallList",
+                 "glDeleteBuffers", "glDeleteLists"):
+        target[name] = lambda *args, name=name: log.append((name, list(args)))
+    target["glGenLists"] = lambda count: 101
+    target["glGenBuffers"] = lambda count: 501
+    recorder.replay(target)
+    assert log == [
+        ("glNewList", [101, gl["GL_COMPILE"]]),
+        ("glEndList", []),
+        ("glBindBuffer", [gl["GL_ARRAY_BUFFER"], 501]),
+        ("glCallList", [101]),
+        ("glDeleteBuffers", [1, [501]]),
+        ("glDeleteLists", [101, 1]),
+    ], "replayed ids %r" % (log,)
+    print("Replay maps display-list and buffer ids separately")
+
+
+def check_point_buffer(frames=5):
+    # A static scene: one upload, then a bind and a draw per frame
+    devnull = open(os.devnull, "w")
+    saved, sys.stdout = sys.stdout, devnull
+    try:
+        recorder = run_script(os.path.join(ROOT, "practice", "snowman.py"), frames)
+    finally:
+        sys.stdout = saved
+        devnull.close()
+    uploads = sum(1 for _, name, _ in recorder.calls() if name == "glBufferData")
+    assert uploads == 1, "PointBuffer uploaded %d times" % uploads
+    fb = Framebuffer(*recorder.window_size)
+    recorder.replay(SoftGL(fb).namespace())
+    assert fb.pixels[..., :3].any(), "nothing drawn from the buffer"
+    stats = recorder.frame_stats(frames - 1)
+    print("PointBuffer: snowman uploaded once in %d frames, then %d calls for %d points per frame"
+          % (frames, stats.calls, stats.vertices))
+
+
+# The nine circles of Lab3/circle_geometry.py as (radius, x0, y0)
+GEOMETRY = [(150, 250, 250)] + [(75, 250 + dx, 250 + dy) for dx, dy in (
+    (75, 0), (0, 75), (-75, 0), (0, -75),
+    (52.5, 52.5), (-52.5, 52.5), (-52.5, -52.5), (52.5, -52.5))]
+
+
+def bench_point_batch(frames=10, size=500):
+    points = [(float(x), float(y)) for radius, x0, y0 in GEOMETRY
+              for x, y in MidpointCircle(radius, x0, y0).tolist()]
+
+    def per_point(gl):
+        # The old Lab3 draw_points: a point size and a glBegin/glEnd per pixel
+        for x, y in points:
+            gl["glPointSize"](3)
+            gl["glBegin"](gl["GL_POINTS"])
+            gl["glVertex2f"](x, y)
+            gl["glEnd"]()
+
+    # A private copy of raster.submit, so run_script can still mock the real one
+    PointBatch = runpy.run_path(os.path.join(ROOT, "raster", "submit.py"))["PointBatch"]
+    submit = PointBatch.flush.__globals__
+
+    def batched(gl):
+        batch = PointBatch(size=3)
+        for x, y in points:
+            batch.add(x, y)
+        batch.flush()
+
+    def frame_time(draw, ctx):
+        gl = ctx.namespace()
+        install(ctx, submit)
+        start = time.perf_counter()
+        for _ in range(frames):
+            draw(gl)
+        return (time.perf_counter() - start) / frames
+
+    print("Lab3 circle_geometry scene, %d points, %dx%d" % (len(points), size, size))
+    images = []
+    for label, draw in (("glBegin/glEnd per pixel", per_point), ("PointBatch", batched)):
+        recorder = GLRecorder()
+        submitted = frame_time(draw, recorder)
+        fb = Framebuffer(size, size)
+        rendered = frame_time(draw, SoftGL(fb))
+        images.append(fb.pixels.copy())
+        print("  %-24s %6d calls/frame %7.2f ms to submit %7.2f ms to render"
+              % (label, len(recorder.ops) / frames, submitted * 1000, rendered * 1000))
+    assert np.array_equal(*images), "PointBatch frame differs"
+
+
+def bench_scripts(frames=20):
+    print("Lab scripts under the mock OpenGL modules, %d frames each" % frames)
+    for script in ("Lab2/house.py", "Lab2/cube.py", "Lab3/circle_geometry.py",
+                   "practice/snowman.py", "project/clock.py", "project/main.py"):
+        devnull = open(os.devnull, "w")
+        saved, sys.stdout = sys.stdout, devnull   # the labs print their points
+        try:
+            start = time.perf_counter()
+            recorder = run_script(os.path.join(ROOT, script), frames)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = saved
+            devnull.close()
+        calls = len(recorder.ops)
+        stats = [recorder.frame_stats(i) for i in range(len(recorder.frames))]
+        vertices = sum(s.vertices for s in stats) / len(stats)
+        print("  %-26s %7.0f calls/frame %7.0f vertices/frame %6.2f ms/frame "
+              "%5.1f bytes/call"
+              % (script, calls / len(stats), vertices, 1000 * elapsed / len(stats),
+                 recorder.nbytes() / calls))
+
+
+def main():
+    check_replay()
+    check_replay_ids()
+    check_point_buffer()
+    bench_point_batch()
+    bench_scripts()
+
+
+if __name__ == "__main__":
+    main()
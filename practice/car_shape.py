@@ -1,7 +1,16 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.circle import MidpointArc, MidpointCircle
+from raster.framebuffer import Framebuffer, headless_path
+from raster.line import midPoint
+from raster.submit import PointBuffer, pack_points
+
 # Window size constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
@@ -64,269 +73,89 @@ FRONT_WINDOW_Y = 323
 FRONT_WINDOW_RADIUS = 15
 
 
-def display():
-    glClear(GL_COLOR_BUFFER_BIT)
-    glColor3f(1.0, 1.0, 1.0)  # White color
-    glPointSize(2.0)
-    
-    glBegin(GL_POINTS)
+def scene_points():
+    """
+    Pixels of every shape in the scene, in drawing order.
+    """
+    shapes = []
     
     # Draw car body with rounded ends
     # Bottom horizontal line in three segments (avoiding wheels)
     # Left segment: from rear bumper to left wheel
     LEFT_WHEEL_LEFT_EDGE = LEFT_WHEEL_X - WHEEL_OUTER_RADIUS
-    points = midPoint(CAR_BOTTOM_LEFT_X, CAR_BOTTOM_LEFT_Y, LEFT_WHEEL_LEFT_EDGE, CAR_BOTTOM_LEFT_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(midPoint(CAR_BOTTOM_LEFT_X, CAR_BOTTOM_LEFT_Y, LEFT_WHEEL_LEFT_EDGE, CAR_BOTTOM_LEFT_Y))
     
     # Middle segment: between wheels
     LEFT_WHEEL_RIGHT_EDGE = LEFT_WHEEL_X + WHEEL_OUTER_RADIUS
     RIGHT_WHEEL_LEFT_EDGE = RIGHT_WHEEL_X - WHEEL_OUTER_RADIUS
-    points = midPoint(LEFT_WHEEL_RIGHT_EDGE, CAR_BOTTOM_LEFT_Y, RIGHT_WHEEL_LEFT_EDGE, CAR_BOTTOM_LEFT_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(midPoint(LEFT_WHEEL_RIGHT_EDGE, CAR_BOTTOM_LEFT_Y, RIGHT_WHEEL_LEFT_EDGE, CAR_BOTTOM_LEFT_Y))
     
     # Right segment: from right wheel to front bumper
     RIGHT_WHEEL_RIGHT_EDGE = RIGHT_WHEEL_X + WHEEL_OUTER_RADIUS
-    points = midPoint(RIGHT_WHEEL_RIGHT_EDGE, CAR_BOTTOM_LEFT_Y, CAR_BOTTOM_RIGHT_X, CAR_BOTTOM_RIGHT_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(midPoint(RIGHT_WHEEL_RIGHT_EDGE, CAR_BOTTOM_LEFT_Y, CAR_BOTTOM_RIGHT_X, CAR_BOTTOM_RIGHT_Y))
     
     # Top horizontal line
-    points = midPoint(CAR_TOP_LEFT_X, CAR_TOP_LEFT_Y, CAR_TOP_RIGHT_X, CAR_TOP_RIGHT_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(midPoint(CAR_TOP_LEFT_X, CAR_TOP_LEFT_Y, CAR_TOP_RIGHT_X, CAR_TOP_RIGHT_Y))
     
     # Draw front bumper (right semicircle)
-    points = MidpointCircle(FRONT_BUMPER_RADIUS, FRONT_BUMPER_X, FRONT_BUMPER_Y)
-    for point in points:
-        # Only draw right half (x >= center_x)
-        if point[0] >= FRONT_BUMPER_X:
-            glVertex2f(point[0], point[1])
+    # Only draw right half (x >= center_x)
+    shapes.append(MidpointArc(FRONT_BUMPER_RADIUS, FRONT_BUMPER_X, FRONT_BUMPER_Y, half="right"))
     
     # Draw rear bumper (left semicircle)
-    points = MidpointCircle(REAR_BUMPER_RADIUS, REAR_BUMPER_X, REAR_BUMPER_Y)
-    for point in points:
-        # Only draw left half (x <= center_x)
-        if point[0] <= REAR_BUMPER_X:
-            glVertex2f(point[0], point[1])
+    # Only draw left half (x <= center_x)
+    shapes.append(MidpointArc(REAR_BUMPER_RADIUS, REAR_BUMPER_X, REAR_BUMPER_Y, half="left"))
     
     # Draw roof (upper half circle)
-    points = MidpointCircle(ROOF_RADIUS, ROOF_CENTER_X, ROOF_CENTER_Y)
-    for point in points:
-        # Only draw upper half (y >= center_y)
-        if point[1] >= ROOF_CENTER_Y:
-            glVertex2f(point[0], point[1])
+    # Only draw upper half (y >= center_y)
+    shapes.append(MidpointArc(ROOF_RADIUS, ROOF_CENTER_X, ROOF_CENTER_Y, half="upper"))
     
     # Draw second upper roof (upper half circle above first roof)
-    points = MidpointCircle(UPPER_ROOF_RADIUS, UPPER_ROOF_CENTER_X, UPPER_ROOF_CENTER_Y)
-    for point in points:
-        # Only draw upper half (y >= center_y)
-        if point[1] >= UPPER_ROOF_CENTER_Y:
-            glVertex2f(point[0], point[1])
+    # Only draw upper half (y >= center_y)
+    shapes.append(MidpointArc(UPPER_ROOF_RADIUS, UPPER_ROOF_CENTER_X, UPPER_ROOF_CENTER_Y, half="upper"))
     
     # Draw vertical line divider on roof
-    points = midPoint(ROOF_DIVIDER_X, ROOF_DIVIDER_TOP_Y, ROOF_DIVIDER_X, ROOF_DIVIDER_BOTTOM_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(midPoint(ROOF_DIVIDER_X, ROOF_DIVIDER_TOP_Y, ROOF_DIVIDER_X, ROOF_DIVIDER_BOTTOM_Y))
     
     # Draw left wheel outer circle
-    points = MidpointCircle(WHEEL_OUTER_RADIUS, LEFT_WHEEL_X, LEFT_WHEEL_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(MidpointCircle(WHEEL_OUTER_RADIUS, LEFT_WHEEL_X, LEFT_WHEEL_Y, unique=True))
     
     # Draw left wheel inner circle
-    points = MidpointCircle(WHEEL_INNER_RADIUS, LEFT_WHEEL_X, LEFT_WHEEL_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(MidpointCircle(WHEEL_INNER_RADIUS, LEFT_WHEEL_X, LEFT_WHEEL_Y, unique=True))
     
     # Draw right wheel outer circle
-    points = MidpointCircle(WHEEL_OUTER_RADIUS, RIGHT_WHEEL_X, RIGHT_WHEEL_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(MidpointCircle(WHEEL_OUTER_RADIUS, RIGHT_WHEEL_X, RIGHT_WHEEL_Y, unique=True))
     
     # Draw right wheel inner circle
-    points = MidpointCircle(WHEEL_INNER_RADIUS, RIGHT_WHEEL_X, RIGHT_WHEEL_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(MidpointCircle(WHEEL_INNER_RADIUS, RIGHT_WHEEL_X, RIGHT_WHEEL_Y, unique=True))
     
     # Draw rear window circle
-    points = MidpointCircle(REAR_WINDOW_RADIUS, REAR_WINDOW_X, REAR_WINDOW_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
+    shapes.append(MidpointCircle(REAR_WINDOW_RADIUS, REAR_WINDOW_X, REAR_WINDOW_Y, unique=True))
     
     # Draw front window circle
-    points = MidpointCircle(FRONT_WINDOW_RADIUS, FRONT_WINDOW_X, FRONT_WINDOW_Y)
-    for point in points:
-        glVertex2f(point[0], point[1])
-    
-    glEnd()
-    glutSwapBuffers()
+    shapes.append(MidpointCircle(FRONT_WINDOW_RADIUS, FRONT_WINDOW_X, FRONT_WINDOW_Y, unique=True))
 
+    return shapes
 
-# =================== Midpoint Circle Algorithm ===================
-def MidpointCircle(radius, x0, y0):
-    """
-    Midpoint Circle Algorithm
-    Draws a circle using 8-way symmetry
-    """
-    x = 0
-    y = radius
-    d = 1 - radius
-    points = []
-    
-    points.extend(Circlepoints(x, y, x0, y0))
-    
-    while x <= y:
-        if d < 0:
-            d = d + 2 * x + 3
-            x = x + 1
-        else:
-            d = d + (2 * x) - (2 * y) + 5
-            x = x + 1
-            y = y - 1
-        
-        points.extend(Circlepoints(x, y, x0, y0))
-    
-    return points
 
+# The scene's pixels stay on the GPU; they are only re-uploaded if they change
+POINT_BUFFER = PointBuffer()
 
-def Circlepoints(x, y, x0, y0):
-    """
-    Generate 8 symmetric points for circle
-    """
-    return [
-        (x + x0, y + y0),
-        (y + x0, x + y0),
-        (y + x0, -x + y0),
-        (x + x0, -y + y0),
-        (-x + x0, -y + y0),
-        (-y + x0, -x + y0),
-        (-y + x0, x + y0),
-        (-x + x0, y + y0)
-    ]
 
+def display():
+    glClear(GL_COLOR_BUFFER_BIT)
+    glColor3f(1.0, 1.0, 1.0)  # White color
+    glPointSize(2.0)
+    
+    POINT_BUFFER.draw(pack_points(*scene_points()))
+    glutSwapBuffers()
 
-# =================== Midpoint Line Drawing Algorithm ===================
 
-def get_zone(x0, y0, x1, y1):
-    """
-    Determine which of the 8 zones (octants) the line (x0,y0)->(x1,y1) lies in.
-    This lets us convert any line into zone 0 (dx>=dy>=0), run the simple
-    midpoint algorithm there, then transform points back.
+def render(fb):
     """
-    dx = x1 - x0
-    dy = y1 - y0
-
-    if abs(dx) >= abs(dy):          # shallow: |slope| <= 1
-        if dx >= 0 and dy >= 0:
-            return 0
-        elif dx < 0 and dy >= 0:
-            return 3
-        elif dx < 0 and dy < 0:
-            return 4
-        else:  # dx >= 0 and dy < 0
-            return 7
-    else:                           # steep: |slope| > 1
-        if dx >= 0 and dy >= 0:
-            return 1
-        elif dx < 0 and dy >= 0:
-            return 2
-        elif dx < 0 and dy < 0:
-            return 5
-        else:  # dx >= 0 and dy < 0
-            return 6
-
-
-def convert_to_zone_0(x, y, zone):
+    Draw the scene into a raster.framebuffer.Framebuffer (no GL context needed).
     """
-    Convert coordinates from any zone to zone 0 (dx>=dy>=0)
-    using reflections and swaps.
-    """
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return y, -x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return -y, x
-    elif zone == 7:
-        return x, -y
-
-
-def convert_from_zone_0(x, y, zone):
-    """
-    Inverse of convert_to_zone_0:
-    map a zone-0 point back to the original zone.
-    """
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return -y, x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return y, -x
-    elif zone == 7:
-        return x, -y
-
-
-def midPoint(X1, Y1, X2, Y2):
-    """
-    Midpoint Line Drawing Algorithm (integer-only version)
-    using zone conversion for all 8 octants.
-
-    Returns a list of (x, y) points that approximate the line segment
-    from (X1, Y1) to (X2, Y2).
-    """
-    zone = get_zone(X1, Y1, X2, Y2)
-
-    # Convert endpoints into zone 0
-    nx1, ny1 = convert_to_zone_0(X1, Y1, zone)
-    nx2, ny2 = convert_to_zone_0(X2, Y2, zone)
-
-    dx = nx2 - nx1
-    dy = ny2 - ny1
-
-    # Decision variable and its increments (classic midpoint form)
-    d  = 2 * dy - dx
-    E  = 2 * dy
-    NE = 2 * (dy - dx)
-
-    x, y = nx1, ny1
-    points_zone0 = [(x, y)]
-
-    # Basic loop in zone 0: x always increases
-    while x < nx2:
-        if d < 0:
-            d += E
-            x += 1
-        else:
-            d += NE
-            x += 1
-            y += 1
-        points_zone0.append((x, y))
-
-    # Transform all computed points back to original zone
-    final_points = []
-    for px, py in points_zone0:
-        fx, fy = convert_from_zone_0(px, py, zone)
-        final_points.append((fx, fy))
-
-    return final_points
+    for points in scene_points():
+        fb.plot(points, (255, 255, 255), size=2)
 
 
 # =================== OpenGL Setup ===================
@@ -354,7 +183,15 @@ def main():
     """
     Program entry point.
     Initialize GLUT and window, then enter main loop.
+    With "--headless out.png" the scene is saved to an image instead.
     """
+    path = headless_path(sys.argv)
+    if path:
+        fb = Framebuffer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        render(fb)
+        fb.save(path)
+        return
+
     init_glut_window()
     glutMainLoop()
 
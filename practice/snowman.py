@@ -1,7 +1,16 @@
+import os
+import sys
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.circle import MidpointArc, MidpointCircle
+from raster.framebuffer import Framebuffer, headless_path
+from raster.line import midPoint
+from raster.submit import PointBuffer, pack_points
+
 # Window size constants
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
@@ -50,66 +59,42 @@ TOP_BUTTON_CX,  TOP_BUTTON_CY    = MIDDLE_CX, MIDDLE_CY + BUTTON_OFFSET_Y
 BOTTOM_BUTTON_CX, BOTTOM_BUTTON_CY = MIDDLE_CX, MIDDLE_CY - BUTTON_OFFSET_Y
 
 
-def display():
+def scene_points():
     """
-    Draw a vertical snowman:
+    Pixels of a vertical snowman, one array per shape:
 
       - 3 circles:
           * head (full circle)
-          * middle: only lower part (above tangent with head is hidden)
-          * bottom: only lower part (above tangent with middle is hidden)
+          * middle (full circle; its tangent with the head is its top point)
+          * bottom (full circle; its tangent with the middle is its top point)
       - eyes on the head
       - curved mouth (lower semicircle) on the head
       - diagonal nose line
       - two buttons on the middle circle
     """
-    glClear(GL_COLOR_BUFFER_BIT)
-    glColor3f(1.0, 1.0, 1.0)  # white
-    glPointSize(2.0)
-
-    glBegin(GL_POINTS)
-
-    # --------- helper clip Y levels (tangent points) ----------
-    # tangent between head & middle: at top of middle circle
-    MID_CLIP_Y    = MIDDLE_CY + MIDDLE_R
-    # tangent between middle & bottom: at top of bottom circle
-    BOTTOM_CLIP_Y = BOTTOM_CY + BOTTOM_R
+    shapes = []
 
     # ---------------- bottom circle (3rd big) -----------------
-    # draw only the part below its tangent with the middle circle
-    bottom_points = MidpointCircle(BOTTOM_R, BOTTOM_CX, BOTTOM_CY)
-    for x, y in bottom_points:
-        if y <= BOTTOM_CLIP_Y:
-            glVertex2f(x, y)
+    # the tangent with the middle circle is the very top of this circle,
+    # so "the part below the tangent" is the whole circle
+    shapes.append(MidpointCircle(BOTTOM_R, BOTTOM_CX, BOTTOM_CY, unique=True))
 
     # ---------------- middle circle (2nd big) -----------------
-    # draw only the part below its tangent with the head circle
-    middle_points = MidpointCircle(MIDDLE_R, MIDDLE_CX, MIDDLE_CY)
-    for x, y in middle_points:
-        if y <= MID_CLIP_Y:
-            glVertex2f(x, y)
+    # likewise, its tangent with the head is its top point
+    shapes.append(MidpointCircle(MIDDLE_R, MIDDLE_CX, MIDDLE_CY, unique=True))
 
     # ---------------- head circle (full) ----------------------
-    head_points = MidpointCircle(HEAD_R, HEAD_CX, HEAD_CY)
-    for x, y in head_points:
-        glVertex2f(x, y)
+    shapes.append(MidpointCircle(HEAD_R, HEAD_CX, HEAD_CY, unique=True))
 
     # ---------------- eyes (small circles) --------------------
-    left_eye_pts = MidpointCircle(EYE_R, LEFT_EYE_CX, EYE_CY)
-    for x, y in left_eye_pts:
-        glVertex2f(x, y)
+    shapes.append(MidpointCircle(EYE_R, LEFT_EYE_CX, EYE_CY, unique=True))
 
-    right_eye_pts = MidpointCircle(EYE_R, RIGHT_EYE_CX, EYE_CY)
-    for x, y in right_eye_pts:
-        glVertex2f(x, y)
+    shapes.append(MidpointCircle(EYE_R, RIGHT_EYE_CX, EYE_CY, unique=True))
 
     # ---------------- curved mouth (smile) --------------------
     # model mouth as lower semicircle centered on (HEAD_CX, MOUTH_Y)
     mouth_r = MOUTH_HALF_WIDTH
-    mouth_pts = MidpointCircle(mouth_r, HEAD_CX, MOUTH_Y)
-    for x, y in mouth_pts:
-        if y <= MOUTH_Y:   # keep only lower half
-            glVertex2f(x, y)
+    shapes.append(MidpointArc(mouth_r, HEAD_CX, MOUTH_Y, half="lower"))
 
     # ---------------- nose (diagonal line) --------------------
     NOSE_START_X = HEAD_CX
@@ -117,187 +102,35 @@ def display():
     NOSE_END_X   = HEAD_CX + 25
     NOSE_END_Y   = HEAD_CY - 10
 
-    nose_points = midPoint(NOSE_START_X, NOSE_START_Y, NOSE_END_X, NOSE_END_Y)
-    for x, y in nose_points:
-        glVertex2f(x, y)
+    shapes.append(midPoint(NOSE_START_X, NOSE_START_Y, NOSE_END_X, NOSE_END_Y))
 
     # ---------------- buttons on middle circle ----------------
-    top_btn_pts = MidpointCircle(BUTTON_R, TOP_BUTTON_CX, TOP_BUTTON_CY)
-    for x, y in top_btn_pts:
-        glVertex2f(x, y)
+    shapes.append(MidpointCircle(BUTTON_R, TOP_BUTTON_CX, TOP_BUTTON_CY, unique=True))
 
-    bottom_btn_pts = MidpointCircle(BUTTON_R, BOTTOM_BUTTON_CX, BOTTOM_BUTTON_CY)
-    for x, y in bottom_btn_pts:
-        glVertex2f(x, y)
+    shapes.append(MidpointCircle(BUTTON_R, BOTTOM_BUTTON_CX, BOTTOM_BUTTON_CY, unique=True))
 
-    glEnd()
-    glutSwapBuffers()
+    return shapes
 
 
+# The scene's pixels stay on the GPU; they are only re-uploaded if they change
+POINT_BUFFER = PointBuffer()
 
-# =================== Midpoint Circle Algorithm ===================
-def MidpointCircle(radius, x0, y0):
-    """
-    Midpoint Circle Algorithm
-    Draws a circle using 8-way symmetry
-    """
-    x = 0
-    y = radius
-    d = 1 - radius
-    points = []
-    
-    points.extend(Circlepoints(x, y, x0, y0))
-    
-    while x <= y:
-        if d < 0:
-            d = d + 2 * x + 3
-            x = x + 1
-        else:
-            d = d + (2 * x) - (2 * y) + 5
-            x = x + 1
-            y = y - 1
-        
-        points.extend(Circlepoints(x, y, x0, y0))
-    
-    return points
-
-
-def Circlepoints(x, y, x0, y0):
-    """
-    Generate 8 symmetric points for circle
-    """
-    return [
-        (x + x0, y + y0),
-        (y + x0, x + y0),
-        (y + x0, -x + y0),
-        (x + x0, -y + y0),
-        (-x + x0, -y + y0),
-        (-y + x0, -x + y0),
-        (-y + x0, x + y0),
-        (-x + x0, y + y0)
-    ]
 
+def display():
+    glClear(GL_COLOR_BUFFER_BIT)
+    glColor3f(1.0, 1.0, 1.0)  # white
+    glPointSize(2.0)
+
+    POINT_BUFFER.draw(pack_points(*scene_points()))
+    glutSwapBuffers()
 
-# =================== Midpoint Line Drawing Algorithm ===================
 
-def get_zone(x0, y0, x1, y1):
-    """
-    Determine which of the 8 zones (octants) the line (x0,y0)->(x1,y1) lies in.
-    This lets us convert any line into zone 0 (dx>=dy>=0), run the simple
-    midpoint algorithm there, then transform points back.
-    """
-    dx = x1 - x0
-    dy = y1 - y0
-
-    if abs(dx) >= abs(dy):          # shallow: |slope| <= 1
-        if dx >= 0 and dy >= 0:
-            return 0
-        elif dx < 0 and dy >= 0:
-            return 3
-        elif dx < 0 and dy < 0:
-            return 4
-        else:  # dx >= 0 and dy < 0
-            return 7
-    else:                           # steep: |slope| > 1
-        if dx >= 0 and dy >= 0:
-            return 1
-        elif dx < 0 and dy >= 0:
-            return 2
-        elif dx < 0 and dy < 0:
-            return 5
-        else:  # dx >= 0 and dy < 0
-            return 6
-
-
-def convert_to_zone_0(x, y, zone):
-    """
-    Convert coordinates from any zone to zone 0 (dx>=dy>=0)
-    using reflections and swaps.
+def render(fb):
     """
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return y, -x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return -y, x
-    elif zone == 7:
-        return x, -y
-
-
-def convert_from_zone_0(x, y, zone):
-    """
-    Inverse of convert_to_zone_0:
-    map a zone-0 point back to the original zone.
-    """
-    if zone == 0:
-        return x, y
-    elif zone == 1:
-        return y, x
-    elif zone == 2:
-        return -y, x
-    elif zone == 3:
-        return -x, y
-    elif zone == 4:
-        return -x, -y
-    elif zone == 5:
-        return -y, -x
-    elif zone == 6:
-        return y, -x
-    elif zone == 7:
-        return x, -y
-
-
-def midPoint(X1, Y1, X2, Y2):
-    """
-    Midpoint Line Drawing Algorithm (integer-only version)
-    using zone conversion for all 8 octants.
-
-    Returns a list of (x, y) points that approximate the line segment
-    from (X1, Y1) to (X2, Y2).
+    Draw the scene into a raster.framebuffer.Framebuffer (no GL context needed).
     """
-    zone = get_zone(X1, Y1, X2, Y2)
-
-    # Convert endpoints into zone 0
-    nx1, ny1 = convert_to_zone_0(X1, Y1, zone)
-    nx2, ny2 = convert_to_zone_0(X2, Y2, zone)
-
-    dx = nx2 - nx1
-    dy = ny2 - ny1
-
-    # Decision variable and its increments (classic midpoint form)
-    d  = 2 * dy - dx
-    E  = 2 * dy
-    NE = 2 * (dy - dx)
-
-    x, y = nx1, ny1
-    points_zone0 = [(x, y)]
-
-    # Basic loop in zone 0: x always increases
-    while x < nx2:
-        if d < 0:
-            d += E
-            x += 1
-        else:
-            d += NE
-            x += 1
-            y += 1
-        points_zone0.append((x, y))
-
-    # Transform all computed points back to original zone
-    final_points = []
-    for px, py in points_zone0:
-        fx, fy = convert_from_zone_0(px, py, zone)
-        final_points.append((fx, fy))
-
-    return final_points
+    for points in scene_points():
+        fb.plot(points, (255, 255, 255), size=2)
 
 
 # =================== OpenGL Setup ===================
@@ -325,7 +158,15 @@ def main():
     """
     Program entry point.
     Initialize GLUT and window, then enter main loop.
+    With "--headless out.png" the scene is saved to an image instead.
     """
+    path = headless_path(sys.argv)
+    if path:
+        fb = Framebuffer(WINDOW_WIDTH, WINDOW_HEIGHT)
+        render(fb)
+        fb.save(path)
+        return
+
     init_glut_window()
     glutMainLoop()
 
@@ -1,12 +1,18 @@
+import os
 import sys
 import math
 import time
 from datetime import datetime
 
+import numpy as np
+
 from OpenGL.GL import *
 from OpenGL.GLU import *
 from OpenGL.GLUT import *
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.circle import LOD_STATS, OCTANT_CACHE, circle_fan, lod_segments, unit_circle
+
 
 # ---------- Globals ----------
 
@@ -14,6 +20,15 @@ from OpenGL.GLUT import *
 window_width = 800
 window_height = 600
 
+# Display lists of the static clock parts and their LOD_STATS counts,
+# keyed by the part and its circle segment counts. See draw_static().
+static_lists = {}
+
+# Screen pixels per clock-local unit, for picking circle tessellation.
+# reshape() keeps it in sync with the window; draw_grandfather_clock()
+# sets it from the host scene's scale while it draws.
+pixel_scale = min(window_width, window_height) / 2.0
+
 # Reference time used for calculating elapsed time for animation
 start_time = time.time()
 
@@ -21,6 +36,32 @@ start_time = time.time()
 PENDULUM_MAX_ANGLE_DEG = 30.0   # Maximum angle from center (±30° swing arc)
 PENDULUM_PERIOD = 2.0           # Period of full oscillation: left->right->left (in seconds)
 
+# Clock geometry in local units (the case spans y = -0.9..0.9), shared by
+# the single-clock draw functions and the instanced batch renderer
+CASE_PARTS = (                  # (x1, y1, x2, y2), color; back to front
+    ((-0.4, -0.9, 0.4, 0.9), (0.4, 0.2, 0.05)),       # main body, dark brown wood
+    ((-0.32, -0.82, 0.32, 0.82), (0.6, 0.3, 0.1)),    # inner lighter panel
+    ((-0.5, -0.9, 0.5, -0.8), (0.3, 0.15, 0.05)),     # base
+)
+FACE_CENTER = (0.0, 0.45)
+FACE_RADIUS = 0.22
+FACE_COLOR = (0.95, 0.95, 0.92)
+RIM_COLOR = (0.2, 0.2, 0.2)
+TICK_COLOR = (0.1, 0.1, 0.1)
+HANDS = (                       # length, line width, color
+    (0.11, 5, (0.1, 0.1, 0.1)),     # hour
+    (0.18, 3, (0.1, 0.1, 0.1)),     # minute
+    (0.19, 1, (0.8, 0.0, 0.0)),     # second
+)
+PIVOT = (0.0, 0.15)             # pendulum pivot, just below the face
+ROD_LENGTH = 0.55
+ROD_HALF_WIDTH = 0.01
+ROD_COLOR = (0.3, 0.2, 0.05)
+BOB_RADIUS = 0.045
+BOB_COLOR = (0.85, 0.7, 0.2)
+CAP_RADIUS = 0.01
+CAP_COLOR = (0.1, 0.1, 0.1)
+
 
 # ---------- Drawing helpers ----------
 
@@ -44,27 +85,52 @@ def draw_rectangle(x1, y1, x2, y2):
     glEnd()
 
 
-def draw_circle(cx, cy, r, segments=64):
+def draw_vertices(mode, vertices, colors=None):
+    """
+    Submit a whole primitive as one client vertex array.
+
+    Parameters:
+    - mode: GL primitive, e.g. GL_TRIANGLE_FAN or GL_LINES
+    - vertices: (n, 2) float64 array of vertex positions
+    - colors: Optional (n, 3) uint8 array of per-vertex colors; without it
+      the current glColor is used
+
+    Rendering: glVertexPointer/glColorPointer + a single glDrawArrays call
+    instead of one glVertex2f call per vertex.
+    """
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(2, GL_DOUBLE, 0, vertices)
+    if colors is not None:
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(3, GL_UNSIGNED_BYTE, 0, colors)
+    glDrawArrays(mode, 0, len(vertices))
+    if colors is not None:
+        glDisableClientState(GL_COLOR_ARRAY)
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
+def draw_circle(cx, cy, r, segments=None, fixed=64):
     """
     Draw a filled circle using triangle fan primitives.
 
     Parameters:
     - cx, cy: Circle center coordinates (in normalized device coordinates)
     - r: Circle radius (in normalized device coordinates)
-    - segments: Number of segments used to approximate the circle (higher = smoother)
+    - segments: Number of segments used to approximate the circle (higher = smoother);
+      by default it is picked from the on-screen radius (r * pixel_scale)
+    - fixed: Segment count the circle used to be drawn with, so LOD_STATS
+      can report the vertices saved
 
     Transformation: NONE - Uses raw vertices in current coordinate system
     Rendering: GL_TRIANGLE_FAN radiates triangles from center to approximate circular shape
     Uses current glColor setting to fill the circle.
+    The unit-circle table for each segment count is computed once and shared
+    (raster.circle.unit_circle), so drawing only scales and offsets it.
     """
-    glBegin(GL_TRIANGLE_FAN)
-    glVertex2f(cx, cy)
-    for i in range(segments + 1):
-        angle = 2.0 * math.pi * i / segments
-        x = cx + r * math.cos(angle)
-        y = cy + r * math.sin(angle)
-        glVertex2f(x, y)
-    glEnd()
+    if segments is None:
+        segments = lod_segments(r * pixel_scale)
+    LOD_STATS.record(segments + 2, fixed + 2)
+    draw_vertices(GL_TRIANGLE_FAN, circle_fan(cx, cy, r, segments=segments))
 
 
 def draw_line(x1, y1, x2, y2, width=1.0):
@@ -103,18 +169,10 @@ def draw_case():
     Transformations: NONE - All coordinates are in local clock coordinate system.
     Rendering order: Back to front (main body first, then details).
     """
-    glColor3f(0.4, 0.2, 0.05)  # dark brown wood
-
-    # Main body
-    draw_rectangle(-0.4, -0.9, 0.4, 0.9)
-
-    # Inner lighter panel
-    glColor3f(0.6, 0.3, 0.1)
-    draw_rectangle(-0.32, -0.82, 0.32, 0.82)
-
-    # Base
-    glColor3f(0.3, 0.15, 0.05)
-    draw_rectangle(-0.5, -0.9, 0.5, -0.8)
+    # Main body, inner lighter panel, base (CASE_PARTS)
+    for rect, color in CASE_PARTS:
+        glColor3f(*color)
+        draw_rectangle(*rect)
 
 
 def draw_clock_face():
@@ -128,46 +186,72 @@ def draw_clock_face():
 
     Transformations: NONE - All coordinates centered at (0.0, 0.45) in local space.
     Geometry: Circle positioned near top of clock case (cy=0.45), radius=0.22
-    Tick marks: Positioned using trigonometric angles (360°/12 hours = 30° apart)
+    Tick marks: Positioned using trigonometric angles (360°/12 hours = 30° apart),
+    taken from the shared 12-segment unit-circle table and sent as one GL_LINES batch
     """
-    cx, cy = 0.0, 0.45
-    radius = 0.22
+    cx, cy = FACE_CENTER
+    radius = FACE_RADIUS
 
     # Face background
-    glColor3f(0.95, 0.95, 0.92)
-    draw_circle(cx, cy, radius, segments=80)
+    glColor3f(*FACE_COLOR)
+    draw_circle(cx, cy, radius, fixed=80)
 
     # Outer rim
-    glColor3f(0.2, 0.2, 0.2)
+    glColor3f(*RIM_COLOR)
     glLineWidth(2)
-    glBegin(GL_LINE_LOOP)
-    segments = 80
-    for i in range(segments):
-        angle = 2.0 * math.pi * i / segments
-        x = cx + radius * math.cos(angle)
-        y = cy + radius * math.sin(angle)
-        glVertex2f(x, y)
-    glEnd()
+    segments = lod_segments(radius * pixel_scale)
+    LOD_STATS.record(segments, 80)
+    rim = OCTANT_CACHE.get(unit_circle, segments)[:-1] * radius + (cx, cy)
+    draw_vertices(GL_LINE_LOOP, rim)
     glLineWidth(1)
 
-    # Hour tick marks (12 major)
-    glColor3f(0.1, 0.1, 0.1)
-    for i in range(12):
-        theta = 2.0 * math.pi * i / 12.0
-        # Outer and inner radii for ticks
-        r_outer = radius * 0.95
-        r_inner = radius * 0.80
-        x1 = cx + r_inner * math.cos(theta)
-        y1 = cy + r_inner * math.sin(theta)
-        x2 = cx + r_outer * math.cos(theta)
-        y2 = cy + r_outer * math.sin(theta)
-        draw_line(x1, y1, x2, y2, width=2)
+    # Hour tick marks (12 major): inner and outer end of each tick, in
+    # pairs for GL_LINES
+    glColor3f(*TICK_COLOR)
+    ticks = tick_vertices()
+    glLineWidth(2)
+    draw_vertices(GL_LINES, ticks)
+    glLineWidth(1.0)
+
+
+def tick_vertices():
+    """
+    Inner and outer end of each of the 12 hour ticks, as a (24, 2) array
+    of GL_LINES pairs around FACE_CENTER.
+    """
+    hours = OCTANT_CACHE.get(unit_circle, 12)[:-1]
+    ticks = np.empty((24, 2))
+    ticks[0::2] = hours * (FACE_RADIUS * 0.80) + FACE_CENTER
+    ticks[1::2] = hours * (FACE_RADIUS * 0.95) + FACE_CENTER
+    return ticks
 
 
-def draw_clock_hands():
+def draw_clock_body():
+    """
+    Draw the parts of the clock that never move: case, face, rim and ticks.
+    """
+    draw_case()
+    draw_clock_face()
+
+
+def draw_caps():
+    """
+    Draw the small dark caps over the hand pivot (0.0, 0.45) and the
+    pendulum pivot (0.0, 0.15). They go on top of the moving parts.
+    """
+    glColor3f(*CAP_COLOR)
+    draw_circle(*FACE_CENTER, CAP_RADIUS, fixed=24)
+    draw_circle(*PIVOT, CAP_RADIUS, fixed=24)
+
+
+def draw_clock_hands(now=None):
     """
     Draw hour, minute, and second hands based on current system time.
 
+    Parameters:
+    - now: Optional time.time()-style timestamp to show instead of the
+      current time (used for headless frame rendering)
+
     Angle calculation:
     - Second hand: 360°/60 seconds = 6° per second
     - Minute hand: 360°/60 minutes = 6° per minute  
@@ -181,10 +265,10 @@ def draw_clock_hands():
     4. draw_line(...) - Draw line from center outward (pivot point is now at origin)
     5. glPopMatrix() - Restore previous transformation state
 
-    Center cap: Small circle at rotation pivot (0.0, 0.45) covers rotation center.
+    The center cap over the rotation pivot is drawn by draw_caps().
     """
-    # Use real system time
-    now = datetime.now()
+    # Use real system time unless a fixed one was given
+    now = datetime.now() if now is None else datetime.fromtimestamp(now)
     sec = now.second + now.microsecond / 1e6
     minute = now.minute + sec / 60.0
     hour = (now.hour % 12) + minute / 60.0
@@ -195,41 +279,25 @@ def draw_clock_hands():
     minute_angle = -6.0 * minute       # 360°/60min
     hour_angle = -30.0 * hour          # 360°/12h = 30° per hour
 
-    cx, cy = 0.0, 0.45
-
-    # Hour hand
-    glPushMatrix()
-    glTranslatef(cx, cy, 0.0)
-    glRotatef(hour_angle, 0.0, 0.0, 1.0)
-    glColor3f(0.1, 0.1, 0.1)
-    draw_line(0.0, 0.0, 0.0, 0.11, width=5)
-    glPopMatrix()
-
-    # Minute hand
-    glPushMatrix()
-    glTranslatef(cx, cy, 0.0)
-    glRotatef(minute_angle, 0.0, 0.0, 1.0)
-    glColor3f(0.1, 0.1, 0.1)
-    draw_line(0.0, 0.0, 0.0, 0.18, width=3)
-    glPopMatrix()
-
-    # Second hand
-    glPushMatrix()
-    glTranslatef(cx, cy, 0.0)
-    glRotatef(second_angle, 0.0, 0.0, 1.0)
-    glColor3f(0.8, 0.0, 0.0)
-    draw_line(0.0, 0.0, 0.0, 0.19, width=1)
-    glPopMatrix()
+    cx, cy = FACE_CENTER
 
-    # Center cap
-    glColor3f(0.1, 0.1, 0.1)
-    draw_circle(cx, cy, 0.01, segments=24)
+    # Hour, minute and second hand (HANDS)
+    for angle, (length, width, color) in zip((hour_angle, minute_angle, second_angle), HANDS):
+        glPushMatrix()
+        glTranslatef(cx, cy, 0.0)
+        glRotatef(angle, 0.0, 0.0, 1.0)
+        glColor3f(*color)
+        draw_line(0.0, 0.0, 0.0, length, width=width)
+        glPopMatrix()
 
 
-def draw_pendulum():
+def draw_pendulum(now=None):
     """
     Draw a swinging pendulum driven by a sine-based harmonic motion model.
 
+    Parameters:
+    - now: Optional time.time()-style timestamp to use instead of the clock
+
     Motion model (Simple Harmonic Motion - SHM):
     - angle(t) = θ_max × sin(ω × t)
     - θ_max = 30° (maximum swing angle from vertical)
@@ -239,7 +307,7 @@ def draw_pendulum():
     Components rendered:
     - Rod: Thin brown rectangle (-rod_half_width to rod_half_width width, full rod_length)
     - Bob: Gold-colored circle at bottom of rod (pendulum weight)
-    - Pivot: Small dark circle at rotation point
+    - Pivot: Small dark circle at rotation point, drawn by draw_caps()
 
     Transformations applied:
     1. glPushMatrix() - Save transformation state
@@ -250,20 +318,19 @@ def draw_pendulum():
     
     Pivot point is fixed at (0.0, 0.15), just below the clock face center.
     """
-    elapsed = time.time() - start_time
+    elapsed = (time.time() if now is None else now) - start_time
 
     omega = 2.0 * math.pi / PENDULUM_PERIOD
     # sin(...) is in [-1, 1], so multiply by max angle (in degrees)
     angle_deg = PENDULUM_MAX_ANGLE_DEG * math.sin(omega * elapsed)
 
     # Pivot point, just below the clock face
-    pivot_x = 0.0
-    pivot_y = 0.15
+    pivot_x, pivot_y = PIVOT
 
-    rod_length = 0.55
-    rod_half_width = 0.01
+    rod_length = ROD_LENGTH
+    rod_half_width = ROD_HALF_WIDTH
 
-    bob_radius = 0.045
+    bob_radius = BOB_RADIUS
 
     glPushMatrix()
     # Move to pivot
@@ -272,22 +339,64 @@ def draw_pendulum():
     glRotatef(angle_deg, 0.0, 0.0, 1.0)
 
     # Draw rod (in local coordinates, pivot at origin)
-    glColor3f(0.3, 0.2, 0.05)
+    glColor3f(*ROD_COLOR)
     draw_rectangle(-rod_half_width, -rod_length, rod_half_width, 0.0)
 
     # Draw bob (circle) at bottom of rod
-    glColor3f(0.85, 0.7, 0.2)
-    draw_circle(0.0, -rod_length - bob_radius * 0.1, bob_radius, segments=40)
+    glColor3f(*BOB_COLOR)
+    draw_circle(0.0, -rod_length - bob_radius * 0.1, bob_radius, fixed=40)
 
     glPopMatrix()
-
-    # Optional: draw small pivot point
-    glColor3f(0.1, 0.1, 0.1)
-    draw_circle(pivot_x, pivot_y, 0.01, segments=24)
     
 
+# ---------- Static part cache ----------
+
+def draw_static(draw):
+    """
+    Draw a static clock part from a cached display list.
+
+    Parameters:
+    - draw: Function issuing the part's GL calls (draw_clock_body or draw_caps)
+
+    The list is compiled on first use and keyed by the part and the segment
+    counts lod_segments() picks for the face and the caps at the current
+    pixel_scale, the only thing that changes its contents. Position and
+    scale come from the modelview matrix around the call, so moving or
+    resizing the clock reuses the list as long as its circles tessellate
+    the same. lod_segments() is bounded, and so is the number of lists a
+    zooming host scene can build up.
+
+    The LOD_STATS counts of the part are kept with the list and recorded
+    every time it is called, not while it is compiled.
+    """
+    key = (draw.__name__, lod_segments(FACE_RADIUS * pixel_scale),
+           lod_segments(CAP_RADIUS * pixel_scale))
+    cached = static_lists.get(key)
+    if cached is None:
+        list_id = glGenLists(1)
+        totals = LOD_STATS.reset()
+        glNewList(list_id, GL_COMPILE)
+        draw()
+        glEndList()
+        cached = static_lists[key] = (list_id, LOD_STATS.reset())
+        LOD_STATS.record(*totals)
+    list_id, counts = cached
+    glCallList(list_id)
+    LOD_STATS.record(*counts)
+
+
+def invalidate_static():
+    """
+    Delete the cached display lists, e.g. after a resize or when drawing
+    into a new GL context. They are rebuilt on the next draw.
+    """
+    for list_id, _ in static_lists.values():
+        glDeleteLists(list_id, 1)
+    static_lists.clear()
+
+
 # ---------- Public draw function for importing into other scenes ----------
-def draw_grandfather_clock(world_x, world_y, scale):
+def draw_grandfather_clock(world_x, world_y, scale, now=None, pixels_per_unit=1.0):
     """
     Draw the grandfather clock inside an existing OpenGL scene.
     This is a public interface function for reusing the clock in larger scenes.
@@ -295,17 +404,25 @@ def draw_grandfather_clock(world_x, world_y, scale):
     Parameters:
     - world_x, world_y: Bottom-center position in the caller's coordinate system
     - scale: Uniform scale multiplier applied equally to X and Y axes
+    - now: Optional time.time()-style timestamp for the hands and pendulum
+      (defaults to the current time)
+    - pixels_per_unit: Screen pixels per unit of the caller's coordinate
+      system, used to tessellate the circles for their on-screen size
 
     Transformation sequence (applied in order - matrix composition):
     1. glPushMatrix() - Save current transformation state
     2. glTranslatef(world_x, world_y, 0.0) - TRANSLATION: Move to world position
     3. glScalef(scale, scale, 1.0) - UNIFORM SCALING: Scale in X and Y (Z=1.0 for 2D)
     4. glTranslatef(0.0, 0.9, 0.0) - TRANSLATION: Align clock bottom at y=0 (shift model up by 0.9)
-    5. draw_case/face/hands/pendulum() - Render all clock components
+    5. Static body (cached), hands, pendulum, caps (cached) - Render all clock components
     6. glPopMatrix() - Restore previous transformation state
 
     Purpose: Allows reusable clock module that can be positioned and sized anywhere in a scene.
     """
+    global pixel_scale
+    window_scale = pixel_scale
+    pixel_scale = scale * pixels_per_unit
+
     glPushMatrix()
     glTranslatef(world_x, world_y, 0.0)
     glScalef(scale, scale, 1.0)
@@ -313,12 +430,187 @@ def draw_grandfather_clock(world_x, world_y, scale):
     # shift local model so its bottom (y=-0.9) sits on y=0
     glTranslatef(0.0, 0.9, 0.0)
 
-    draw_case()
-    draw_clock_face()
-    draw_clock_hands()
-    draw_pendulum()
+    draw_static(draw_clock_body)
+    draw_clock_hands(now)
+    draw_pendulum(now)
+    draw_static(draw_caps)
 
     glPopMatrix()
+    pixel_scale = window_scale
+
+
+# ---------- Instanced clocks ----------
+
+# Local vertex arrays of the batch renderer, keyed by segment counts
+instance_geometry = {}
+
+
+def fan_triangles(cx, cy, r, segments):
+    """
+    A circle as separate triangles (center, rim[k], rim[k + 1]), so many
+    circles can share one GL_TRIANGLES draw call.
+    """
+    fan = circle_fan(cx, cy, r, segments=segments)
+    tris = np.empty((segments, 3, 2))
+    tris[:, 0] = fan[0]
+    tris[:, 1] = fan[1:-1]
+    tris[:, 2] = fan[2:]
+    return tris.reshape(-1, 2)
+
+
+def rect_triangles(x1, y1, x2, y2):
+    """
+    An axis-aligned rectangle as two triangles split along a diagonal.
+    """
+    return np.array([(x1, y1), (x2, y1), (x2, y2), (x1, y1), (x2, y2), (x1, y2)], dtype=np.float64)
+
+
+def clock_geometry(face_segments, bob_segments, cap_segments):
+    """
+    Local-space geometry shared by every instance of draw_grandfather_clocks().
+
+    Parameters:
+    - face_segments, bob_segments, cap_segments: Circle tessellations
+
+    Returns a dict of vertex arrays in clock-local units, cached per
+    segment counts:
+    - body, body_colors: Case and face as GL_TRIANGLES with uint8 colors
+    - rim, ticks: Face outline and hour ticks as GL_LINES pairs
+    - rod, bob: Pendulum triangles relative to the pivot, hanging straight down
+    - caps: Both pivot caps as GL_TRIANGLES
+    """
+    key = (face_segments, bob_segments, cap_segments)
+    geometry = instance_geometry.get(key)
+    if geometry is not None:
+        return geometry
+
+    parts = [(rect_triangles(*rect), color) for rect, color in CASE_PARTS]
+    parts.append((fan_triangles(*FACE_CENTER, FACE_RADIUS, face_segments), FACE_COLOR))
+    body = np.concatenate([vertices for vertices, _ in parts])
+    body_colors = np.concatenate([
+        np.tile(np.rint(np.array(color) * 255.0).astype(np.uint8), (len(vertices), 1))
+        for vertices, color in parts
+    ])
+
+    ring = OCTANT_CACHE.get(unit_circle, face_segments)[:-1] * FACE_RADIUS + FACE_CENTER
+    rim = np.stack([ring, np.roll(ring, -1, axis=0)], axis=1).reshape(-1, 2)
+
+    geometry = {
+        "body": body,
+        "body_colors": body_colors,
+        "rim": rim,
+        "ticks": tick_vertices(),
+        "rod": rect_triangles(-ROD_HALF_WIDTH, -ROD_LENGTH, ROD_HALF_WIDTH, 0.0),
+        "bob": fan_triangles(0.0, -ROD_LENGTH - BOB_RADIUS * 0.1, BOB_RADIUS, bob_segments),
+        "caps": np.concatenate([
+            fan_triangles(*FACE_CENTER, CAP_RADIUS, cap_segments),
+            fan_triangles(*PIVOT, CAP_RADIUS, cap_segments),
+        ]),
+    }
+    instance_geometry[key] = geometry
+    return geometry
+
+
+def clock_angles(now, offsets):
+    """
+    Hand and pendulum angles of many clocks at once.
+
+    Parameters:
+    - now: time.time()-style timestamp
+    - offsets: (N,) array of seconds added to now for each clock
+
+    Returns (hour, minute, second, pendulum) arrays of angles in degrees,
+    matching draw_clock_hands() and draw_pendulum() for time now + offset.
+    The local time of day is looked up once; the offsets are added to it.
+    """
+    base = datetime.fromtimestamp(now)
+    day = (base.hour * 3600 + base.minute * 60 + base.second
+           + base.microsecond / 1e6 + offsets)
+    second = -6.0 * (day % 60.0)
+    minute = -6.0 * ((day / 60.0) % 60.0)
+    hour = -30.0 * ((day / 3600.0) % 12.0)
+
+    omega = 2.0 * math.pi / PENDULUM_PERIOD
+    pendulum = PENDULUM_MAX_ANGLE_DEG * np.sin(omega * (now + offsets - start_time))
+    return hour, minute, second, pendulum
+
+
+def draw_grandfather_clocks(positions, scales, time_offsets=None, now=None, pixels_per_unit=1.0):
+    """
+    Draw many grandfather clocks with a fixed number of draw calls.
+
+    Parameters:
+    - positions: (N, 2) array-like of bottom-center positions, as world_x/world_y
+      of draw_grandfather_clock()
+    - scales: Uniform scale of each clock, a scalar or an (N,) array-like
+    - time_offsets: Optional (N,) seconds added to the time shown by each clock
+    - now: Optional time.time()-style timestamp (defaults to the current time)
+    - pixels_per_unit: Screen pixels per unit of the caller's coordinate system
+
+    All instances share one local geometry (clock_geometry), tessellated for
+    the largest clock on screen. Placing it, and rotating the hands and
+    pendulums, is done for every clock at once with NumPy, and each layer
+    (body, rim, ticks, three hands, rods, bobs, caps) goes out as a single
+    vertex array: 9 draw calls for any N, instead of around 15 GL calls
+    and 6 matrix push/pops per clock.
+
+    The clocks are drawn layer by layer, so where two of them overlap, the
+    hands of one can end up over the case of the other; keep them apart
+    (a wall of clocks) for the same picture as separate calls.
+    """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+    count = len(positions)
+    if count == 0:
+        return
+    scales = np.broadcast_to(np.asarray(scales, dtype=np.float64), (count,))
+    offsets = np.zeros(count) if time_offsets is None else np.asarray(time_offsets, dtype=np.float64)
+    now = time.time() if now is None else now
+
+    pixels = scales.max() * pixels_per_unit
+    geometry = clock_geometry(lod_segments(FACE_RADIUS * pixels),
+                              lod_segments(BOB_RADIUS * pixels),
+                              lod_segments(CAP_RADIUS * pixels))
+
+    # The local model's bottom (y = -0.9) sits on the position, as in
+    # draw_grandfather_clock()
+    origin = positions + np.outer(scales, (0.0, 0.9))
+
+    def place(local):
+        # (V, 2) shared vertices -> (N * V, 2) for all clocks; local may
+        # also be (N, V, 2) per-clock vertices
+        return (origin[:, None, :] + scales[:, None, None] * local).reshape(-1, 2)
+
+    def rotated(local, degrees, center):
+        # Rotate (V, 2) vertices by each clock's angle, then move to center
+        t = np.radians(degrees)[:, None]
+        c, s = np.cos(t), np.sin(t)
+        x, y = local[:, 0], local[:, 1]
+        return np.stack([c * x - s * y, s * x + c * y], axis=2) + center
+
+    body = geometry["body"]
+    draw_vertices(GL_TRIANGLES, place(body), np.tile(geometry["body_colors"], (count, 1)))
+
+    glLineWidth(2)
+    glColor3f(*RIM_COLOR)
+    draw_vertices(GL_LINES, place(geometry["rim"]))
+    glColor3f(*TICK_COLOR)
+    draw_vertices(GL_LINES, place(geometry["ticks"]))
+    glLineWidth(1.0)
+
+    hour, minute, second, pendulum = clock_angles(now, offsets)
+    for angles, (length, width, color) in zip((hour, minute, second), HANDS):
+        hand = rotated(np.array([(0.0, 0.0), (0.0, length)]), angles, FACE_CENTER)
+        glLineWidth(width)
+        glColor3f(*color)
+        draw_vertices(GL_LINES, place(hand))
+    glLineWidth(1.0)
+
+    glColor3f(*ROD_COLOR)
+    draw_vertices(GL_TRIANGLES, place(rotated(geometry["rod"], pendulum, PIVOT)))
+    glColor3f(*BOB_COLOR)
+    draw_vertices(GL_TRIANGLES, place(rotated(geometry["bob"], pendulum, PIVOT)))
+    glColor3f(*CAP_COLOR)
+    draw_vertices(GL_TRIANGLES, place(geometry["caps"]))
 
 
 # ---------- GLUT callbacks ----------
@@ -334,17 +626,18 @@ def display():
     4. glutSwapBuffers() - Swap front and back buffers (enables smooth double-buffered animation)
 
     Transformations: NONE in this function (all handled by component draw functions)
-    Rendering order: case → face → hands → pendulum (ensures correct visual layering)
+    Rendering order: case → face → hands → pendulum → caps (ensures correct visual layering)
     Frame rate: Controlled by timer() callback (~60 FPS)
     """
     glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
     glLoadIdentity()
 
-    # Draw things in order back-to-front
-    draw_case()
-    draw_clock_face()
+    # Draw things in order back-to-front; the static parts come from
+    # display lists
+    draw_static(draw_clock_body)
     draw_clock_hands()
     draw_pendulum()
+    draw_static(draw_caps)
 
     glutSwapBuffers()
 
@@ -369,9 +662,12 @@ def reshape(width, height):
 
     Purpose: Ensures clock maintains correct proportions when window is resized.
     """
-    global window_width, window_height
+    global window_width, window_height, pixel_scale
     window_width = width
     window_height = height
+    # The shorter side spans 2 units (see the glOrtho bounds below)
+    pixel_scale = max(min(width, height), 1) / 2.0
+    invalidate_static()
 
     glViewport(0, 0, width, height)
 
@@ -0,0 +1,139 @@
+"""
+Parallel frame export for the city animation in main.py.
+
+Renders a time range of the scene headless (software GL) on every core and
+writes the frames in order, either as numbered images or as one raw RGB
+video stream:
+
+    python export.py frames/city_%05d.png --to 10 --fps 60
+    python export.py city.rgb --raw --to 10 --fps 30
+    python export.py - --raw --to 10 --fps 30 | ffmpeg -f rawvideo -pix_fmt rgb24 \
+        -s 1000x1000 -r 30 -i - city.mp4
+
+Frames are independent (main.render_time seeks straight to any time), so
+they are spread over a ProcessPoolExecutor; the workers also encode the
+images, and the parent only writes the finished bytes.
+"""
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+
+# The scene module, imported once in every worker process
+scene = None
+
+
+def load_scene():
+    """
+    Worker initializer: import main.py (and with it clock.py and OpenGL).
+    """
+    global scene
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import main
+    scene = main
+
+
+def render_task(index, t, width, height, start, raw, path):
+    """
+    Render and encode one frame.
+
+    Parameters:
+    - index: Frame number in the sequence
+    - t: Scene time in seconds
+    - width, height: Image size
+    - start: Clock timestamp of scene time 0
+    - raw: Return raw top-down RGB bytes instead of an image file
+    - path: Output path, picks PNG or PPM encoding
+
+    Returns (index, data, pid, busy seconds). The worker's scene keeps its
+    software GL context between tasks (see main.render_time), so its display
+    lists are compiled once per worker, not once per frame.
+    """
+    begin = time.perf_counter()
+    fb = scene.render_time(t, width, height, start)
+    data = fb.image().tobytes() if raw else fb.encode(path)
+    return index, data, os.getpid(), time.perf_counter() - begin
+
+
+def frame_path(pattern, index):
+    return pattern % index if "%" in pattern else pattern
+
+
+def export(args):
+    """
+    Render the frames of args across the pool and write them in order.
+
+    Returns a dict of per-worker statistics: pid -> [frames, busy seconds].
+    """
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    count = max(int(round((args.to - args.frm) * args.fps)), 1)
+    start = time.time() if args.start is None else args.start
+
+    if args.raw:
+        out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    workers = {}
+
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=load_scene) as pool:
+        # Keep a bounded window of frames in flight: enough to keep every
+        # worker busy, few enough that finished frames don't pile up in memory
+        pending = deque()
+        submitted = 0
+        while submitted < count or pending:
+            while submitted < count and len(pending) < 2 * args.workers:
+                t = args.frm + submitted / args.fps
+                pending.append(pool.submit(render_task, submitted, t, width, height, start,
+                                           args.raw, frame_path(args.output, submitted)))
+                submitted += 1
+
+            index, data, pid, busy = pending.popleft().result()
+            if args.raw:
+                out.write(data)
+            else:
+                with open(frame_path(args.output, index), "wb") as f:
+                    f.write(data)
+            stats = workers.setdefault(pid, [0, 0.0])
+            stats[0] += 1
+            stats[1] += busy
+
+    if args.raw and out is not sys.stdout.buffer:
+        out.close()
+    return count, workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the city animation as frames.")
+    parser.add_argument("output", help="image path with a %%d field for the frame number, "
+                                       "or with --raw a file for the RGB stream ('-' for stdout)")
+    parser.add_argument("--from", dest="frm", type=float, default=0.0,
+                        help="scene time of the first frame, in seconds")
+    parser.add_argument("--to", type=float, default=5.0, help="scene time to stop at, in seconds")
+    parser.add_argument("--fps", type=float, default=60.0, help="frames per second of scene time")
+    parser.add_argument("--size", default="1000x1000", help="image size as WxH")
+    parser.add_argument("--start", type=float, default=None,
+                        help="clock timestamp at scene time 0 (default: now)")
+    parser.add_argument("--raw", action="store_true",
+                        help="write raw rgb24 frames back to back (e.g. for ffmpeg -f rawvideo)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per core)")
+    args = parser.parse_args()
+    if not args.raw and "%" not in args.output:
+        parser.error("the output path needs a %d field, e.g. frames/city_%05d.png (or use --raw)")
+
+    begin = time.perf_counter()
+    count, workers = export(args)
+    wall = time.perf_counter() - begin
+
+    # Report on stderr, so a raw stream on stdout stays clean
+    log = sys.stderr
+    print("%d frames in %.2fs: %.1f fps with %d workers"
+          % (count, wall, count / wall, args.workers), file=log)
+    for pid, (frames, busy) in sorted(workers.items()):
+        print("  worker %d: %d frames, busy %.2fs (%.0f%% utilization)"
+              % (pid, frames, busy, 100.0 * busy / wall), file=log)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,21 @@
+import argparse
+import os
 import sys
+import time
 from OpenGL.GL import *
 from OpenGL.GLUT import *
 from OpenGL.GLU import *
-import math
+import numpy as np
 import clock  # pendulum clock module
+from clock import draw_vertices
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from raster.circle import LOD_STATS, circle_fan, lod_segments
+from raster.clip import (CULL_STATS, DAMAGE_STATS, DamageTracker, rect_area, rect_intersect,
+                         rects_overlap, window_rect)
+from raster.framebuffer import Framebuffer
+from raster.profiler import PROFILER
+from raster.softgl import SoftGL, install
 
 
 # Global animation variables
@@ -23,6 +35,87 @@ y = 0.0
 # o: controls one animated person’s horizontal movement.
 o = 0.0
 
+# Time between animation frames (the GLUT update timer interval)
+FRAME_INTERVAL_MS = 15
+
+# Scene time in seconds that display() shows; None means the time since
+# ANIMATION_START, so the live window moves at the same speed at any frame
+# rate. Headless rendering sets it to seek straight to a frame.
+ANIMATION_TIME = None
+ANIMATION_START = time.perf_counter()
+
+# Animation speeds in world units per frame of the 15 ms timer (the steps
+# the original per-frame updates used); see animation_state()
+SUN_STEP = 0.5      # sun, along both axes, until it stops at 150
+CLOUD_STEP = 0.3    # clouds, rightward, wrapping from 250 back to -50
+PERSON_STEP = 0.2   # walking person, rightward, wrapping from 250 to -250
+BUS_STEP = 0.7      # buses, leftward, wrapping from -430 back to 250
+
+# Timestamp shown by the clock; None means the current time. Headless
+# rendering pins it so frame N always looks the same.
+CLOCK_TIME = None
+
+# The 1000x1000 window shows 0..500 world units, so one unit is two pixels.
+# Circles and ellipses are tessellated for their size in pixels (see
+# ellipse_rim); reshape() and render_time() update it for other sizes.
+PIXELS_PER_UNIT = 2.0
+
+# Draw the profiler's frame-time graph over the scene ('p' in the window,
+# --overlay when headless); see draw_profile_overlay()
+SHOW_PROFILE = False
+
+# Where the 't' key writes the profiler's Chrome trace
+TRACE_PATH = "profile_trace.json"
+
+# Redraw only the rectangles the moving objects leave and enter instead of
+# the whole frame ('d' in the window, --damage when headless); see display()
+DAMAGE_TRACKING = False
+
+# Size of the window or headless image in pixels, for the damage rectangles
+WINDOW_SIZE = (1000, 1000)
+
+def ellipse_rim(x1, y1, rx, ry):
+    """
+    Triangle-fan vertices of an ellipse, tessellated for its on-screen size.
+
+    Parameters:
+    - x1, y1: Center position.
+    - rx, ry: Radii along X and Y axes respectively.
+
+    Returns an (n + 2, 2) array: the center, then the closed rim. The
+    segment count keeps every chord within a quarter pixel of the true
+    outline (lod_segments), and the unit-circle table behind it is cached,
+    so no trig runs while drawing.
+    """
+    segments = lod_segments(max(rx, ry) * PIXELS_PER_UNIT)
+    return circle_fan(x1, y1, rx, ry, segments=segments)
+
+def ellipse_fan(x1, y1, rx, ry, center_color, rim_color, fixed=361):
+    """
+    Draw a filled ellipse as a triangle fan (see ellipse_rim).
+
+    Parameters:
+    - x1, y1: Center position.
+    - rx, ry: Radii along X and Y axes respectively.
+    - center_color, rim_color: (r, g, b) tuples (0..255) for the center
+      vertex and the outline vertices.
+    - fixed: Rim vertices of the old fixed-step loop (361 for one-degree
+      steps, 721 for circlecar's half degrees), counted in LOD_STATS.
+
+    The fan goes out as a single vertex array (with a color array when the
+    center and rim colors differ).
+    """
+    vertices = ellipse_rim(x1, y1, rx, ry)
+    LOD_STATS.record(len(vertices), fixed + 1)
+    if center_color == rim_color:
+        glColor3ub(*center_color)
+        draw_vertices(GL_TRIANGLE_FAN, vertices)
+        return
+    colors = np.empty((len(vertices), 3), dtype=np.uint8)
+    colors[0] = center_color
+    colors[1:] = rim_color
+    draw_vertices(GL_TRIANGLE_FAN, vertices, colors)
+
 def myInit():
     """
     Initialize the main scene's projection and clear color.
@@ -44,18 +137,8 @@ def circlecar(x, y, rad, r, g, b):
     - rad: Radius of the circle.
     - r, g, b: Color components (0..255) used for the circle fill.
     """
-    x1 = x
-    y1 = y
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3ub(int(r), int(g), int(b))
-    glVertex2f(x1, y1)
-    angle = 0
-    while angle <= 360:
-        x2 = x1 + math.sin(math.radians(angle)) * rad
-        y2 = y1 + math.cos(math.radians(angle)) * rad
-        glVertex2f(x2, y2)
-        angle += 0.5
-    glEnd()
+    color = (int(r), int(g), int(b))
+    ellipse_fan(x, y, rad, rad, color, color, fixed=721)
 
 def circleWheel(x1, y1, rx, ry):
     """
@@ -65,15 +148,7 @@ def circleWheel(x1, y1, rx, ry):
     - x1, y1: Center position.
     - rx, ry: Radii along X and Y axes respectively.
     """
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3ub(255, 255, 255)
-    glVertex2f(x1, y1)
-    for angle in range(361):
-        glColor3ub(1, 1, 1)
-        x2 = x1 + rx * math.sin(math.radians(angle))
-        y2 = y1 + ry * math.cos(math.radians(angle))
-        glVertex2f(x2, y2)
-    glEnd()
+    ellipse_fan(x1, y1, rx, ry, (255, 255, 255), (1, 1, 1))
 
 def circleD(x1, y1, rx, ry):
     """
@@ -83,15 +158,7 @@ def circleD(x1, y1, rx, ry):
     - x1, y1: Center position.
     - rx, ry: Radii along X and Y axes respectively.
     """
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3ub(255, 41, 41)
-    glVertex2f(x1, y1)
-    for angle in range(361):
-        glColor3ub(255, 41, 41)
-        x2 = x1 + rx * math.sin(math.radians(angle))
-        y2 = y1 + ry * math.cos(math.radians(angle))
-        glVertex2f(x2, y2)
-    glEnd()
+    ellipse_fan(x1, y1, rx, ry, (255, 41, 41), (255, 41, 41))
 
 def sun(x1, y1, rx, ry):
     """
@@ -101,15 +168,7 @@ def sun(x1, y1, rx, ry):
     - x1, y1: Center position.
     - rx, ry: Radii along X and Y axes respectively.
     """
-    glBegin(GL_TRIANGLE_FAN)
-    glColor3ub(255, 10, 0)
-    glVertex2f(x1, y1)
-    for angle in range(361):
-        glColor3ub(240, 215, 0)
-        x2 = x1 + rx * math.sin(math.radians(angle))
-        y2 = y1 + ry * math.cos(math.radians(angle))
-        glVertex2f(x2, y2)
-    glEnd()
+    ellipse_fan(x1, y1, rx, ry, (255, 10, 0), (240, 215, 0))
 
 def circle(h, k, rx, ry, r, g, b):
     """
@@ -121,25 +180,63 @@ def circle(h, k, rx, ry, r, g, b):
     - r, g, b: Color components (0..255) for the fill.
     """
     glColor3f(r / 255.0, g / 255.0, b / 255.0)
-    glBegin(GL_POLYGON)
-    for i in range(1, 361):
-        glVertex2f(h + rx * math.cos(math.radians(i)), k + ry * math.sin(math.radians(i)))
-    glEnd()
+    vertices = ellipse_rim(h, k, rx, ry)[1:-1]
+    LOD_STATS.record(len(vertices), 360)
+    draw_vertices(GL_POLYGON, vertices)
     glFlush()
 
-def display():
+# Display list and LOD_STATS counts of each static layer, filled in on
+# first use
+STATIC_LISTS = {}
+
+# Damage tracking on the software GL: the SoftGL context render_time()
+# draws with (None on a real GL context), and the image and coverage mask
+# of each static layer drawn alone (see cache_layers)
+CONTEXT = None
+LAYER_IMAGES = {}
+
+# True while display() redraws a damaged rectangle
+DAMAGED_PASS = False
+
+def static_layer(draw):
     """
-    Main scene display callback.
+    Draw one static part of the scene from a display list.
 
-    Draws a stylized city/field scene with buildings, roads, mosque,
-    clouds, sun, trees, buses, animated figures, and places the
-    pendulum clock on a specific building facade.
+    Parameters:
+    - draw: Function issuing the layer's immediate-mode calls
+
+    The first call compiles draw() into a display list; later frames replay
+    it with a single glCallList instead of re-sending every vertex from
+    Python. The scene keeps four such layers, because the animated objects
+    are painted in between them.
+
+    The layer's LOD_STATS counts are kept with the list and recorded every
+    time it is called, not while it is compiled.
+
+    In the damaged passes of the software renderer the layer's cached image
+    is copied in instead (see cache_layers), so only the moving objects are
+    rasterized again.
+    """
+    if DAMAGED_PASS and draw.__name__ in LAYER_IMAGES:
+        composite_layer(draw.__name__)
+        return
+    cached = STATIC_LISTS.get(draw.__name__)
+    if cached is None:
+        list_id = glGenLists(1)
+        totals = LOD_STATS.reset()
+        glNewList(list_id, GL_COMPILE)
+        draw()
+        glEndList()
+        cached = STATIC_LISTS[draw.__name__] = (list_id, LOD_STATS.reset())
+        LOD_STATS.record(*totals)
+    list_id, counts = cached
+    glCallList(list_id)
+    LOD_STATS.record(*counts)
+
+def draw_backdrop():
+    """
+    Static layer behind the sun and clouds: sky, background, roads and mosque.
     """
-    global a, b, m, n, x, o
-    
-    # Clear the color buffer to prepare for new frame rendering
-    glClear(GL_COLOR_BUFFER_BIT)
-    
     # ========== SKY ==========
     # Draw gradient sky background with white at horizon transitioning to blue at top
     # Creates a realistic sky appearance from Y=250 to Y=500
@@ -264,36 +361,10 @@ def display():
     glVertex2d(324, 372)
     glEnd()
 
-    # ========== ANIMATED ELEMENTS: SUN & CLOUDS ==========
-    # Animated sun - moves diagonally using variables 'a' and 'b'
-    # Base position (200, 300) with animation offset, radius 30
-    sun(a + 200, b + 300, 30, 30)
-
-    # Cloud group 1 (left side) - 4 overlapping circles create fluffy cloud
-    # All use variable 'm' for horizontal animation (moves right to left or vice versa)
-    circlecar(m + 100, n + 425, 10, 255, 255, 255)  # Bottom-left circle
-    circlecar(m + 110, n + 430, 10, 255, 255, 255)  # Bottom-right circle
-    circlecar(m + 90, n + 430, 10, 255, 255, 255)   # Top-left circle
-    circlecar(m + 100, n + 440, 10, 255, 255, 255)  # Top-center circle
-
-    # Cloud group 2 (center) - another set of 4 circles
-    circlecar(m + 180, n + 445, 10, 255, 255, 255)  # Bottom-left circle
-    circlecar(m + 190, n + 450, 10, 255, 255, 255)  # Bottom-right circle
-    circlecar(m + 170, n + 450, 10, 255, 255, 255)  # Top-left circle
-    circlecar(m + 180, n + 460, 10, 255, 255, 255)  # Top-center circle
-
-    # Cloud group 3 (right side) - third set of 4 circles
-    circlecar(m + 260, n + 445, 10, 255, 255, 255)  # Bottom-left circle
-    circlecar(m + 270, n + 450, 10, 255, 255, 255)  # Bottom-right circle
-    circlecar(m + 250, n + 450, 10, 255, 255, 255)  # Top-left circle
-    circlecar(m + 260, n + 460, 10, 255, 255, 255)  # Top-center circle
-
-    # Sun animation update - increments position until limit reached
-    # Moves sun diagonally upward and rightward (150 units max)
-    if a < 150:
-        a += 0.5  # Horizontal movement speed
-        b += 0.5  # Vertical movement speed
-
+def draw_facade():
+    """
+    Static layer between the clouds and the clock: AB1 parts 1-2 and the clock facade.
+    """
     # ========== BUILDING COMPLEX (AB1) ==========
     # AB1 Part 1 - Leftmost building section
     # 6-story tall building from X=20 to X=90, Y=250 to Y=400
@@ -396,20 +467,11 @@ def display():
     glVertex2d(137, 335)
     glVertex2d(137, 250)
     glEnd()
-    
-    # ========== GRANDFATHER CLOCK PLACEMENT ==========
-    # Place animated pendulum clock on the building facade
-    # Building span: X=90 to X=137 (width 47), Y=250 to Y=345 (height 95)
-    # Clock centered at X=113.5, base at Y=250, scaled to 49.0 units
-    glMatrixMode(GL_MODELVIEW)
-    glPushMatrix()
-    glLoadIdentity()
-    # Slightly reduced scale to decrease height a bit while fitting width
-    clock.draw_grandfather_clock(world_x=113.5, world_y=250.0, scale=49.0)
-    glPopMatrix()
-    glMatrixMode(GL_PROJECTION)
-
 
+def draw_grounds():
+    """
+    Static layer in front of the clock: AB1 parts 3-6, the field and the trees.
+    """
     # AB1 Part 3 - Wide central building section
     # Largest section of the building complex
     # From X=140 to X=226 (width 86), Y=250 to Y=390
@@ -600,167 +662,329 @@ def display():
         glVertex2d(tree_x + 7, 220)
         glEnd()
 
-
-    # ========== CLOUD ANIMATION LOGIC ==========
-    # Clouds move from left to right across the sky
-    # When m reaches 250, reset to -50 to wrap around (loop animation)
-    # Speed: 0.3 units per frame
-    if m < 250:
-        m += 0.3  # Move clouds rightward
-    else:
-        m = -50   # Wrap back to left side
-
-    # Alternative: For right-to-left movement, uncomment below:
-    # if m > -100:
-    #     m -= 0.3  # Move clouds leftward
-    # else:
-    #     m = 250   # Wrap back to right side
-
-    # ========== ANIMATED PERSON 1 (Walking Figure) ==========
-    # Stick figure that moves horizontally using variable 'o'
-    # Consists of: 2 arms (lines), body/legs (polygons), head (circle)
+def draw_person2():
+    """
+    Static layer between the two animated groups: the standing person.
+    """
+    # ========== PERSON 2 (Static Figure) ==========
+    # Second stick figure - currently stationary (no animation offset)
+    # Similar structure to Person 1 but different position and colors
+    # To animate: add a variable offset like Person 1 uses 'o'
     
-    # Left arm - diagonal line from shoulder to hand
+    # Left arm
     glColor3ub(255, 160, 122)  # Peach/skin color
     glLineWidth(4.0)
     glBegin(GL_LINES)
-    glVertex2d(o + 264, 260)  # Shoulder
-    glVertex2d(o + 256, 257)  # Hand
+    glVertex2d(34, 160)  # Shoulder
+    glVertex2d(26, 157)  # Hand
     glEnd()
 
-    # Right arm - diagonal line from shoulder to hand
+    # Right arm
     glColor3ub(255, 160, 122)  # Peach/skin color
     glLineWidth(4.0)
     glBegin(GL_LINES)
-    glVertex2d(o + 266, 260)  # Shoulder
-    glVertex2d(o + 275, 257)  # Hand
+    glVertex2d(36, 160)  # Shoulder
+    glVertex2d(45, 157)  # Hand
     glEnd()
 
-    # Body/torso - purple/magenta colored trapezoid
-    glColor3ub(197, 30, 255)  # Purple shirt
+    # Body/torso - red colored trapezoid
+    glColor3ub(255, 0, 25)  # Red shirt
     glBegin(GL_POLYGON)
-    glVertex2d(o + 260, 250)  # Bottom-left
-    glVertex2d(o + 270, 250)  # Bottom-right
-    glVertex2d(o + 266, 265)  # Top-right (shoulders)
-    glVertex2d(o + 264, 265)  # Top-left (shoulders)
+    glVertex2d(30, 150)  # Bottom-left
+    glVertex2d(40, 150)  # Bottom-right
+    glVertex2d(36, 165)  # Top-right (shoulders)
+    glVertex2d(34, 165)  # Top-left (shoulders)
     glEnd()
     
     # Head - small black circle
-    circlecar(o + 265, 267, 3, 0, 0, 0)  # Radius 3, black color
+    circlecar(35, 167, 3, 0, 0, 0)  # Radius 3, black color
 
     # Left leg - gray triangle
     glColor3ub(149, 149, 149)  # Gray pants
     glBegin(GL_POLYGON)
-    glVertex2d(o + 260, 250)  # Hip (left side of body)
-    glVertex2d(o + 265, 250)  # Hip (center)
-    glVertex2d(o + 260, 240)  # Foot
+    glVertex2d(30, 150)  # Hip (left)
+    glVertex2d(35, 150)  # Hip (center)
+    glVertex2d(30, 140)  # Foot
     glEnd()
 
     # Right leg - gray triangle
     glColor3ub(149, 149, 149)  # Gray pants
     glBegin(GL_POLYGON)
-    glVertex2d(o + 265, 250)  # Hip (center)
-    glVertex2d(o + 270, 250)  # Hip (right side of body)
-    glVertex2d(o + 268, 240)  # Foot
+    glVertex2d(35, 150)  # Hip (center)
+    glVertex2d(40, 150)  # Hip (right)
+    glVertex2d(38, 140)  # Foot
     glEnd()
 
-    # Left shoe - dark blue line at foot
+    # Left shoe - dark blue line
     glColor3ub(0, 0, 105)  # Dark blue
     glLineWidth(2.0)
     glBegin(GL_LINES)
-    glVertex2d(o + 263, 240)
-    glVertex2d(o + 258, 240)
+    glVertex2d(33, 140)
+    glVertex2d(28, 140)
     glEnd()
 
-    # Right shoe - dark blue line at foot
+    # Right shoe - dark blue line
     glColor3ub(0, 0, 105)  # Dark blue
     glLineWidth(2.0)
     glBegin(GL_LINES)
-    glVertex2d(o + 270, 240)
-    glVertex2d(o + 265, 240)
+    glVertex2d(40, 140)
+    glVertex2d(35, 140)
     glEnd()
 
-    # ========== PERSON 1 ANIMATION LOGIC ==========
-    # Person walks left to right across the screen
-    # When o reaches 250, wraps back to -250 (re-enters from left)
-    # Speed: 0.2 units per frame
-    if o < 250:
-        o += 0.2  # Move rightward
+# ========== MOVING OBJECTS ==========
+# Boxes are (xmin, ymin, xmax, ymax) in scene units at animation offset 0,
+# padded for line widths; see in_view()
+
+# Visible region of the glOrtho(0, 500, 0, 500) projection set in myInit
+VIEW_RECT = (0, 0, 500, 500)
+
+# Cloud puff centers, one tuple per cloud (left, center, right)
+CLOUDS = (
+    ((100, 425), (110, 430), (90, 430), (100, 440)),
+    ((180, 445), (190, 450), (170, 450), (180, 460)),
+    ((260, 445), (270, 450), (250, 450), (260, 460)),
+)
+CLOUD_RADIUS = 10
+CLOUD_BOXES = tuple(
+    (min(px for px, _ in puffs) - CLOUD_RADIUS, min(py for _, py in puffs) - CLOUD_RADIUS,
+     max(px for px, _ in puffs) + CLOUD_RADIUS, max(py for _, py in puffs) + CLOUD_RADIUS)
+    for puffs in CLOUDS
+)
+
+PERSON1_BOX = (254, 238, 277, 270)
+PERSON1_PRIMITIVES = 8   # 2 arms, torso, head, 2 legs, 2 shoes
+
+BUS1_BOX = (250, 223, 310, 255)
+BUS2_BOX = (370, 223, 430, 255)
+BUS_PRIMITIVES = 14      # body, panel, 4 windows, windshield, 2 wheels, red dot, door, 2 lights, trim
+
+# Sun of radius 30 around (200, 300), moving with (a, b)
+SUN_BOX = (168, 268, 232, 332)
+
+# The clock display() places (case 49 units wide and 88 tall on (113.5, 250)),
+# and the part of it that moves: the hands and the swinging pendulum
+CLOCK_BOX = (88, 249, 139, 339)
+CLOCK_HANDS_BOX = (95, 269, 132, 327)
+
+# Profiler graph of draw_profile_overlay(), redrawn every frame while shown
+OVERLAY_BOX = (300, 400, 490, 490)
+
+def in_view(box, primitives, dx=0.0, dy=0.0):
+    """
+    Bounding-box cull test for one moving object.
+
+    Parameters:
+    - box: (xmin, ymin, xmax, ymax) of the object at animation offset 0
+    - primitives: Number of primitives the object draws
+    - dx, dy: Current animation offset of the object
+
+    Returns True if the shifted box overlaps VIEW_RECT, i.e. the object has
+    to be drawn. Either way its primitives are counted in CULL_STATS.
+    """
+    xmin, ymin, xmax, ymax = box
+    visible = rects_overlap((xmin + dx, ymin + dy, xmax + dx, ymax + dy), VIEW_RECT)
+    if visible:
+        CULL_STATS.record(primitives, 0)
     else:
-        o = -250  # Wrap to left edge
+        CULL_STATS.record(0, primitives)
+    return visible
 
-    # Alternative: For right-to-left movement, uncomment below:
-    # if o > -250:
-    #     o -= 0.2  # Move leftward
-    # else:
-    #     o = 250   # Wrap to right edge
+def cull_moving_objects():
+    """
+    Bounding-box culling of the moving objects at the current offsets.
 
-    # ========== PERSON 2 (Static Figure) ==========
-    # Second stick figure - currently stationary (no animation offset)
-    # Similar structure to Person 1 but different position and colors
-    # To animate: add a variable offset like Person 1 uses 'o'
+    Returns a dict of what draw_scene() draws: "sun" and "clock" (never
+    culled), "clouds" (a flag per cloud), "person1", "bus1" and "bus2". It
+    runs once per frame, so CULL_STATS stays per frame however many damaged
+    rectangles the scene is drawn in (see shown_in).
+    """
+    return {
+        "sun": True,
+        "clock": True,
+        "clouds": [in_view(box, len(puffs), m, n) for puffs, box in zip(CLOUDS, CLOUD_BOXES)],
+        "person1": in_view(PERSON1_BOX, PERSON1_PRIMITIVES, o),
+        "bus1": in_view(BUS1_BOX, BUS_PRIMITIVES, x),
+        "bus2": in_view(BUS2_BOX, BUS_PRIMITIVES, x),
+    }
+
+# Damaged rectangles of the moving objects between frames (DAMAGE_TRACKING)
+DAMAGE = DamageTracker()
+
+def box_pixels(box, dx=0.0, dy=0.0):
+    """
+    Window rectangle covered by a scene box shifted by (dx, dy).
+
+    Returns inclusive pixel bounds for the current WINDOW_SIZE, one pixel
+    wider on every side for the half-pixel offset of the pixel centers.
+    """
+    sx = WINDOW_SIZE[0] / 500.0
+    sy = WINDOW_SIZE[1] / 500.0
+    xmin, ymin, xmax, ymax = box
+    return (int(np.floor((xmin + dx) * sx)) - 1, int(np.floor((ymin + dy) * sy)) - 1,
+            int(np.ceil((xmax + dx) * sx)) + 1, int(np.ceil((ymax + dy) * sy)) + 1)
+
+def mark_damage(shown, t):
+    """
+    Report the rectangle and state of every moving object to DAMAGE.
+
+    Parameters:
+    - shown: Culling result of cull_moving_objects(); culled objects cover
+      no rectangle
+    - t: Scene time, the state of the clock (its hands and pendulum move
+      all the time) and of the profiler overlay
+    """
+    DAMAGE.mark("sun", box_pixels(SUN_BOX, a, b), (a, b))
+    for i, box in enumerate(CLOUD_BOXES):
+        DAMAGE.mark(("cloud", i), box_pixels(box, m, n) if shown["clouds"][i] else None, (m, n))
+    DAMAGE.mark("person1", box_pixels(PERSON1_BOX, o) if shown["person1"] else None, o)
+    DAMAGE.mark("bus1", box_pixels(BUS1_BOX, x) if shown["bus1"] else None, x)
+    DAMAGE.mark("bus2", box_pixels(BUS2_BOX, x) if shown["bus2"] else None, x)
+    DAMAGE.mark("clock", box_pixels(CLOCK_HANDS_BOX), t)
+    DAMAGE.mark("overlay", box_pixels(OVERLAY_BOX) if SHOW_PROFILE else None, t)
+
+def shown_in(rect):
+    """
+    The moving objects that reach into rect, one damaged pass of display().
+
+    Uses the rectangles mark_damage() gave DAMAGE for this frame, so an
+    object culled for the whole frame stays culled. The clock's static case
+    reaches past its damage rectangle, so it is tested with CLOCK_BOX.
+    """
+    def reaches(key):
+        box = DAMAGE.rect(key)
+        return box is not None and rects_overlap(box, rect)
+
+    return {
+        "sun": reaches("sun"),
+        "clock": rects_overlap(box_pixels(CLOCK_BOX), rect),
+        "clouds": [reaches(("cloud", i)) for i in range(len(CLOUDS))],
+        "person1": reaches("person1"),
+        "bus1": reaches("bus1"),
+        "bus2": reaches("bus2"),
+    }
+
+def cache_layers():
+    """
+    Render every static layer on its own into LAYER_IMAGES.
+
+    Each layer is drawn into a transparent framebuffer of the output size
+    through a separate SoftGL context, so the alpha channel says which
+    pixels it covers; the scene's GL names point back at CONTEXT afterwards.
+    The backdrop is drawn over the cleared sky and covers everything.
+    """
+    width, height = CONTEXT.fb.width, CONTEXT.fb.height
+    namespaces = (globals(), vars(clock))
+    # Not part of any frame: keep the layers out of LOD_STATS
+    totals = LOD_STATS.reset()
+    for draw in (draw_backdrop, draw_facade, draw_grounds, draw_person2):
+        layer = Framebuffer(width, height, clear_color=(0, 0, 0, 0))
+        ctx = SoftGL(layer)
+        saved = [{name: ns[name] for name in ctx.namespace() if name in ns} for ns in namespaces]
+        install(ctx, *namespaces)
+        myInit()
+        if draw is draw_backdrop:
+            glClear(GL_COLOR_BUFFER_BIT)
+        glLineWidth(1.0)
+        draw()
+        for ns, names in zip(namespaces, saved):
+            ns.update(names)
+        LAYER_IMAGES[draw.__name__] = (layer.pixels, layer.pixels[..., 3] > 0)
+    LOD_STATS.reset()
+    LOD_STATS.record(*totals)
+
+def composite_layer(name):
+    """
+    Copy the cached pixels of one static layer into the clip rectangle of
+    the software framebuffer, where the layer covers them.
+    """
+    pixels, covered = LAYER_IMAGES[name]
+    fb = CONTEXT.fb
+    xmin, ymin, xmax, ymax = fb.clip
+    window = (slice(ymin, ymax + 1), slice(xmin, xmax + 1))
+    np.copyto(fb.region(), pixels[window], where=covered[window][..., None])
+
+def draw_cloud(puffs, m, n):
+    """
+    Draw one cloud as overlapping white circles.
+
+    Parameters:
+    - puffs: Circle centers, one of CLOUDS
+    - m, n: Cloud animation offset
+    """
+    for px, py in puffs:
+        circlecar(m + px, n + py, CLOUD_RADIUS, 255, 255, 255)
+
+def draw_person1(o):
+    """
+    Draw the walking stick figure at horizontal offset o.
+    """
+    # Stick figure that moves horizontally using variable 'o'
+    # Consists of: 2 arms (lines), body/legs (polygons), head (circle)
     
-    # Left arm
+    # Left arm - diagonal line from shoulder to hand
     glColor3ub(255, 160, 122)  # Peach/skin color
     glLineWidth(4.0)
     glBegin(GL_LINES)
-    glVertex2d(34, 160)  # Shoulder
-    glVertex2d(26, 157)  # Hand
+    glVertex2d(o + 264, 260)  # Shoulder
+    glVertex2d(o + 256, 257)  # Hand
     glEnd()
 
-    # Right arm
+    # Right arm - diagonal line from shoulder to hand
     glColor3ub(255, 160, 122)  # Peach/skin color
     glLineWidth(4.0)
     glBegin(GL_LINES)
-    glVertex2d(36, 160)  # Shoulder
-    glVertex2d(45, 157)  # Hand
+    glVertex2d(o + 266, 260)  # Shoulder
+    glVertex2d(o + 275, 257)  # Hand
     glEnd()
 
-    # Body/torso - red colored trapezoid
-    glColor3ub(255, 0, 25)  # Red shirt
+    # Body/torso - purple/magenta colored trapezoid
+    glColor3ub(197, 30, 255)  # Purple shirt
     glBegin(GL_POLYGON)
-    glVertex2d(30, 150)  # Bottom-left
-    glVertex2d(40, 150)  # Bottom-right
-    glVertex2d(36, 165)  # Top-right (shoulders)
-    glVertex2d(34, 165)  # Top-left (shoulders)
+    glVertex2d(o + 260, 250)  # Bottom-left
+    glVertex2d(o + 270, 250)  # Bottom-right
+    glVertex2d(o + 266, 265)  # Top-right (shoulders)
+    glVertex2d(o + 264, 265)  # Top-left (shoulders)
     glEnd()
     
     # Head - small black circle
-    circlecar(35, 167, 3, 0, 0, 0)  # Radius 3, black color
+    circlecar(o + 265, 267, 3, 0, 0, 0)  # Radius 3, black color
 
     # Left leg - gray triangle
     glColor3ub(149, 149, 149)  # Gray pants
     glBegin(GL_POLYGON)
-    glVertex2d(30, 150)  # Hip (left)
-    glVertex2d(35, 150)  # Hip (center)
-    glVertex2d(30, 140)  # Foot
+    glVertex2d(o + 260, 250)  # Hip (left side of body)
+    glVertex2d(o + 265, 250)  # Hip (center)
+    glVertex2d(o + 260, 240)  # Foot
     glEnd()
 
     # Right leg - gray triangle
     glColor3ub(149, 149, 149)  # Gray pants
     glBegin(GL_POLYGON)
-    glVertex2d(35, 150)  # Hip (center)
-    glVertex2d(40, 150)  # Hip (right)
-    glVertex2d(38, 140)  # Foot
+    glVertex2d(o + 265, 250)  # Hip (center)
+    glVertex2d(o + 270, 250)  # Hip (right side of body)
+    glVertex2d(o + 268, 240)  # Foot
     glEnd()
 
-    # Left shoe - dark blue line
+    # Left shoe - dark blue line at foot
     glColor3ub(0, 0, 105)  # Dark blue
     glLineWidth(2.0)
     glBegin(GL_LINES)
-    glVertex2d(33, 140)
-    glVertex2d(28, 140)
+    glVertex2d(o + 263, 240)
+    glVertex2d(o + 258, 240)
     glEnd()
 
-    # Right shoe - dark blue line
+    # Right shoe - dark blue line at foot
     glColor3ub(0, 0, 105)  # Dark blue
     glLineWidth(2.0)
     glBegin(GL_LINES)
-    glVertex2d(40, 140)
-    glVertex2d(35, 140)
+    glVertex2d(o + 270, 240)
+    glVertex2d(o + 265, 240)
     glEnd()
 
-    # ========== BUS 1 (Animated) ==========
+def draw_bus1(x):
+    """
+    Draw the first green bus at horizontal offset x.
+    """
     # Green bus moving across the screen using variable 'x'
     # Full bus consists of: body, windows, wheels, door, and lights
     
@@ -854,7 +1078,10 @@ def display():
     glVertex2d(x + 290, 241)
     glEnd()
 
-    # ========== BUS 2 (Animated) ==========
+def draw_bus2(x):
+    """
+    Draw the second green bus, 120 units right of the first, at offset x.
+    """
     # Second green bus - same structure as Bus 1 but offset to the right
     # Both buses share the same 'x' animation variable, moving together
     
@@ -946,22 +1173,246 @@ def display():
     glVertex2d(x + 410, 241)
     glEnd()
 
+def display():
+    """
+    Main scene display callback.
+
+    Draws a stylized city/field scene with buildings, roads, mosque,
+    clouds, sun, trees, buses, animated figures, and places the
+    pendulum clock on a specific building facade. With DAMAGE_TRACKING
+    only the rectangles around the objects that moved are redrawn, each
+    in its own pass under a scissor box (see mark_damage and static_layer).
+    """
+    global a, b, m, n, x, o, DAMAGED_PASS
+
+    # Frame profiling, when enabled (see raster.profiler and --profile)
+    PROFILER.begin_frame()
+
+    # Place every animated object for the current scene time
+    t = animation_time()
+    a, b, m, n, x, o = animation_state(t)
+    shown = cull_moving_objects()
+
+    rects = None
+    if DAMAGE_TRACKING:
+        mark_damage(shown, t)
+        rects = DAMAGE.damage()
+    else:
+        DAMAGE.invalidate()
+
+    width, height = WINDOW_SIZE
+    if rects is None:
+        # Clear the color buffer to prepare for new frame rendering
+        with PROFILER.section("clear"):
+            glClear(GL_COLOR_BUFFER_BIT)
+
+        # Sky, background, roads and mosque (compiled once, see static_layer)
+        with PROFILER.section("backdrop"):
+            static_layer(draw_backdrop)
+
+        draw_scene(shown)
+        DAMAGE_STATS.record(width * height, width * height)
+        if DAMAGE_TRACKING and CONTEXT is not None and not LAYER_IMAGES:
+            cache_layers()
+    else:
+        # Everything outside the rectangles is still on screen from the
+        # last frame
+        touched = 0
+        DAMAGED_PASS = True
+        glEnable(GL_SCISSOR_TEST)
+        for rect in rects:
+            xmin, ymin, xmax, ymax = rect
+            glScissor(xmin, ymin, xmax - xmin + 1, ymax - ymin + 1)
+            # Put the backdrop back under the box: a copy of its cached image
+            # in software, a scissored clear and display list on a GL context
+            with PROFILER.section("backdrop"):
+                if not LAYER_IMAGES:
+                    glClear(GL_COLOR_BUFFER_BIT)
+                static_layer(draw_backdrop)
+            draw_scene(shown_in(rect))
+            touched += rect_area(rect_intersect(rect, window_rect(width, height)))
+        glDisable(GL_SCISSOR_TEST)
+        DAMAGED_PASS = False
+        DAMAGE_STATS.record(touched, width * height)
+
+    PROFILER.end_frame()
+    if SHOW_PROFILE:
+        draw_profile_overlay()
+
+    glFlush()
+
+def draw_scene(shown):
+    """
+    Draw everything in front of the backdrop, back to front.
+
+    Parameters:
+    - shown: Culling result of cull_moving_objects()
+    """
+    # The facade's floor lines use the current width; without this they
+    # would get the 2.0 the walkers leave behind, thicker from the second
+    # frame (or damaged pass) on than in the first
+    glLineWidth(1.0)
+
+    # ========== ANIMATED ELEMENTS: SUN & CLOUDS ==========
+    # Animated sun - moves diagonally using variables 'a' and 'b'
+    # Base position (200, 300) with animation offset, radius 30
+    with PROFILER.section("sun"):
+        if shown["sun"]:
+            sun(a + 200, b + 300, 30, 30)
+
+    # Clouds - 3 groups of overlapping circles, moving with 'm' (see CLOUDS)
+    with PROFILER.section("clouds"):
+        for puffs, visible in zip(CLOUDS, shown["clouds"]):
+            if visible:
+                draw_cloud(puffs, m, n)
+
+    # AB1 parts 1-2 and the clock facade (compiled once, see static_layer)
+    with PROFILER.section("facade"):
+        static_layer(draw_facade)
+
+    # ========== GRANDFATHER CLOCK PLACEMENT ==========
+    # Place animated pendulum clock on the building facade
+    # Building span: X=90 to X=137 (width 47), Y=250 to Y=345 (height 95)
+    # Clock centered at X=113.5, base at Y=250, scaled to 49.0 units
+    with PROFILER.section("clock"):
+        if shown["clock"]:
+            glMatrixMode(GL_MODELVIEW)
+            glPushMatrix()
+            glLoadIdentity()
+            # Slightly reduced scale to decrease height a bit while fitting width
+            clock.draw_grandfather_clock(world_x=113.5, world_y=250.0, scale=49.0, now=CLOCK_TIME,
+                                         pixels_per_unit=PIXELS_PER_UNIT)
+            glPopMatrix()
+            glMatrixMode(GL_PROJECTION)
+
+    # AB1 parts 3-6, field and trees (compiled once, see static_layer)
+    with PROFILER.section("grounds"):
+        static_layer(draw_grounds)
+
+    # ========== ANIMATED PERSON 1 (Walking Figure) ==========
+    # Skipped while it is outside the view, like the clouds and buses
+    with PROFILER.section("person1"):
+        if shown["person1"]:
+            draw_person1(o)
+
+    # Person 2 (static figure) (compiled once, see static_layer)
+    with PROFILER.section("person2"):
+        static_layer(draw_person2)
+
+    # ========== BUSES (Animated) ==========
+    # Both buses move with 'x'; for much of the loop one or both are off screen
+    with PROFILER.section("buses"):
+        if shown["bus1"]:
+            draw_bus1(x)
+        if shown["bus2"]:
+            draw_bus2(x)
+
+def draw_profile_overlay():
+    """
+    Draw the profiler's frame-time graph in the top-right corner of the scene.
+
+    One column per recorded frame, stacked by display() section in the
+    section colors; the white line marks the FRAME_INTERVAL_MS budget.
+    """
+    vertices, colors = PROFILER.overlay_triangles(300, 400, 190, 90, budget_ms=FRAME_INTERVAL_MS)
+    draw_vertices(GL_TRIANGLES, vertices, colors)
+
+def print_profile():
+    """
+    Print the profiler's per-section summary of the recorded frames.
+    """
+    print("%-10s %9s %9s %9s" % ("section", "mean ms", "max ms", "GL calls"))
+    for name, mean, peak, calls in PROFILER.summary():
+        print("%-10s %9.3f %9.3f %9.1f" % (name, mean, peak, calls))
+
+def keyboard(key, x, y):
+    """
+    GLUT keyboard callback: 'p' toggles the profiler and its overlay,
+    't' writes the recorded frames to TRACE_PATH as a Chrome trace, 'd'
+    toggles damage tracking (see display).
+    """
+    global SHOW_PROFILE, DAMAGE_TRACKING
+    if key == b'd':
+        DAMAGE_TRACKING = not DAMAGE_TRACKING
+        print("damage tracking %s" % ("on" if DAMAGE_TRACKING else "off"))
+    elif key == b'p':
+        SHOW_PROFILE = PROFILER.toggle(globals(), vars(clock))
+        if not SHOW_PROFILE:
+            print_profile()
+    elif key == b't':
+        PROFILER.save_trace(TRACE_PATH)
+        print("wrote %d frames to %s" % (len(PROFILER.frames), TRACE_PATH))
+
+def reshape(width, height):
+    """
+    GLUT reshape callback: stretch the scene over the new window size.
+
+    The window contents are gone after a resize, so the next frame is
+    drawn in full even with damage tracking on. The circles are
+    tessellated for the new size (PIXELS_PER_UNIT, as in render_time), so
+    the static layers, which contain them, are compiled again.
+    """
+    global WINDOW_SIZE, PIXELS_PER_UNIT
+    WINDOW_SIZE = (width, height)
+    PIXELS_PER_UNIT = max(width, height) / 500.0
+    glViewport(0, 0, width, height)
+    for list_id, _ in STATIC_LISTS.values():
+        glDeleteLists(list_id, 1)
+    STATIC_LISTS.clear()
+    DAMAGE.invalidate()
+
+def wrap(value, low, high):
+    """
+    Fold value into [low, high): an object leaving one edge re-enters at
+    the other.
+    """
+    return low + (value - low) % (high - low)
+
+def animation_state(t):
+    """
+    Positions of every animated object at scene time t.
+
+    Parameters:
+    - t: Seconds since the animation started (frame N is at
+      N * FRAME_INTERVAL_MS / 1000)
+
+    Returns (a, b, m, n, x, o), the offsets display() draws with. Each one
+    is a pure function of time, so any moment can be drawn directly, in any
+    order, without stepping through the frames before it.
+    """
+    # Progress measured in frames of the original 15 ms timer
+    f = t * 1000.0 / FRAME_INTERVAL_MS
+
+    # Sun moves diagonally upward and rightward, then stops (150 units max)
+    a = b = min(SUN_STEP * f, 150.0)
+
+    # ========== CLOUD ANIMATION LOGIC ==========
+    # Clouds move from left to right across the sky
+    # When m reaches 250 they re-enter at -50 (loop animation)
+    # For right-to-left movement use wrap(-CLOUD_STEP * f, -100, 250)
+    m = wrap(CLOUD_STEP * f, -50.0, 250.0)
+    n = 0.0
+
     # ========== BUS ANIMATION LOGIC ==========
     # Both buses move together from right to left across the screen
-    # When x drops below -430, reset to 250 (wrap from left back to right)
-    # Speed: 0.7 units per frame (faster than people)
-    if x > -430:
-        x -= 0.7  # Move buses leftward
-    else:
-        x = 250   # Wrap back to right edge
+    # When x drops below -430 they re-enter at 250
+    x = wrap(-BUS_STEP * f, -430.0, 250.0)
 
-    # Alternative: For left-to-right movement, uncomment below:
-    # if x < 250:
-    #     x += 0.7   # Move buses rightward
-    # else:
-    #     x = -430   # Wrap back to left edge
+    # ========== PERSON 1 ANIMATION LOGIC ==========
+    # Person walks left to right across the screen
+    # When o reaches 250, wraps back to -250 (re-enters from left)
+    o = wrap(PERSON_STEP * f, -250.0, 250.0)
 
-    glFlush()
+    return a, b, m, n, x, o
+
+def animation_time():
+    """
+    Scene time to draw: ANIMATION_TIME if set, else the wall-clock time
+    since ANIMATION_START.
+    """
+    if ANIMATION_TIME is not None:
+        return ANIMATION_TIME
+    return time.perf_counter() - ANIMATION_START
 
 def update(value):
     """
@@ -970,15 +1421,148 @@ def update(value):
     Posts a redisplay request and re-registers itself to drive animation.
     """
     glutPostRedisplay()
-    glutTimerFunc(15, update, 0)
+    glutTimerFunc(FRAME_INTERVAL_MS, update, 0)
+
+def render_frame(frame, width=1000, height=1000, start=None, fps=None):
+    """
+    Render frame N of the scene without a window or GL context.
+
+    Parameters:
+    - frame: Frame number; frame 0 is the first frame GLUT would show
+    - width, height: Output size in pixels (any size; the scene's 0..500
+      ortho range is stretched over it)
+    - start: time.time()-style timestamp of frame 0 for the clock
+      (defaults to when the clock module was loaded)
+    - fps: Frame rate of the sequence (defaults to the GLUT timer's,
+      1000 / FRAME_INTERVAL_MS)
+
+    Returns a raster.framebuffer.Framebuffer (see render_time).
+    """
+    fps = 1000.0 / FRAME_INTERVAL_MS if fps is None else fps
+    return render_time(frame / fps, width, height, start)
+
+
+def render_time(t, width=1000, height=1000, start=None):
+    """
+    Render the scene as it looks t seconds into the animation.
+
+    Parameters are those of render_frame(), with the scene time t in
+    seconds instead of a frame number. The unmodified display() runs
+    against the software GL in raster.softgl, with the animation at time t
+    and the clock pinned to start + t. Every frame only depends on t, so
+    frames can be rendered in any order or in separate processes.
+
+    The context, with the display lists of the static layers and the clock,
+    is kept for the next call of the same size, so those are compiled once
+    per process (e.g. per export.py worker) rather than once per frame. The
+    returned buffer is then the same object every time. Without
+    DAMAGE_TRACKING display() clears it before drawing; with it, the
+    previous frame is drawn over and only what changed is redrawn.
+    """
+    global ANIMATION_TIME, CLOCK_TIME, PIXELS_PER_UNIT, WINDOW_SIZE, CONTEXT
+    fb = None if CONTEXT is None else CONTEXT.fb
+    if fb is None or (fb.width, fb.height) != (width, height):
+        fb = Framebuffer(width, height)
+        CONTEXT = SoftGL(fb)
+        PIXELS_PER_UNIT = max(width, height) / 500.0
+        WINDOW_SIZE = (width, height)
+        install(CONTEXT, globals(), vars(clock))
+        STATIC_LISTS.clear()   # display lists belong to the previous context
+        clock.invalidate_static()
+        LAYER_IMAGES.clear()   # and so do the layer images
+        DAMAGE.invalidate()    # and what is on screen
+
+    if start is not None:
+        # The pendulum swings relative to clock.start_time
+        clock.start_time = start
+    ANIMATION_TIME = t
+    CLOCK_TIME = clock.start_time + t
+
+    myInit()
+    display()
+    return fb
+
+
+def headless_main(argv):
+    """
+    Command-line entry for headless rendering.
+
+    Usage: main.py --headless out.png [--frame N] [--count K] [--size WxH] [--fps F] [--damage]
+    With --count, consecutive frames are rendered and the path may contain
+    a %d-style field for the frame number (e.g. frames/city_%04d.png).
+    Frame N shows the scene N / F seconds in, so --frame seeks directly.
+    Prints the achieved frames per second and the per-frame circle LOD and
+    culling counts. --profile TRACE.json also times every display() section,
+    prints a per-section table and writes a Chrome trace; --overlay draws
+    the profiler's frame-time graph into the images. --damage renders the
+    frames one over the other, redrawing only the damaged rectangles, and
+    reports the fraction of pixels that were redrawn.
+    """
+    parser = argparse.ArgumentParser(description="Render the city scene without a display.")
+    parser.add_argument("--headless", metavar="PATH", required=True,
+                        help="output image (.png or .ppm)")
+    parser.add_argument("--frame", type=int, default=0, help="first frame number")
+    parser.add_argument("--count", type=int, default=1, help="number of frames")
+    parser.add_argument("--size", default="1000x1000", help="image size as WxH")
+    parser.add_argument("--start", type=float, default=None,
+                        help="clock timestamp of frame 0 (default: now)")
+    parser.add_argument("--fps", type=float, default=1000.0 / FRAME_INTERVAL_MS,
+                        help="frame rate of the sequence (default: the 15 ms timer's)")
+    parser.add_argument("--profile", metavar="TRACE", default=None,
+                        help="profile display() sections and write a Chrome trace JSON")
+    parser.add_argument("--overlay", action="store_true",
+                        help="draw the profiler's frame-time graph over the scene")
+    parser.add_argument("--damage", action="store_true",
+                        help="redraw only the rectangles around moving objects after the first frame")
+    args = parser.parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split("x"))
+
+    global SHOW_PROFILE, DAMAGE_TRACKING
+    SHOW_PROFILE = args.overlay
+    DAMAGE_TRACKING = args.damage
+    if args.profile or args.overlay:
+        PROFILER.enable(globals(), vars(clock))
+
+    begin = time.perf_counter()
+    busy = 0.0
+    LOD_STATS.reset()
+    CULL_STATS.reset()
+    DAMAGE_STATS.reset()
+    for frame in range(args.frame, args.frame + args.count):
+        t0 = time.perf_counter()
+        fb = render_frame(frame, width, height, args.start, args.fps)
+        busy += time.perf_counter() - t0
+        path = args.headless % frame if "%" in args.headless else args.headless
+        fb.save(path)
+    total = time.perf_counter() - begin
+    print("%d frame(s) at %dx%d: %.1f fps rendering, %.1f fps including saving"
+          % (args.count, width, height, args.count / busy, args.count / total))
+    drawn, fixed = LOD_STATS.reset()
+    print("circle LOD: %d vertices per frame instead of %d (%d saved)"
+          % (drawn / args.count, fixed / args.count, (fixed - drawn) / args.count))
+    drawn, culled = CULL_STATS.reset()
+    print("culling: %d moving primitives drawn, %d culled per frame"
+          % (drawn / args.count, culled / args.count))
+    touched, total = DAMAGE_STATS.reset()
+    print("damage: %.1f%% of the pixels redrawn per frame" % (100.0 * touched / total))
+    if args.profile:
+        print_profile()
+        PROFILER.save_trace(args.profile)
+        print("trace of the last %d frame(s) written to %s" % (len(PROFILER.frames), args.profile))
+
 
 def main():
     """
     Entry point for the composite graphics scene.
 
     Creates a GLUT window, initializes the projection, registers display
-    and timer callbacks, and enters the event loop.
+    and timer callbacks, and enters the event loop. With --headless the
+    scene is rendered to image files instead (see headless_main).
     """
+    if "--headless" in sys.argv:
+        headless_main(sys.argv[1:])
+        return
+
     glutInit(sys.argv)
     glutInitDisplayMode(GLUT_SINGLE | GLUT_RGB)
     glutInitWindowSize(1000, 1000)
@@ -986,6 +1570,8 @@ def main():
     glutCreateWindow(b"Computer Graphics Project")
     myInit()
     glutDisplayFunc(display)
+    glutReshapeFunc(reshape)
+    glutKeyboardFunc(keyboard)
     glutTimerFunc(25, update, 0)
     glutMainLoop()
 
@@ -0,0 +1,73 @@
+"""
+Shared rasterization routines for the lab scripts.
+
+The Lab and practice programs import from here instead of carrying their
+own copies of the line, circle and ellipse algorithms. Every routine
+returns plain pixel coordinates, so the callers stay free to submit them
+to OpenGL (or any other target) however they like.
+
+raster.recorder is not re-exported: it also runs as a script
+(python -m raster.recorder), which must not find it already imported.
+"""
+
+from raster.clip import (
+    BOTTOM,
+    CULL_STATS,
+    DAMAGE_STATS,
+    INSIDE,
+    LEFT,
+    RIGHT,
+    TOP,
+    DamageTracker,
+    clip_steps,
+    cohenSutherland,
+    liangBarsky,
+    liangBarsky_batch,
+    liangBarsky_params,
+    merge_rects,
+    outcode,
+    rect_area,
+    rect_intersect,
+    rect_union,
+    rects_overlap,
+    window_rect,
+)
+from raster.line import (
+    Bresenham,
+    Bresenham_batch,
+    DDA,
+    DDA_batch,
+    find_zone,
+    from_zone0,
+    line_spans,
+    midPoint,
+    midPointDoubleStep,
+    spans_to_pixels,
+    to_zone0,
+)
+from raster.circle import (
+    HALF_PLANES,
+    LOD_STATS,
+    OCTANT_CACHE,
+    MidpointArc,
+    MidpointCircle,
+    OctantCache,
+    circle_fan,
+    circle_octant,
+    circle_offsets,
+    circle_ring,
+    lod_segments,
+    ring_angles,
+    unit_circle,
+)
+from raster.ellipse import (
+    ELLIPSE_CACHE,
+    MidpointEllipse,
+    ellipse_outline,
+    ellipse_quadrant,
+    ellipse_spans,
+)
+from raster.framebuffer import Framebuffer, headless_path, rgba
+from raster.profiler import PROFILER, FrameProfiler
+from raster.softgl import SoftGL, install
+from raster.stats import FrameCounter
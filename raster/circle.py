@@ -0,0 +1,325 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from raster.stats import FrameCounter
+
+
+def circle_octant(radius):
+    """
+    Midpoint circle decision walk for the octant from (0, r) to the diagonal.
+
+    Parameters:
+    - radius: Circle radius
+
+    Returns a (k, 2) int32 array of the (x, y) offsets visited, starting at
+    (0, radius), exactly as the Lab3 MidpointCircle loop visits them.
+
+    The practice scripts' own copies looped while x <= y. That extra step
+    changes the pixel set only for radii 0, 4, 11, 134 and 373 (checked up
+    to radius 2000), none of which the scenes draw.
+    """
+    d = 1 - radius
+    x = 0
+    y = radius
+    points = [(x, y)]
+    while x < y:
+        if d < 0:
+            d = d + 2 * x + 3
+            x = x + 1
+        else:
+            d = d + 2 * x - 2 * y + 5
+            x = x + 1
+            y = y - 1
+        points.append((x, y))
+    return np.array(points, dtype=np.int32)
+
+
+def circle_offsets(radius):
+    """
+    8-way symmetric offsets of a circle of the given radius around (0, 0).
+
+    Returns a (k * 8, 2) int32 array: for every octant step (x, y) the eight
+    points (x, y), (y, x), (y, -x), (x, -y), (-x, -y), (-y, -x), (-y, x),
+    (-x, y), in the same order Circlepoints used to emit them.
+    """
+    xs, ys = circle_octant(radius).T
+    offsets = np.stack([
+        np.stack([xs, ys], axis=1),
+        np.stack([ys, xs], axis=1),
+        np.stack([ys, -xs], axis=1),
+        np.stack([xs, -ys], axis=1),
+        np.stack([-xs, -ys], axis=1),
+        np.stack([-ys, -xs], axis=1),
+        np.stack([-ys, xs], axis=1),
+        np.stack([-xs, ys], axis=1),
+    ], axis=1)
+    return offsets.reshape(-1, 2)
+
+
+def circle_ring(radius):
+    """
+    Every boundary pixel of the circle exactly once, in angular order.
+
+    Returns an (n, 2) int32 array of offsets around (0, 0), counter-clockwise
+    starting at (radius, 0). It covers the same pixel set as circle_offsets(),
+    but it drops the copies that plain 8-way symmetry emits on the axes
+    (x == 0) and on the diagonals (x == y). It also drops the step that
+    crosses the diagonal, since that step only mirrors the previous pixel.
+    """
+    walk = circle_octant(radius)
+    if radius == 0:
+        return walk
+    walk = walk[walk[:, 0] <= walk[:, 1]]
+    xs, ys = walk.T
+
+    # Arcs walked away from an axis use the steps in order. Arcs walked
+    # towards an axis run backwards and leave out their last point (the next
+    # arc's axis point) and, if the walk ends exactly on the diagonal, their
+    # first point (already emitted by the previous arc).
+    stop = len(walk) - 1 if xs[-1] == ys[-1] else len(walk)
+    bx, by = xs[1:stop][::-1], ys[1:stop][::-1]
+
+    arcs = [
+        (ys, xs),     # 0..45 degrees
+        (bx, by),     # 45..90
+        (-xs, ys),    # 90..135
+        (-by, bx),    # 135..180
+        (-ys, -xs),   # 180..225
+        (-bx, -by),   # 225..270
+        (xs, -ys),    # 270..315
+        (by, -bx),    # 315..360
+    ]
+    ring = np.empty((sum(len(ax) for ax, _ in arcs), 2), dtype=np.int32)
+    start = 0
+    for ax, ay in arcs:
+        ring[start:start + len(ax), 0] = ax
+        ring[start:start + len(ax), 1] = ay
+        start += len(ax)
+    return ring
+
+
+def ring_angles(radius):
+    """
+    Angle of every circle_ring() pixel in degrees, in [0, 360), ascending.
+    """
+    ring = circle_ring(radius)
+    return np.degrees(np.arctan2(ring[:, 1], ring[:, 0])) % 360.0
+
+
+def unit_circle(segments):
+    """
+    Vertices of a regular polygon inscribed in the unit circle.
+
+    Returns a (segments + 1, 2) float64 array of (cos t, sin t) for
+    t = 2 * pi * i / segments, i = 0..segments; the last row repeats the
+    first, so the ring is closed. This is the only place the GL circle
+    helpers evaluate trig, and the result is cached per segment count.
+    """
+    t = np.arange(segments + 1) * (2.0 * np.pi / segments)
+    ring = np.stack([np.cos(t), np.sin(t)], axis=1)
+    ring[-1] = ring[0]
+    return ring
+
+
+# Half-planes through the center as (start, end) angle ranges for
+# MidpointArc. The ranges are inclusive, so "upper" (y >= y0) keeps both
+# pixels on the horizontal axis, just like a "y >= y0" filter does.
+HALF_PLANES = {
+    "upper": (0.0, 180.0),    # y >= y0
+    "lower": (180.0, 360.0),  # y <= y0
+    "left": (90.0, 270.0),    # x <= x0
+    "right": (270.0, 450.0),  # x >= x0
+}
+
+
+class OctantCache:
+    """
+    LRU cache of circle offset arrays keyed by radius, bounded by memory.
+
+    offsets(), ring() and angles() hold circle_offsets(), circle_ring() and
+    ring_angles() arrays. get(build, *params) caches any other builder of a
+    read-only array the same way (the ellipse code uses it); all entries
+    share the same memory budget.
+
+    Parameters:
+    - max_bytes: Upper bound on the total size of the cached arrays. The least
+      recently used entries are dropped first; a single array larger than the
+      cap is returned but never stored.
+
+    hits / misses count lookups, which makes the cache easy to check from a
+    scene that redraws the same radii every frame.
+    """
+
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def offsets(self, radius):
+        return self.get(circle_offsets, radius)
+
+    def ring(self, radius):
+        return self.get(circle_ring, radius)
+
+    def angles(self, radius):
+        return self.get(ring_angles, radius)
+
+    def get(self, build, *params):
+        key = (build.__name__,) + params
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = build(*params)
+        entry.flags.writeable = False   # shared between callers
+        if entry.nbytes <= self.max_bytes:
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            self._evict()
+        return entry
+
+    def resize(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _evict(self):
+        while self.nbytes > self.max_bytes:
+            _, old = self._entries.popitem(last=False)
+            self.nbytes -= old.nbytes
+
+
+# Shared by every MidpointCircle call unless a cache is passed explicitly
+OCTANT_CACHE = OctantCache()
+
+
+def MidpointCircle(radius, x0, y0, cache=None, unique=False):
+    """
+    Midpoint circle algorithm with 8-way symmetry around (x0, y0).
+
+    Parameters:
+    - radius: Circle radius
+    - x0, y0: Circle center
+    - cache: OctantCache to use (defaults to the shared OCTANT_CACHE)
+    - unique: Emit every pixel once in angular order (see circle_ring)
+      instead of the raw 8 points per step
+
+    Returns an (n, 2) array of points (int32 for integer centers). The
+    offsets only depend on the radius, so they come from the cache and
+    placing the circle is a single vectorized add.
+    """
+    cache = OCTANT_CACHE if cache is None else cache
+    offsets = cache.ring(radius) if unique else cache.offsets(radius)
+    center = np.array((x0, y0))
+    if center.dtype.kind in "iu":
+        center = center.astype(np.int32)
+    return offsets + center
+
+
+def MidpointArc(radius, x0, y0, start=0.0, end=360.0, half=None, cache=None):
+    """
+    The part of a midpoint circle between two angles.
+
+    Parameters:
+    - radius: Circle radius
+    - x0, y0: Circle center
+    - start, end: Arc from start counter-clockwise to end, in degrees
+      (0 = +x axis); both ends inclusive, and end may wrap past 360
+    - half: One of HALF_PLANES ("upper", "lower", "left", "right") instead of
+      start/end
+    - cache: OctantCache to use (defaults to the shared OCTANT_CACHE)
+
+    Returns an (n, 2) array of the arc's pixels, each once, in
+    counter-clockwise order from start. half="upper" gives exactly the
+    pixels of a full circle filtered with "y >= y0", and so on.
+
+    The ring is already sorted by angle, so the arc is one or two slices of
+    it found by binary search. Pixels outside the arc are never touched.
+    """
+    if half is not None:
+        start, end = HALF_PLANES[half]
+
+    cache = OCTANT_CACHE if cache is None else cache
+    ring = cache.ring(radius)
+    center = np.array((x0, y0))
+    if center.dtype.kind in "iu":
+        center = center.astype(np.int32)
+
+    sweep = end - start
+    if radius == 0 or sweep >= 360.0:
+        return ring + center
+
+    angles = cache.angles(radius)
+    start = start % 360.0
+    lo = np.searchsorted(angles, start, side="left")
+    if start + sweep < 360.0:
+        hi = np.searchsorted(angles, start + sweep, side="right")
+        return ring[lo:hi] + center
+
+    # The arc wraps through 0 degrees: tail of the ring, then its head
+    hi = np.searchsorted(angles, start + sweep - 360.0, side="right")
+    return np.concatenate((ring[lo:], ring[:hi])) + center
+
+
+def circle_fan(cx, cy, rx, ry=None, segments=64, cache=None):
+    """
+    Triangle-fan vertices of a circle or axis-aligned ellipse.
+
+    Parameters:
+    - cx, cy: Center
+    - rx, ry: Radii along X and Y (ry defaults to rx)
+    - segments: Number of rim segments
+    - cache: OctantCache holding the unit_circle() tables (defaults to the
+      shared OCTANT_CACHE)
+
+    Returns a (segments + 2, 2) float64 array: the center, then the closed
+    rim counter-clockwise from angle 0. Drawing it with glDrawArrays gives
+    the same fan as the usual cos/sin glVertex loop, built with one
+    vectorized scale and translate.
+    """
+    cache = OCTANT_CACHE if cache is None else cache
+    ring = cache.get(unit_circle, segments)
+    fan = np.empty((segments + 2, 2))
+    fan[0] = (cx, cy)
+    np.multiply(ring, (rx, rx if ry is None else ry), out=fan[1:])
+    fan[1:] += (cx, cy)
+    return fan
+
+
+def lod_segments(radius, tolerance=0.25, min_segments=8, max_segments=720):
+    """
+    Fewest polygon segments that keep a circle within tolerance pixels.
+
+    Parameters:
+    - radius: On-screen radius in pixels
+    - tolerance: Largest allowed gap between a chord and the arc (the
+      sagitta r * (1 - cos(pi / n))), in pixels
+    - min_segments, max_segments: Bounds on the result
+
+    Returns the segment count, rounded up to a multiple of 4 so the fan
+    keeps the vertices on both axes. An 8-pixel wheel gets 16 segments
+    instead of 360, while big circles stay smooth.
+    """
+    if radius <= tolerance:
+        return min_segments
+    n = math.ceil(math.pi / math.acos(1.0 - tolerance / radius))
+    n = -(-n // 4) * 4
+    return min(max(n, min_segments), max_segments)
+
+
+# Shared by the scenes that tessellate with lod_segments(): vertices drawn
+# and the vertices their old fixed tessellation took
+LOD_STATS = FrameCounter("drawn", "fixed")
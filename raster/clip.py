@@ -0,0 +1,313 @@
+import math
+
+import numpy as np
+
+from raster.stats import FrameCounter
+
+
+# Rectangles are (xmin, ymin, xmax, ymax), inclusive on every side, so a
+# pixel (x, y) is visible when xmin <= x <= xmax and ymin <= y <= ymax.
+
+# Cohen–Sutherland region codes
+INSIDE = 0
+LEFT = 1
+RIGHT = 2
+BOTTOM = 4
+TOP = 8
+
+
+def window_rect(width, height):
+    """
+    Pixel rectangle covered by a gluOrtho2D(0, width, 0, height) window.
+    """
+    return (0, 0, width - 1, height - 1)
+
+
+def outcode(x, y, rect):
+    """
+    Cohen–Sutherland region code of point (x, y) against rect.
+    """
+    xmin, ymin, xmax, ymax = rect
+    code = INSIDE
+    if x < xmin:
+        code |= LEFT
+    elif x > xmax:
+        code |= RIGHT
+    if y < ymin:
+        code |= BOTTOM
+    elif y > ymax:
+        code |= TOP
+    return code
+
+
+def cohenSutherland(x1, y1, x2, y2, rect):
+    """
+    Cohen–Sutherland line clipping.
+
+    Parameters:
+    - x1, y1: Start point
+    - x2, y2: End point
+    - rect: (xmin, ymin, xmax, ymax) clip rectangle
+
+    Returns the clipped (x1, y1, x2, y2) as floats, or None if the segment
+    lies completely outside. The direction of the segment is kept.
+    """
+    xmin, ymin, xmax, ymax = rect
+    x1, y1, x2, y2 = float(x1), float(y1), float(x2), float(y2)
+    code1 = outcode(x1, y1, rect)
+    code2 = outcode(x2, y2, rect)
+
+    while True:
+        if not (code1 | code2):
+            return x1, y1, x2, y2
+        if code1 & code2:
+            return None
+
+        # Move the endpoint that is outside onto the boundary it crosses
+        code = code1 or code2
+        if code & TOP:
+            x = x1 + (x2 - x1) * (ymax - y1) / (y2 - y1)
+            y = ymax
+        elif code & BOTTOM:
+            x = x1 + (x2 - x1) * (ymin - y1) / (y2 - y1)
+            y = ymin
+        elif code & RIGHT:
+            y = y1 + (y2 - y1) * (xmax - x1) / (x2 - x1)
+            x = xmax
+        else:
+            y = y1 + (y2 - y1) * (xmin - x1) / (x2 - x1)
+            x = xmin
+
+        if code == code1:
+            x1, y1 = x, y
+            code1 = outcode(x1, y1, rect)
+        else:
+            x2, y2 = x, y
+            code2 = outcode(x2, y2, rect)
+
+
+def liangBarsky_params(x1, y1, x2, y2, rect):
+    """
+    Parameter range of the segment inside rect (Liang–Barsky).
+
+    Returns (t0, t1) with 0 <= t0 <= t1 <= 1 such that P(t) = P1 + t * (P2 - P1)
+    is inside rect exactly for t0 <= t <= t1, or None if no part of the
+    segment is inside.
+    """
+    xmin, ymin, xmax, ymax = rect
+    dx = x2 - x1
+    dy = y2 - y1
+    t0, t1 = 0.0, 1.0
+
+    for p, q in ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1)):
+        if p == 0:
+            # Parallel to this boundary: either fully outside or no limit
+            if q < 0:
+                return None
+            continue
+        r = q / p
+        if p < 0:
+            if r > t1:
+                return None
+            t0 = max(t0, r)
+        else:
+            if r < t0:
+                return None
+            t1 = min(t1, r)
+
+    return t0, t1
+
+
+def liangBarsky(x1, y1, x2, y2, rect):
+    """
+    Liang–Barsky line clipping.
+
+    Parameters:
+    - x1, y1: Start point
+    - x2, y2: End point
+    - rect: (xmin, ymin, xmax, ymax) clip rectangle
+
+    Returns the clipped (x1, y1, x2, y2) as floats, or None if the segment
+    lies completely outside. Same result as cohenSutherland(), but with one
+    pass over the four boundaries instead of repeated intersections.
+    """
+    params = liangBarsky_params(x1, y1, x2, y2, rect)
+    if params is None:
+        return None
+    t0, t1 = params
+    dx = x2 - x1
+    dy = y2 - y1
+    return x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy
+
+
+def liangBarsky_batch(segments, rect):
+    """
+    Vectorized Liang–Barsky clipping for many segments at once.
+
+    Parameters:
+    - segments: (N, 4) array-like of (x1, y1, x2, y2) endpoints
+    - rect: (xmin, ymin, xmax, ymax) clip rectangle
+
+    Returns (clipped, visible):
+    - clipped: (N, 4) float64 array of clipped endpoints (rows of hidden
+      segments are left as they were)
+    - visible: (N,) bool array, False for segments completely outside
+
+    clipped[visible] can go straight to DDA_batch().
+    """
+    seg = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    xmin, ymin, xmax, ymax = rect
+    x1, y1, x2, y2 = seg.T
+    dx = x2 - x1
+    dy = y2 - y1
+
+    p = np.stack([-dx, dx, -dy, dy], axis=1)
+    q = np.stack([x1 - xmin, xmax - x1, y1 - ymin, ymax - y1], axis=1)
+
+    parallel = p == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = q / np.where(parallel, 1.0, p)
+    t0 = np.max(np.where(p < 0, r, 0.0), axis=1, initial=0.0)
+    t1 = np.min(np.where(p > 0, r, 1.0), axis=1, initial=1.0)
+
+    visible = (t0 <= t1) & ~np.any(parallel & (q < 0), axis=1)
+    clipped = seg.copy()
+    clipped[visible] = np.stack([
+        x1 + t0 * dx, y1 + t0 * dy, x1 + t1 * dx, y1 + t1 * dy,
+    ], axis=1)[visible]
+    return clipped, visible
+
+
+def clip_steps(x1, y1, x2, y2, dx, rect):
+    """
+    Range of zone-0 steps of an integer line walk that can land inside rect.
+
+    Parameters:
+    - x1, y1, x2, y2: Segment endpoints (integers)
+    - dx: Number of steps of the walk (the zone-0 major-axis delta)
+    - rect: (xmin, ymin, xmax, ymax) clip rectangle
+
+    Returns (first, last) step indices, or None if no pixel can be visible.
+    Step i sits exactly on the line along the major axis and within half a
+    pixel of it along the minor axis, so the segment is clipped against rect
+    grown by 0.5 and the range is rounded outwards. The walkers still test
+    each pixel of the range, which keeps the visible pixels identical to an
+    unclipped walk.
+    """
+    xmin, ymin, xmax, ymax = rect
+    grown = (xmin - 0.5, ymin - 0.5, xmax + 0.5, ymax + 0.5)
+    params = liangBarsky_params(x1, y1, x2, y2, grown)
+    if params is None:
+        return None
+    t0, t1 = params
+    first = max(0, math.floor(t0 * dx))
+    last = min(dx, math.ceil(t1 * dx))
+    return first, last
+
+
+def rects_overlap(a, b):
+    """
+    True when rectangles a and b share at least one point.
+
+    Both are (xmin, ymin, xmax, ymax), inclusive like the clip rectangles,
+    so rectangles that only touch along an edge still overlap.
+    """
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def rect_union(a, b):
+    """
+    Smallest rectangle containing both a and b.
+    """
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def rect_intersect(a, b):
+    """
+    Overlap of rectangles a and b; it is empty (rect_area 0) when they
+    do not overlap.
+    """
+    return (max(a[0], b[0]), max(a[1], b[1]), min(a[2], b[2]), min(a[3], b[3]))
+
+
+def rect_area(rect):
+    """
+    Number of pixels in an inclusive (xmin, ymin, xmax, ymax) rectangle.
+    """
+    return max(rect[2] - rect[0] + 1, 0) * max(rect[3] - rect[1] + 1, 0)
+
+
+def merge_rects(rects):
+    """
+    Merge overlapping rectangles into their bounding rectangles.
+
+    Returns a list in which no two rectangles overlap; together they cover
+    every input rectangle. A merged rectangle can reach a third one it did
+    not touch before, so merging repeats until nothing overlaps.
+    """
+    merged = []
+    for rect in rects:
+        rect = tuple(rect)
+        i = 0
+        while i < len(merged):
+            if rects_overlap(rect, merged[i]):
+                rect = rect_union(rect, merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+class DamageTracker:
+    """
+    Dirty rectangles of the moving objects of an animated scene.
+
+    Every frame, mark(key, rect, state) reports where one moving object is
+    drawn (rect is None while it is culled) and what it looks like (any
+    comparable value, e.g. its animation offset). damage() then closes the
+    frame and returns the rectangles to redraw: the previous and current
+    rectangles of every object whose rect or state changed, merged where
+    they overlap. Right after creation or invalidate() there is no previous
+    frame to compare with, and damage() returns None for a full redraw.
+    """
+
+    def __init__(self):
+        self.previous = None
+        self.current = {}
+
+    def mark(self, key, rect, state=None):
+        self.current[key] = (None if rect is None else tuple(rect), state)
+
+    def invalidate(self):
+        self.previous = None
+
+    def rect(self, key):
+        """
+        Rectangle of key in the frame the last damage() closed (None if it
+        was culled or not marked).
+        """
+        return (self.previous or {}).get(key, (None, None))[0]
+
+    def damage(self):
+        previous, current = self.previous, self.current
+        self.previous = current
+        self.current = {}
+        if previous is None:
+            return None
+        rects = []
+        for key in previous.keys() | current.keys():
+            old = previous.get(key, (None, None))
+            new = current.get(key, (None, None))
+            if old != new:
+                rects.extend(rect for rect, _ in (old, new) if rect is not None)
+        return merge_rects(rects)
+
+
+# Shared by the scenes that cull their moving objects: primitives of the
+# objects drawn and of those skipped
+CULL_STATS = FrameCounter("drawn", "culled")
+
+# Shared by the scenes that redraw only their damaged rectangles: pixels
+# redrawn out of the frames' total
+DAMAGE_STATS = FrameCounter("touched", "total")
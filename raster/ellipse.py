@@ -0,0 +1,131 @@
+import numpy as np
+
+from raster.circle import OctantCache
+
+
+def ellipse_quadrant(rx, ry):
+    """
+    Integer midpoint ellipse walk for the first quadrant.
+
+    Parameters:
+    - rx, ry: Semi-axes along X and Y (integers)
+
+    Returns a (k, 2) int32 array of (x, y) offsets from (0, ry) to (rx, 0).
+    Both region decision variables are kept multiplied by 4, so the usual
+    1/4 and 1/2 terms stay integers.
+    """
+    rx, ry = int(rx), int(ry)
+    if ry == 0:
+        return np.stack([np.arange(rx + 1), np.zeros(rx + 1, dtype=np.int64)], axis=1).astype(np.int32)
+
+    rx2 = rx * rx
+    ry2 = ry * ry
+    x = 0
+    y = ry
+    points = []
+
+    # Region 1: slope above -1, x always steps
+    d = 4 * ry2 - 4 * rx2 * ry + rx2
+    while ry2 * x < rx2 * y:
+        points.append((x, y))
+        x += 1
+        if d < 0:
+            d += 4 * ry2 * (2 * x + 1)
+        else:
+            y -= 1
+            d += 4 * ry2 * (2 * x + 1) - 8 * rx2 * y
+
+    # Region 2: slope below -1, y always steps
+    d = ry2 * (2 * x + 1) * (2 * x + 1) + 4 * rx2 * (y - 1) * (y - 1) - 4 * rx2 * ry2
+    while y >= 0:
+        points.append((x, y))
+        y -= 1
+        if d > 0:
+            d += 4 * rx2 - 8 * rx2 * y
+        else:
+            x += 1
+            d += 8 * ry2 * x - 8 * rx2 * y + 4 * rx2
+
+    # A flat ellipse can leave region 2 before its y = 0 row reaches the tip
+    last_x = points[-1][0]
+    points.extend((tip_x, 0) for tip_x in range(last_x + 1, rx + 1))
+
+    return np.array(points, dtype=np.int32)
+
+
+def ellipse_outline(rx, ry):
+    """
+    Every boundary pixel of the ellipse exactly once, in angular order.
+
+    Returns an (n, 2) int32 array of offsets around (0, 0), counter-clockwise
+    starting at (rx, 0), like circle_ring() does for circles.
+    """
+    rx, ry = int(rx), int(ry)
+    if rx == 0 or ry == 0:
+        # Degenerate ellipse: a single horizontal or vertical segment
+        span = np.arange(-max(rx, ry), max(rx, ry) + 1)
+        flat = np.zeros_like(span)
+        pairs = (span, flat) if ry == 0 else (flat, span)
+        return np.stack(pairs, axis=1).astype(np.int32)
+
+    xs, ys = ellipse_quadrant(rx, ry).T
+    # The quadrant ends in a run of y = 0 pixels (one long for round
+    # ellipses), which mirroring across the X axis would repeat
+    run = int(np.count_nonzero(ys == 0))
+    arcs = [
+        (xs[::-1], ys[::-1]),                # (rx, 0) -> (0, ry)
+        (-xs[1:], ys[1:]),                   # -> (-rx, 0)
+        (-xs[::-1][run:], -ys[::-1][run:]),  # -> (0, -ry)
+        (xs[1:-run], -ys[1:-run]),           # -> just before the y = 0 run
+    ]
+    return np.concatenate([np.stack(arc, axis=1) for arc in arcs]).astype(np.int32)
+
+
+def ellipse_spans(rx, ry):
+    """
+    Filled ellipse as horizontal runs.
+
+    Returns a (2 * ry + 1, 3) int32 array of (x, y, length) offsets, one run
+    per row from y = -ry to y = ry, in the same format as line_spans().
+    """
+    rx, ry = int(rx), int(ry)
+    quadrant = ellipse_quadrant(rx, ry)
+    half_width = np.zeros(ry + 1, dtype=np.int64)
+    np.maximum.at(half_width, quadrant[:, 1], quadrant[:, 0])
+
+    rows = np.arange(-ry, ry + 1)
+    widths = half_width[np.abs(rows)]
+    spans = np.empty((len(rows), 3), dtype=np.int32)
+    spans[:, 0] = -widths
+    spans[:, 1] = rows
+    spans[:, 2] = 2 * widths + 1
+    return spans
+
+
+# Ellipse geometry only depends on (rx, ry); shared by every call
+ELLIPSE_CACHE = OctantCache()
+
+
+def MidpointEllipse(rx, ry, x0, y0, filled=False, cache=None):
+    """
+    Integer midpoint ellipse around (x0, y0).
+
+    Parameters:
+    - rx, ry: Semi-axes along X and Y (integers)
+    - x0, y0: Ellipse center
+    - filled: Return horizontal (x, y, length) runs covering the inside
+      instead of the outline pixels
+    - cache: OctantCache to use (defaults to the shared ELLIPSE_CACHE)
+
+    Returns the outline as an (n, 2) array (see ellipse_outline) or the fill
+    as a (2 * ry + 1, 3) span array (see ellipse_spans). The geometry is
+    cached per (rx, ry); placing it is one vectorized add.
+    """
+    cache = ELLIPSE_CACHE if cache is None else cache
+    center = np.array((x0, y0))
+    if center.dtype.kind in "iu":
+        center = center.astype(np.int32)
+    if filled:
+        spans = cache.get(ellipse_spans, int(rx), int(ry))
+        return spans + np.append(center, 0).astype(center.dtype)
+    return cache.get(ellipse_outline, int(rx), int(ry)) + center
@@ -0,0 +1,292 @@
+import struct
+import zlib
+
+import numpy as np
+
+from raster.circle import MidpointCircle
+from raster.clip import window_rect
+from raster.line import Bresenham, spans_to_pixels
+
+
+class Framebuffer:
+    """
+    Software render target backed by an (H, W, 4) uint8 RGBA array.
+
+    Coordinates follow the labs' gluOrtho2D(0, width, 0, height) setup:
+    (0, 0) is the bottom-left pixel and row y of `pixels` is window row y.
+    Colors are (r, g, b) or (r, g, b, a) tuples of 0..255 ints, like
+    glColor3ub. Everything is written with vectorized fancy indexing, and
+    anything outside the buffer is dropped, so the rasterizers' output can
+    go in unchanged without a GL context.
+
+    `clip` is the (xmin, ymin, xmax, ymax) pixel rectangle, inclusive, that
+    every write (clear() included) is limited to, like a GL scissor box. It
+    covers the whole buffer unless set_clip() narrows it.
+    """
+
+    def __init__(self, width, height, clear_color=(0, 0, 0)):
+        self.width = width
+        self.height = height
+        self.clear_color = rgba(clear_color)
+        self.pixels = np.empty((height, width, 4), dtype=np.uint8)
+        self.clip = window_rect(width, height)
+        self.clear()
+
+    def set_clip(self, rect=None):
+        """
+        Limit writes to rect (xmin, ymin, xmax, ymax), inclusive and cut to
+        the buffer; None restores the whole buffer.
+        """
+        full = window_rect(self.width, self.height)
+        if rect is None:
+            self.clip = full
+            return
+        xmin, ymin, xmax, ymax = (int(v) for v in rect)
+        self.clip = (max(xmin, 0), max(ymin, 0), min(xmax, full[2]), min(ymax, full[3]))
+
+    def region(self, rect=None):
+        """
+        View of the pixels inside rect (default: the clip rectangle), for
+        copying a part of the buffer out or back in.
+        """
+        xmin, ymin, xmax, ymax = self.clip if rect is None else rect
+        return self.pixels[max(ymin, 0):ymax + 1, max(xmin, 0):xmax + 1]
+
+    def clear(self, color=None):
+        self.region()[:] = self.clear_color if color is None else rgba(color)
+
+    def plot(self, points, color, size=1):
+        """
+        Set pixels to color.
+
+        Parameters:
+        - points: (n, 2) array-like of (x, y) pixels
+        - color: Pixel color
+        - size: Square point size in pixels, like glPointSize
+
+        Returns the number of pixels written (after dropping the ones
+        outside the buffer or the clip rectangle).
+        """
+        pts = np.asarray(points).reshape(-1, 2)
+        if pts.dtype.kind == "f":
+            pts = np.rint(pts)
+        pts = pts.astype(np.int64)
+        if size > 1:
+            # Same footprint a GL point of this size covers around the vertex
+            d = np.arange(-(size // 2), size - size // 2)
+            grid = np.stack(np.meshgrid(d, d), axis=-1).reshape(-1, 2)
+            pts = (pts[:, None, :] + grid[None, :, :]).reshape(-1, 2)
+
+        xmin, ymin, xmax, ymax = self.clip
+        inside = ((pts[:, 0] >= xmin) & (pts[:, 0] <= xmax)
+                  & (pts[:, 1] >= ymin) & (pts[:, 1] <= ymax))
+        pts = pts[inside]
+        self.pixels[pts[:, 1], pts[:, 0]] = rgba(color)
+        return len(pts)
+
+    def fill_spans(self, spans, color, vertical=False):
+        """
+        Fill (x, y, length) runs, as returned by line_spans() or
+        ellipse_spans(). Returns the number of pixels written.
+        """
+        return self.plot(spans_to_pixels(spans, vertical), color)
+
+    def line(self, x1, y1, x2, y2, color, size=1):
+        """
+        Bresenham line, clipped to the clip rectangle before it is walked.
+        """
+        return self.plot(Bresenham(x1, y1, x2, y2, clip=self.clip), color, size)
+
+    def circle(self, radius, x0, y0, color, size=1):
+        """
+        Midpoint circle outline around (x0, y0).
+        """
+        return self.plot(MidpointCircle(radius, x0, y0, unique=True), color, size)
+
+    def fill_polygon(self, vertices, color):
+        """
+        Scanline fill of a simple or self-intersecting polygon (even-odd rule).
+
+        Parameters:
+        - vertices: (n, 2) array-like of corners, in order; the last one
+          connects back to the first
+        - color: Fill color
+
+        Returns the number of pixels written. See polygon_spans() for the
+        pixels that are covered.
+        """
+        return self.fill_spans(self.polygon_spans(vertices), color)
+
+    def polygon_spans(self, vertices):
+        """
+        Pixels inside a polygon as (x, y, length) runs, clipped to the clip
+        rectangle.
+
+        Every row is sampled at its integer y and the pixels with
+        a <= x < b are covered for each pair (a, b) of edge crossings. All rows
+        and edges are intersected at once; each edge counts on [ymin, ymax),
+        so polygons sharing an edge or a vertex never cover a pixel twice.
+        """
+        v = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+        if len(v) < 3:
+            return np.empty((0, 3), dtype=np.int32)
+        x0, y0 = v[:, 0], v[:, 1]
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+
+        xmin, ymin, xmax, ymax = self.clip
+        lo = max(int(np.ceil(v[:, 1].min())), ymin)
+        hi = min(int(np.floor(v[:, 1].max())), ymax)
+        if lo > hi:
+            return np.empty((0, 3), dtype=np.int32)
+        rows = np.arange(lo, hi + 1, dtype=np.float64)[:, None]
+
+        crosses = (np.minimum(y0, y1) <= rows) & (rows < np.maximum(y0, y1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xs = x0 + (rows - y0) * (x1 - x0) / (y1 - y0)
+        xs = np.sort(np.where(crosses, xs, np.inf), axis=1)
+
+        # Crossings pair up left to right: (xs[0], xs[1]), (xs[2], xs[3]), ...
+        left = xs[:, 0::2]
+        right = xs[:, 1::2]
+        left = left[:, :right.shape[1]]
+        valid = np.isfinite(right)
+        start = np.maximum(np.ceil(left[valid]), xmin)
+        end = np.minimum(np.ceil(right[valid]) - 1, xmax)
+        y = np.broadcast_to(rows, valid.shape)[valid]
+
+        keep = end >= start
+        spans = np.stack([start[keep], y[keep], end[keep] - start[keep] + 1], axis=1)
+        return spans.astype(np.int32)
+
+    def fill_triangles(self, triangles, colors):
+        """
+        Scanline fill of many flat-colored triangles at once.
+
+        Parameters:
+        - triangles: (N, 3, 2) array-like of corners
+        - colors: (N, 3) or (N, 4) array-like of 0..255 colors, one per triangle
+
+        Returns the number of pixels written. Every triangle covers exactly
+        the pixels fill_polygon() would give it, and where triangles overlap
+        the later one wins, so the result matches filling them one by one.
+        All rows of all triangles are intersected in a single pass.
+        """
+        t = np.asarray(triangles, dtype=np.float64).reshape(-1, 3, 2)
+        colors = np.asarray(colors).reshape(len(t), -1)
+        xmin, ymin, xmax, ymax = self.clip
+        ys = t[:, :, 1]
+        lo = np.maximum(np.ceil(ys.min(axis=1)), ymin).astype(np.int64)
+        hi = np.minimum(np.floor(ys.max(axis=1)), ymax).astype(np.int64)
+        counts = np.maximum(hi - lo + 1, 0)
+
+        # One entry per (triangle, row)
+        owner = np.repeat(np.arange(len(t)), counts)
+        rows = (lo[owner] + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts))
+        rows = rows.astype(np.float64)[:, None]
+        x0, y0 = t[owner, :, 0], t[owner, :, 1]
+        x1, y1 = np.roll(x0, -1, axis=1), np.roll(y0, -1, axis=1)
+
+        # Same edge rule as polygon_spans(): a row meets exactly two edges
+        crosses = (np.minimum(y0, y1) <= rows) & (rows < np.maximum(y0, y1))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            xs = x0 + (rows - y0) * (x1 - x0) / (y1 - y0)
+        xs = np.sort(np.where(crosses, xs, np.inf), axis=1)
+        valid = np.isfinite(xs[:, 1])
+        start = np.maximum(np.ceil(xs[valid, 0]), xmin).astype(np.int64)
+        end = np.minimum(np.ceil(xs[valid, 1]) - 1, xmax).astype(np.int64)
+        keep = end >= start
+        spans = np.stack([start[keep], rows[valid, 0][keep].astype(np.int64),
+                          (end - start + 1)[keep]], axis=1)
+        pixels = spans_to_pixels(spans)
+        if len(pixels) == 0:
+            return 0
+        which = np.repeat(owner[valid][keep], spans[:, 2])
+
+        # Painter's order: keep the last write of every pixel
+        index = pixels[:, 1].astype(np.int64) * self.width + pixels[:, 0]
+        _, last = np.unique(index[::-1], return_index=True)
+        last = len(index) - 1 - last
+        rgba_colors = np.full((len(colors), 4), 255, dtype=np.uint8)
+        rgba_colors[:, :colors.shape[1]] = colors
+        self.pixels[pixels[last, 1], pixels[last, 0]] = rgba_colors[which[last]]
+        return len(last)
+
+    def image(self, alpha=False):
+        """
+        Top-down copy of the buffer for saving: (H, W, 3) RGB, or RGBA with alpha.
+        """
+        return np.ascontiguousarray(self.pixels[::-1, :, :4 if alpha else 3])
+
+    def ppm_bytes(self):
+        """
+        The buffer as a binary (P6) PPM file, in memory.
+        """
+        return b"P6\n%d %d\n255\n" % (self.width, self.height) + self.image().tobytes()
+
+    def png_bytes(self, level=6):
+        """
+        The buffer as an 8-bit RGBA PNG file, in memory (zlib from the
+        standard library; level is the zlib compression level).
+        """
+        raw = np.zeros((self.height, 1 + 4 * self.width), dtype=np.uint8)
+        raw[:, 1:] = self.image(alpha=True).reshape(self.height, -1)   # filter 0 per row
+
+        def chunk(kind, data):
+            body = kind + data
+            return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+        return b"".join([
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", struct.pack(">IIBBBBB", self.width, self.height, 8, 6, 0, 0, 0)),
+            chunk(b"IDAT", zlib.compress(raw.tobytes(), level)),
+            chunk(b"IEND", b""),
+        ])
+
+    def encode(self, path):
+        """
+        File contents for path: a .ppm or, for anything else, a .png.
+        """
+        return self.ppm_bytes() if path.lower().endswith(".ppm") else self.png_bytes()
+
+    def save_ppm(self, path):
+        """
+        Write the buffer as a binary (P6) PPM.
+        """
+        with open(path, "wb") as f:
+            f.write(self.ppm_bytes())
+
+    def save_png(self, path):
+        """
+        Write the buffer as an 8-bit RGBA PNG.
+        """
+        with open(path, "wb") as f:
+            f.write(self.png_bytes())
+
+    def save(self, path):
+        """
+        Write a .ppm or .png, picked by the file extension.
+        """
+        with open(path, "wb") as f:
+            f.write(self.encode(path))
+
+
+def rgba(color):
+    """
+    (r, g, b) or (r, g, b, a) in 0..255 -> 4-element uint8 array.
+    """
+    c = np.full(4, 255, dtype=np.uint8)
+    c[:len(color)] = color
+    return c
+
+
+def headless_path(argv):
+    """
+    Output path of a "--headless <image>" command-line option, or None.
+
+    The lab scripts use it to render into a Framebuffer and save an image
+    instead of opening a GLUT window.
+    """
+    if "--headless" not in argv:
+        return None
+    i = argv.index("--headless")
+    return argv[i + 1] if i + 1 < len(argv) else "frame.png"
@@ -0,0 +1,554 @@
+import math
+
+import numpy as np
+
+from raster.clip import clip_steps
+
+
+def DDA(x0, y0, x1, y1):
+    """
+    Digital Differential Analyzer line algorithm for a single segment.
+
+    Parameters:
+    - x0, y0: Start point (int or float)
+    - x1, y1: End point (int or float)
+
+    Returns a list of (x, y) integer tuples, one per step.
+    """
+    points = []
+
+    dx = x1 - x0
+    dy = y1 - y0
+    steps = int(max(abs(dx), abs(dy)))
+
+    if steps == 0:
+        # Single point (degenerate line)
+        points.append((int(round(x0)), int(round(y0))))
+        return points
+
+    x_inc = dx / float(steps)
+    y_inc = dy / float(steps)
+
+    x = float(x0)
+    y = float(y0)
+
+    for _ in range(steps + 1):
+        points.append((int(round(x)), int(round(y))))
+        x += x_inc
+        y += y_inc
+
+    return points
+
+
+def DDA_batch(segments):
+    """
+    Vectorized DDA for many segments at once.
+
+    Parameters:
+    - segments: (N, 4) array-like of (x0, y0, x1, y1) endpoints (int or float)
+
+    Returns (pixels, offsets):
+    - pixels: (total, 2) int32 array with every segment's pixels packed back to back
+    - offsets: (N + 1,) int64 array; segment i is pixels[offsets[i]:offsets[i + 1]]
+
+    The output matches DDA() pixel-for-pixel. DDA() accumulates x_inc/y_inc
+    step by step, so the positions are produced with a row-wise cumsum (which
+    adds sequentially, exactly like the scalar loop) rather than x0 + i * x_inc.
+    Segments are grouped into power-of-two length buckets so the padded
+    cumsum grid never wastes more than half its cells.
+    """
+    seg = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    x0, y0, x1, y1 = seg.T
+
+    dx = x1 - x0
+    dy = y1 - y0
+    steps = np.trunc(np.maximum(np.abs(dx), np.abs(dy))).astype(np.int64)
+    counts = steps + 1
+
+    offsets = np.zeros(len(seg) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    pixels = np.empty((offsets[-1], 2), dtype=np.int32)
+    if len(seg) == 0:
+        return pixels, offsets
+
+    # Degenerate segments keep steps == 0 and only ever use column 0
+    safe_steps = np.maximum(steps, 1)
+    x_inc = dx / safe_steps
+    y_inc = dy / safe_steps
+
+    widths = np.left_shift(1, np.ceil(np.log2(counts)).astype(np.int64))
+    for width in np.unique(widths):
+        rows = np.nonzero(widths == width)[0]
+
+        gx = np.empty((len(rows), width))
+        gy = np.empty((len(rows), width))
+        gx[:, 0] = x0[rows]
+        gy[:, 0] = y0[rows]
+        gx[:, 1:] = x_inc[rows, None]
+        gy[:, 1:] = y_inc[rows, None]
+        np.cumsum(gx, axis=1, out=gx)
+        np.cumsum(gy, axis=1, out=gy)
+
+        cols = np.arange(width)
+        valid = cols < counts[rows, None]
+        dest = (offsets[rows, None] + cols)[valid]
+        pixels[dest, 0] = np.rint(gx[valid])
+        pixels[dest, 1] = np.rint(gy[valid])
+
+    return pixels, offsets
+
+
+# ---------- Midpoint line (all 8 zones) ----------
+
+# Linear maps (a, b, c, d) meaning (x, y) -> (a*x + b*y, c*x + d*y).
+# ZONE_TO_0 reflects/swaps a zone onto zone 0 (dx >= dy >= 0) and
+# ZONE_FROM_0 is its inverse.
+ZONE_TO_0 = (
+    (1, 0, 0, 1),     # 0: ( x,  y)
+    (0, 1, 1, 0),     # 1: ( y,  x)
+    (0, 1, -1, 0),    # 2: ( y, -x)
+    (-1, 0, 0, 1),    # 3: (-x,  y)
+    (-1, 0, 0, -1),   # 4: (-x, -y)
+    (0, -1, -1, 0),   # 5: (-y, -x)
+    (0, -1, 1, 0),    # 6: (-y,  x)
+    (1, 0, 0, -1),    # 7: ( x, -y)
+)
+
+ZONE_FROM_0 = (
+    (1, 0, 0, 1),     # 0: ( x,  y)
+    (0, 1, 1, 0),     # 1: ( y,  x)
+    (0, -1, 1, 0),    # 2: (-y,  x)
+    (-1, 0, 0, 1),    # 3: (-x,  y)
+    (-1, 0, 0, -1),   # 4: (-x, -y)
+    (0, -1, -1, 0),   # 5: (-y, -x)
+    (0, 1, -1, 0),    # 6: ( y, -x)
+    (1, 0, 0, -1),    # 7: ( x, -y)
+)
+
+# Zone-0 E step (1, 0) and NE step (1, 1) mapped back into each zone, so the
+# walk can move in the original coordinates and never transform a pixel.
+ZONE_STEPS = tuple(
+    ((a, c), (a + b, c + d)) for (a, b, c, d) in ZONE_FROM_0
+)
+
+
+def find_zone(x1, y1, x2, y2):
+    """
+    Determine which of the 8 zones (octants) the line (x1,y1)->(x2,y2) lies in.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    if abs(dx) >= abs(dy):
+        if dx >= 0 and dy >= 0:
+            return 0
+        elif dx < 0 and dy >= 0:
+            return 3
+        elif dx < 0 and dy < 0:
+            return 4
+        else:
+            return 7
+    else:
+        if dx >= 0 and dy >= 0:
+            return 1
+        elif dx < 0 and dy >= 0:
+            return 2
+        elif dx < 0 and dy < 0:
+            return 5
+        else:
+            return 6
+
+
+def to_zone0(x, y, zone):
+    """
+    Map a point from the given zone into zone 0.
+    """
+    a, b, c, d = ZONE_TO_0[zone]
+    return a * x + b * y, c * x + d * y
+
+
+def from_zone0(x, y, zone):
+    """
+    Map a zone-0 point back to the given zone (inverse of to_zone0).
+    """
+    a, b, c, d = ZONE_FROM_0[zone]
+    return a * x + b * y, c * x + d * y
+
+
+def midPoint(x1, y1, x2, y2, clip=None):
+    """
+    Midpoint line algorithm (integer decision variable) for all 8 zones.
+
+    Parameters:
+    - x1, y1: Start point
+    - x2, y2: End point
+    - clip: Optional (xmin, ymin, xmax, ymax) rectangle; only the pixels
+      inside it are returned (integer endpoints only)
+
+    Returns a list of (x, y) points from (x1, y1) to (x2, y2).
+
+    The decision variable runs on the zone-0 deltas, while the position
+    advances directly in the original zone using the precomputed E / NE
+    steps from ZONE_STEPS. This gives exactly the pixels of the classic
+    "walk in zone 0, then map every point back" version.
+
+    With clip, the walk starts at the first step that can reach the
+    rectangle (see clip_steps) and stops after the last one. Before step i
+    the decision variable is 2*dy*(i + 1) - dx*(2*y_i + 1), so it is set
+    up directly instead of walking the hidden part of the line.
+    """
+    if clip is not None:
+        return _midPoint_clipped(int(x1), int(y1), int(x2), int(y2), clip)
+
+    zone = find_zone(x1, y1, x2, y2)
+    dx, dy = to_zone0(x2 - x1, y2 - y1, zone)
+    (ex, ey), (nex, ney) = ZONE_STEPS[zone]
+
+    d = 2 * dy - dx
+    E = 2 * dy
+    NE = 2 * (dy - dx)
+
+    x, y = x1, y1
+    points = [(x, y)]
+
+    # Same iteration count as "while x < nx2" stepping x by 1 in zone 0
+    for _ in range(max(0, math.ceil(dx))):
+        if d < 0:
+            d += E
+            x += ex
+            y += ey
+        else:
+            d += NE
+            x += nex
+            y += ney
+        points.append((x, y))
+
+    return points
+
+
+def _midPoint_clipped(x1, y1, x2, y2, clip):
+    zone = find_zone(x1, y1, x2, y2)
+    dx, dy = to_zone0(x2 - x1, y2 - y1, zone)
+    (ex, ey), (nex, ney) = ZONE_STEPS[zone]
+    xmin, ymin, xmax, ymax = clip
+
+    steps = clip_steps(x1, y1, x2, y2, dx, clip)
+    if steps is None:
+        return []
+    first, last = steps
+
+    # Zone-0 state at step `first`, from the closed form used by Bresenham()
+    j = (2 * dy * first + dx) // max(2 * dx, 1)
+    d = 2 * dy * (first + 1) - dx * (2 * j + 1)
+    E = 2 * dy
+    NE = 2 * (dy - dx)
+
+    x = x1 + ex * first + (nex - ex) * j
+    y = y1 + ey * first + (ney - ey) * j
+    points = []
+    for _ in range(first, last + 1):
+        if xmin <= x <= xmax and ymin <= y <= ymax:
+            points.append((x, y))
+        if d < 0:
+            d += E
+            x += ex
+            y += ey
+        else:
+            d += NE
+            x += nex
+            y += ney
+
+    return points
+
+
+# Zone-0 rise (0 = E, 1 = NE) of the two pixels chosen by each double-step
+# pattern: E-E, E-NE, NE-E, NE-NE
+DOUBLE_STEP_RISES = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.int64)
+
+
+def midPointDoubleStep(x1, y1, x2, y2):
+    """
+    Double-step midpoint line (Wu/Rokne style) for all 8 zones.
+
+    Parameters:
+    - x1, y1: Start point (integers)
+    - x2, y2: End point (integers)
+
+    Returns an (n, 2) int32 array holding the same pixels as midPoint().
+
+    Each decision-variable update picks the pattern of the next two pixels
+    (E-E, E-NE, NE-E or NE-NE), and the line is walked from both ends at
+    once, so one loop iteration decides four pixels. The walk from the far
+    end mirrors the near one; it breaks ties the other way (d > 0 instead of
+    d >= 0), which for an integer d is the same walk started from d - 1.
+    The loop only records pattern codes; the coordinates are then built in
+    one go with a cumsum over the per-pixel rises, like Bresenham().
+    """
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    zone = find_zone(x1, y1, x2, y2)
+    dx, dy = to_zone0(x2 - x1, y2 - y1, zone)
+    (ex, ey), (nex, ney) = ZONE_STEPS[zone]
+
+    # Thresholds and increments for one double step
+    low = -2 * dy
+    high = 2 * (dx - dy)
+    inc_ee = 4 * dy
+    inc_mixed = 4 * dy - 2 * dx
+    inc_nn = 4 * (dy - dx)
+
+    # Double steps taken from each end; at most 3 pixels are left between
+    pairs = max(0, (dx - 1) // 4)
+    front = [0] * pairs
+    back = [0] * pairs
+    df = 2 * dy - dx
+    db = df - 1
+
+    for k in range(pairs):
+        if df < 0:
+            if df < low:
+                df += inc_ee
+            else:
+                front[k] = 1
+                df += inc_mixed
+        elif df < high:
+            front[k] = 2
+            df += inc_mixed
+        else:
+            front[k] = 3
+            df += inc_nn
+
+        if db < 0:
+            if db < low:
+                db += inc_ee
+            else:
+                back[k] = 1
+                db += inc_mixed
+        elif db < high:
+            back[k] = 2
+            db += inc_mixed
+        else:
+            back[k] = 3
+            db += inc_nn
+
+    # rise[i] = y_i - y_(i-1) in zone 0
+    rise = np.zeros(dx + 1, dtype=np.int64)
+    lo = 2 * pairs
+    hi = dx - 2 * pairs
+    rise[1:lo + 1] = DOUBLE_STEP_RISES[front].ravel()
+    # The back walk goes dx -> dx-1 -> ..., so its rises land in reverse
+    rise[hi + 1:] = DOUBLE_STEP_RISES[back].ravel()[::-1]
+
+    # Single steps across the gap in the middle (front walk continues)
+    for i in range(lo, hi):
+        if df < 0:
+            df += 2 * dy
+        else:
+            rise[i + 1] = 1
+            df += 2 * (dy - dx)
+
+    i = np.arange(dx + 1, dtype=np.int64)
+    j = np.cumsum(rise)
+    points = np.empty((dx + 1, 2), dtype=np.int32)
+    points[:, 0] = x1 + ex * i + (nex - ex) * j
+    points[:, 1] = y1 + ey * i + (ney - ey) * j
+    return points
+
+
+def Bresenham(x1, y1, x2, y2, clip=None):
+    """
+    Integer Bresenham line for all 8 zones.
+
+    Parameters:
+    - x1, y1: Start point (integers)
+    - x2, y2: End point (integers)
+    - clip: Optional (xmin, ymin, xmax, ymax) rectangle; only the pixels
+      inside it are returned
+
+    Returns an (n, 2) int32 array with n = max(|dx|, |dy|) + 1, allocated
+    once up front. Nothing is kept between calls, so it is safe to call again
+    for every redraw.
+
+    In zone 0 the Bresenham decision sequence has the closed form
+    y_i = floor((2*dy*i + dx) / (2*dx)) (round half up, matching the
+    "d >= 0 -> NE" tie rule), so the whole segment is produced with integer
+    array arithmetic and mapped back using ZONE_STEPS. The pixels are
+    identical to midPoint().
+
+    Because any step can be computed on its own, clipping only evaluates
+    the steps from clip_steps() instead of the whole segment.
+    """
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    zone = find_zone(x1, y1, x2, y2)
+    dx, dy = to_zone0(x2 - x1, y2 - y1, zone)
+    (ex, ey), (nex, ney) = ZONE_STEPS[zone]
+
+    first, last = 0, dx
+    if clip is not None:
+        steps = clip_steps(x1, y1, x2, y2, dx, clip)
+        if steps is None:
+            return np.empty((0, 2), dtype=np.int32)
+        first, last = steps
+
+    i = np.arange(first, last + 1, dtype=np.int64)
+    j = (2 * dy * i + dx) // max(2 * dx, 1)
+
+    points = np.empty((len(i), 2), dtype=np.int32)
+    points[:, 0] = x1 + ex * i + (nex - ex) * j
+    points[:, 1] = y1 + ey * i + (ney - ey) * j
+    if clip is not None:
+        xmin, ymin, xmax, ymax = clip
+        inside = ((points[:, 0] >= xmin) & (points[:, 0] <= xmax)
+                  & (points[:, 1] >= ymin) & (points[:, 1] <= ymax))
+        points = points[inside]
+    return points
+
+
+def Bresenham_batch(segments):
+    """
+    Vectorized Bresenham() for many segments at once.
+
+    Parameters:
+    - segments: (N, 4) array-like of integer (x1, y1, x2, y2) endpoints
+
+    Returns (pixels, offsets) laid out like DDA_batch(): segment i is
+    pixels[offsets[i]:offsets[i + 1]], identical to Bresenham() for it.
+    The zone of every segment is found at once, and all steps of all
+    segments come from the same closed form in one pass, so there is no
+    per-segment Python work.
+    """
+    seg = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    x1, y1, x2, y2 = seg.T
+    dx = x2 - x1
+    dy = y2 - y1
+
+    # find_zone() for every segment
+    up = dy >= 0
+    right = dx >= 0
+    zone = np.where(
+        np.abs(dx) >= np.abs(dy),
+        np.where(up, np.where(right, 0, 3), np.where(right, 7, 4)),
+        np.where(up, np.where(right, 1, 2), np.where(right, 6, 5)),
+    )
+    a, b, c, d = np.array(ZONE_TO_0)[zone].T
+    zdx = a * dx + b * dy
+    zdy = c * dx + d * dy
+    steps = np.array(ZONE_STEPS)[zone]      # (N, 2, 2): E and NE steps
+
+    counts = zdx + 1
+    offsets = np.zeros(len(seg) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    def each(values):
+        # Per-segment values stretched to one entry per step
+        return np.repeat(values, counts)
+
+    i = np.arange(offsets[-1]) - each(offsets[:-1])
+    j = (each(2 * zdy) * i + each(zdx)) // each(np.maximum(2 * zdx, 1))
+
+    (ex, ey), (nex, ney) = steps[:, 0].T, steps[:, 1].T
+    pixels = np.empty((len(i), 2), dtype=np.int32)
+    pixels[:, 0] = each(x1) + each(ex) * i + each(nex - ex) * j
+    pixels[:, 1] = each(y1) + each(ey) * i + each(ney - ey) * j
+    return pixels, offsets
+
+
+# ---------- Span (run-length) output ----------
+
+def line_spans(x1, y1, x2, y2, clip=None):
+    """
+    Run-slice line rasterization: the line as runs of pixels instead of pixels.
+
+    Parameters:
+    - x1, y1: Start point (integers)
+    - x2, y2: End point (integers)
+    - clip: Optional (xmin, ymin, xmax, ymax) rectangle; runs are trimmed
+      to it and runs outside it are dropped
+
+    Returns (spans, vertical):
+    - spans: (k, 3) int32 array of (x, y, length) runs, in order along the line
+    - vertical: False if every run goes right from (x, y) (x-major line),
+      True if every run goes up from (x, y) (y-major line)
+
+    The runs cover exactly the pixels of midPoint() / Bresenham(). A line
+    with |dx| >= |dy| has |dy| + 1 runs, so the output shrinks by roughly the
+    slope ratio. A framebuffer can fill each run with one slice assignment.
+    """
+    x1, y1, x2, y2 = int(x1), int(y1), int(x2), int(y2)
+    zone = find_zone(x1, y1, x2, y2)
+    dx, dy = to_zone0(x2 - x1, y2 - y1, zone)
+    (ex, ey), (nex, ney) = ZONE_STEPS[zone]
+
+    first, last = 0, dx
+    if clip is not None:
+        steps = clip_steps(x1, y1, x2, y2, dx, clip)
+        if steps is None:
+            return np.empty((0, 3), dtype=np.int32), ex == 0
+        first, last = steps
+
+    # Zone-0 run k holds every step i with y_i == k. It starts at the first
+    # i where floor((2*dy*i + dx) / (2*dx)) reaches k, i.e. at
+    # ceil((2k - 1) * dx / (2 * dy)).
+    k_first = (2 * dy * first + dx) // max(2 * dx, 1)
+    k_last = (2 * dy * last + dx) // max(2 * dx, 1)
+    k = np.arange(k_first, k_last + 1, dtype=np.int64)
+    starts = np.empty(len(k), dtype=np.int64)
+    starts[0] = first
+    starts[1:] = -((-(2 * k[1:] - 1) * dx) // (2 * dy))
+    ends = np.empty(len(k), dtype=np.int64)
+    ends[:-1] = starts[1:] - 1
+    ends[-1] = last
+
+    spans = np.empty((len(k), 3), dtype=np.int32)
+    spans[:, 2] = ends - starts + 1
+    vertical = ex == 0
+    if vertical:
+        # Runs step along y (ey = +-1); the cross axis moves by nex per run
+        spans[:, 0] = x1 + nex * k
+        spans[:, 1] = y1 + starts if ey > 0 else y1 - ends
+    else:
+        spans[:, 0] = x1 + starts if ex > 0 else x1 - ends
+        spans[:, 1] = y1 + ney * k
+    if clip is not None:
+        spans = _clip_spans(spans, vertical, clip)
+    return spans, vertical
+
+
+def _clip_spans(spans, vertical, clip):
+    xmin, ymin, xmax, ymax = clip
+    # Work in (along, across) so both run directions share the code
+    along, across = (1, 0) if vertical else (0, 1)
+    lo, hi = (ymin, ymax) if vertical else (xmin, xmax)
+    cross_lo, cross_hi = (xmin, xmax) if vertical else (ymin, ymax)
+
+    start = np.maximum(spans[:, along], lo)
+    end = np.minimum(spans[:, along] + spans[:, 2] - 1, hi)
+    keep = ((end >= start) & (spans[:, across] >= cross_lo)
+            & (spans[:, across] <= cross_hi))
+
+    clipped = spans[keep]
+    clipped[:, along] = start[keep]
+    clipped[:, 2] = (end - start + 1)[keep]
+    return clipped
+
+
+def spans_to_pixels(spans, vertical=False):
+    """
+    Expand (x, y, length) runs from line_spans() back into pixels.
+
+    Parameters:
+    - spans: (k, 3) array of runs
+    - vertical: Direction flag returned by line_spans()
+
+    Returns an (n, 2) int32 array. Runs come out in the order given, and each
+    run's pixels go left-to-right (or bottom-to-top).
+    """
+    spans = np.asarray(spans, dtype=np.int64).reshape(-1, 3)
+    lengths = spans[:, 2]
+    run = np.repeat(np.arange(len(spans)), lengths)
+    first = np.cumsum(lengths) - lengths
+    along = np.arange(lengths.sum()) - first[run]
+
+    pixels = np.empty((len(run), 2), dtype=np.int32)
+    pixels[:, 0] = spans[run, 0]
+    pixels[:, 1] = spans[run, 1]
+    pixels[:, 1 if vertical else 0] += along
+    return pixels
@@ -0,0 +1,275 @@
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import numpy as np
+
+
+# Shared do-nothing section, so a disabled profiler allocates nothing
+_NO_SECTION = nullcontext()
+
+# Section colors for the overlay (0..255 RGB), assigned in order of first use
+PALETTE = (
+    (230, 25, 75), (60, 180, 75), (255, 225, 25), (0, 130, 200),
+    (245, 130, 48), (145, 30, 180), (70, 240, 240), (240, 50, 230),
+    (210, 245, 60), (250, 190, 190), (0, 128, 128), (170, 110, 40),
+)
+
+
+class FrameProfiler:
+    """
+    Named-section profiler for a display() callback.
+
+    Wrap the parts of a frame in sections and bracket the frame itself:
+
+        PROFILER.begin_frame()
+        with PROFILER.section("sky"):
+            ...
+        PROFILER.end_frame()
+
+    Every section records its wall time and the number of GL calls made
+    inside it; the last `capacity` frames are kept in a ring buffer. The
+    data can be summarized (summary()), drawn as a frame-time graph
+    (overlay_triangles()) or written as Chrome trace JSON (chrome_trace(),
+    for chrome://tracing or Perfetto).
+
+    GL calls are counted by wrapping the gl* functions of the namespaces
+    passed to enable() (module globals, as with raster.softgl.install).
+    The wrappers are put back at every begin_frame(), so they survive a
+    later install(), and removed again by disable(). While disabled,
+    section() returns a shared no-op context manager and the frame calls
+    return at once, so the instrumented code costs almost nothing.
+    """
+
+    def __init__(self, capacity=120):
+        self.enabled = False
+        self.frames = deque(maxlen=capacity)
+        self.namespaces = []
+        self.calls = 0
+        self.frame = None          # sections of the frame in progress
+        self.frame_start = 0.0
+        self.frame_calls = 0
+        self.depth = 0
+        self.count = 0             # frames recorded so far
+        self.colors = {}
+
+    # ---------- Control ----------
+
+    def enable(self, *namespaces):
+        """
+        Start profiling; namespaces are the module dicts whose gl* calls to count.
+        """
+        self.enabled = True
+        self.namespaces = list(namespaces)
+
+    def disable(self):
+        """
+        Stop profiling and restore the original gl* functions. The recorded
+        frames are kept.
+        """
+        self.enabled = False
+        for namespace in self.namespaces:
+            for name, value in list(namespace.items()):
+                original = getattr(value, "profiled", None)
+                if original is not None:
+                    namespace[name] = original
+        self.namespaces = []
+        self.frame = None
+
+    def toggle(self, *namespaces):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(*namespaces)
+        return self.enabled
+
+    def clear(self):
+        self.frames.clear()
+        self.count = 0
+
+    # ---------- Recording ----------
+
+    def _instrument(self, namespace):
+        begin = namespace.get("glBegin")
+        if begin is None or hasattr(begin, "profiled"):
+            return
+        for name, value in list(namespace.items()):
+            if name.startswith("gl") and callable(value):
+                namespace[name] = self._counted(value)
+
+    def _counted(self, function):
+        def call(*args, **kwargs):
+            self.calls += 1
+            return function(*args, **kwargs)
+
+        call.__name__ = getattr(function, "__name__", "gl")
+        call.profiled = function
+        return call
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        for namespace in self.namespaces:
+            self._instrument(namespace)
+        self.frame = []
+        self.depth = 0
+        self.frame_calls = self.calls
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """
+        Close the frame and push it into the ring buffer as a dict with
+        "index", "start", "duration" (seconds), "calls" and "sections", a
+        list of (name, start, duration, calls, depth) tuples in the order the
+        sections ended (an inner section comes before the one around it).
+        """
+        if self.frame is None:
+            return
+        end = time.perf_counter()
+        self.frames.append({
+            "index": self.count,
+            "start": self.frame_start,
+            "duration": end - self.frame_start,
+            "calls": self.calls - self.frame_calls,
+            "sections": self.frame,
+        })
+        self.count += 1
+        self.frame = None
+
+    def section(self, name):
+        """
+        Context manager timing one named part of the frame. Sections may nest.
+        """
+        if self.frame is None:
+            return _NO_SECTION
+        return _Section(self, name)
+
+    # ---------- Reporting ----------
+
+    def color(self, name):
+        if name not in self.colors:
+            self.colors[name] = PALETTE[len(self.colors) % len(PALETTE)]
+        return self.colors[name]
+
+    def summary(self):
+        """
+        Per-section statistics over the buffered frames.
+
+        Returns a list of (name, mean ms, max ms, mean GL calls) per section
+        in order of first appearance, followed by ("frame", ...) for whole
+        frames. Times of a section that runs several times in a frame add up.
+        """
+        totals = {}
+        for frame in self.frames:
+            per_frame = {}
+            for name, _, duration, calls, _ in frame["sections"]:
+                t, c = per_frame.get(name, (0.0, 0))
+                per_frame[name] = (t + duration, c + calls)
+            per_frame["frame"] = (frame["duration"], frame["calls"])
+            for name, (duration, calls) in per_frame.items():
+                totals.setdefault(name, []).append((duration, calls))
+
+        rows = []
+        for name, samples in totals.items():
+            durations = np.array([s[0] for s in samples]) * 1000.0
+            calls = np.array([s[1] for s in samples])
+            rows.append((name, durations.sum() / len(self.frames), durations.max(),
+                         calls.sum() / len(self.frames)))
+        rows.sort(key=lambda row: row[0] == "frame")
+        return rows
+
+    def chrome_trace(self):
+        """
+        The buffered frames as a Chrome trace (the JSON object format).
+
+        Every frame and section is a complete ("X") event with its GL call
+        count in args; timestamps are microseconds of time.perf_counter().
+        """
+        pid = os.getpid()
+        events = []
+        for frame in self.frames:
+            events.append({
+                "name": "frame %d" % frame["index"], "cat": "frame", "ph": "X",
+                "ts": frame["start"] * 1e6, "dur": frame["duration"] * 1e6,
+                "pid": pid, "tid": 0, "args": {"gl_calls": frame["calls"]},
+            })
+            for name, start, duration, calls, depth in frame["sections"]:
+                events.append({
+                    "name": name, "cat": "section", "ph": "X",
+                    "ts": start * 1e6, "dur": duration * 1e6,
+                    "pid": pid, "tid": 0, "args": {"gl_calls": calls, "depth": depth},
+                })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_trace(self, path):
+        with open(path, "w") as f:
+            json.dump(self.chrome_trace(), f)
+
+    def overlay_triangles(self, x, y, width, height, budget_ms=16.7):
+        """
+        Frame-time graph of the buffered frames as flat-colored triangles.
+
+        Parameters:
+        - x, y: Bottom-left corner of the graph, in the caller's coordinates
+        - width, height: Size of the graph; one column per buffered frame
+        - budget_ms: Frame budget, drawn as a white line
+
+        Returns (vertices, colors): (n, 2) float64 corners and (n, 3) uint8
+        colors, three rows per triangle, ready for glDrawArrays(GL_TRIANGLES).
+        Each column stacks the frame's top-level sections in their section
+        colors, on a dark background. The graph spans twice the budget, or
+        the slowest buffered frame if that took longer.
+        """
+        slowest = max((frame["duration"] * 1000.0 for frame in self.frames), default=0.0)
+        scale = height / max(2.0 * budget_ms, slowest)
+        column = width / float(self.frames.maxlen)
+        quads = [(x, y, x + width, y + height, (32, 32, 32))]
+        for i, frame in enumerate(self.frames):
+            left = x + i * column
+            bottom = 0.0
+            for name, _, duration, _, depth in frame["sections"]:
+                if depth:
+                    continue
+                top = min(bottom + duration * 1000.0 * scale, height)
+                if top > bottom:
+                    quads.append((left, y + bottom, left + column, y + top, self.color(name)))
+                bottom = top
+        line = max(height / 200.0, 0.5)
+        mark = y + budget_ms * scale
+        quads.append((x, mark - line, x + width, mark + line, (255, 255, 255)))
+
+        q = np.array([quad[:4] for quad in quads], dtype=np.float64)
+        x0, y0, x1, y1 = q.T
+        corners = np.stack([x0, y0, x1, y0, x1, y1, x0, y0, x1, y1, x0, y1], axis=1)
+        vertices = corners.reshape(-1, 2)
+        colors = np.repeat(np.array([quad[4] for quad in quads], dtype=np.uint8), 6, axis=0)
+        return vertices, colors
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "start", "calls")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        p = self.profiler
+        p.depth += 1
+        self.calls = p.calls
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        p = self.profiler
+        end = time.perf_counter()
+        p.depth -= 1
+        if p.frame is not None:
+            p.frame.append((self.name, self.start, end - self.start, p.calls - self.calls, p.depth))
+        return False
+
+
+# Shared by the scenes that profile their display()
+PROFILER = FrameProfiler()
@@ -0,0 +1,450 @@
+"""
+GL call recorder: a mock OpenGL/GLUT backend for GPU-free benchmarking.
+
+GLRecorder stands in for a GL context. Every gl*/glu*/glut* call made
+through it is appended to a compact in-memory command stream instead of
+being executed, frame by frame, and can be replayed later into a real
+context or into raster.softgl. mock_opengl() puts fake OpenGL.GL,
+OpenGL.GLU and OpenGL.GLUT modules in place, so an unmodified lab script
+runs without a display (or without PyOpenGL at all); its glutMainLoop()
+then renders a fixed number of frames and returns.
+
+From the repository root:
+
+    python -m raster.recorder Lab2/house.py --frames 100
+    python -m raster.recorder project/main.py --frames 60 --headless city.png
+"""
+import argparse
+import os
+import runpy
+import sys
+import time
+import types
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
+
+import numpy as np
+
+from raster.softgl import CONSTANTS as SOFTGL_CONSTANTS
+
+
+# GL enums for the mock modules: the ones raster.softgl knows plus the rest
+# the scripts use. Values match OpenGL.
+CONSTANTS = dict(
+    SOFTGL_CONSTANTS,
+    GL_QUAD_STRIP=0x0008,
+    GL_UNSIGNED_INT=0x1405,
+    GL_DEPTH_TEST=0x0B71,
+    GL_CULL_FACE=0x0B44,
+    GL_POINT_SMOOTH=0x0B10,
+    GL_LINE_SMOOTH=0x0B20,
+    GL_FLAT=0x1D00,
+    GL_SMOOTH=0x1D01,
+    GLUT_RGB=0,
+    GLUT_RGBA=0,
+    GLUT_SINGLE=0,
+    GLUT_DOUBLE=2,
+    GLUT_DEPTH=16,
+)
+
+# Functions the mock modules export for "from OpenGL.GL import *" and co.
+# Any other gl* name can still be looked up as an attribute.
+FUNCTIONS = (
+    "glBegin", "glEnd", "glVertex2d", "glVertex2f", "glVertex2i", "glVertex3d",
+    "glVertex3f", "glVertex3i", "glColor3ub", "glColor3f", "glColor3d", "glColor4f",
+    "glColor4ub", "glClear", "glClearColor", "glFlush", "glFinish", "glLineWidth",
+    "glPointSize", "glEnable", "glDisable", "glBlendFunc", "glShadeModel", "glHint",
+    "glViewport", "glScissor", "glMatrixMode", "glLoadIdentity", "glPushMatrix", "glPopMatrix",
+    "glTranslatef", "glTranslated", "glRotatef", "glRotated", "glScalef", "glScaled",
+    "glOrtho", "glFrustum", "glGenLists", "glNewList", "glEndList", "glCallList",
+    "glDeleteLists", "glEnableClientState", "glDisableClientState", "glVertexPointer",
+    "glColorPointer", "glDrawArrays", "glGenBuffers", "glBindBuffer", "glBufferData",
+    "glBufferSubData", "glDeleteBuffers",
+    "gluOrtho2D", "gluPerspective", "gluLookAt",
+    "glutInit", "glutInitDisplayMode", "glutInitWindowSize", "glutInitWindowPosition",
+    "glutCreateWindow", "glutDisplayFunc", "glutReshapeFunc", "glutKeyboardFunc",
+    "glutIdleFunc", "glutTimerFunc", "glutPostRedisplay", "glutSwapBuffers",
+    "glutMainLoop", "glutMainLoopEvent", "glutLeaveMainLoop",
+)
+
+# Calls counted as state changes in the frame statistics
+STATE_PREFIXES = (
+    "glColor", "glLineWidth", "glPointSize", "glEnable", "glDisable", "glBlendFunc",
+    "glShadeModel", "glHint", "glClearColor", "glViewport", "glScissor", "glMatrixMode",
+    "glLoadIdentity", "glPushMatrix", "glPopMatrix", "glTranslate", "glRotate", "glScale",
+    "glOrtho", "glFrustum", "gluOrtho2D", "gluPerspective", "gluLookAt", "glBindBuffer",
+)
+
+# Argument kinds in the stream
+FLOAT, INT, OBJECT = 0, 1, 2
+
+FrameStats = namedtuple("FrameStats", "calls vertices state_changes begin_end draws seconds")
+
+
+class GLRecorder:
+    """
+    Mock GL context that records calls into a command stream.
+
+    The stream is four flat arrays: one opcode (an index into `names`) and
+    one argument count per call, and one float64 value and one kind byte
+    per argument. Ints and floats are stored inline; anything else (vertex
+    arrays, callbacks, window titles) goes to `objects` and the stream keeps
+    its index. numpy arrays are copied, as glDrawArrays would read them
+    right away. A call costs a few dozen bytes instead of a Python tuple.
+
+    record_frame(display) marks one frame; frame_stats() counts its
+    vertices (glVertex* calls and glDrawArrays counts), state changes
+    (color, width, enable, matrix and projection calls), glBegin/glEnd
+    pairs and draw calls (glDrawArrays, glCallList). replay() sends a range
+    of the stream to any namespace of GL functions, e.g. vars(OpenGL.GL) or
+    raster.softgl.SoftGL(fb).namespace().
+
+    Calls that return something in GL return stand-ins here: glGenLists and
+    glGenBuffers hand out increasing ids, glutCreateWindow returns 1.
+    glutMainLoop() draws `loop_frames` frames through the registered
+    display callback (calling the reshape callback first and firing timer
+    and idle callbacks between frames) and returns.
+    """
+
+    def __init__(self, loop_frames=1):
+        self.ops = array("H")
+        self.argc = array("B")
+        self.args = array("d")
+        self.kinds = array("B")
+        self.objects = []
+        self.names = []
+        self.opcodes = {}
+        self.functions = {}
+        self.results = {}          # call index -> returned id (glGenLists, glGenBuffers)
+        self.frames = []           # (first call, end call, seconds) per frame
+        self.next_id = {"glGenLists": 1, "glGenBuffers": 1}
+        self.loop_frames = loop_frames
+        self.window_size = (300, 300)
+        self.callbacks = {}
+        self.timers = []
+        self.running = False
+
+    # ---------- Recording ----------
+
+    def function(self, name):
+        """
+        The recording stand-in for GL function `name`.
+        """
+        function = self.functions.get(name)
+        if function is not None:
+            return function
+        op = self.opcodes.setdefault(name, len(self.names))
+        if op == len(self.names):
+            self.names.append(name)
+        special = getattr(self, "_" + name, None)
+        ops, argc, values, kinds, objects = self.ops, self.argc, self.args, self.kinds, self.objects
+
+        def call(*args):
+            ops.append(op)
+            argc.append(len(args))
+            for arg in args:
+                if isinstance(arg, (float, np.floating)):
+                    values.append(arg)
+                    kinds.append(FLOAT)
+                elif isinstance(arg, (int, np.integer)):
+                    values.append(arg)
+                    kinds.append(INT)
+                else:
+                    if isinstance(arg, np.ndarray):
+                        arg = arg.copy()
+                    values.append(len(objects))
+                    kinds.append(OBJECT)
+                    objects.append(arg)
+            if special is not None:
+                return special(*args)
+
+        call.__name__ = name
+        self.functions[name] = call
+        return call
+
+    def namespace(self):
+        """
+        Recording functions for FUNCTIONS plus the GL_*/GLUT_* constants,
+        for install()-style rebinding of a module's globals.
+        """
+        names = {name: self.function(name) for name in FUNCTIONS}
+        names.update(CONSTANTS)
+        return names
+
+    def record_frame(self, display):
+        """
+        Run display() and mark the calls it made as one frame.
+        """
+        first = len(self.ops)
+        start = time.perf_counter()
+        display()
+        self.frames.append((first, len(self.ops), time.perf_counter() - start))
+
+    def clear(self):
+        for stream in (self.ops, self.argc, self.args, self.kinds):
+            del stream[:]
+        self.objects.clear()
+        self.results.clear()
+        self.frames.clear()
+
+    def nbytes(self):
+        """
+        Size of the command stream arrays (not counting `objects`).
+        """
+        return sum(a.itemsize * len(a) for a in (self.ops, self.argc, self.args, self.kinds))
+
+    # ---------- Stand-ins with results or control flow ----------
+
+    def _generate(self, kind, count):
+        first = self.next_id[kind]
+        self.next_id[kind] += count
+        self.results[len(self.ops) - 1] = first
+        return first
+
+    def _glGenLists(self, count):
+        return self._generate("glGenLists", count)
+
+    def _glGenBuffers(self, count):
+        first = self._generate("glGenBuffers", count)
+        return first if count == 1 else list(range(first, first + count))
+
+    def _glutCreateWindow(self, title):
+        return 1
+
+    def _glutInitWindowSize(self, width, height):
+        self.window_size = (width, height)
+
+    def _glutDisplayFunc(self, func):
+        self.callbacks["display"] = func
+
+    def _glutReshapeFunc(self, func):
+        self.callbacks["reshape"] = func
+
+    def _glutIdleFunc(self, func):
+        self.callbacks["idle"] = func
+
+    def _glutTimerFunc(self, msecs, func, value):
+        self.timers.append((func, value))
+
+    def _glutLeaveMainLoop(self):
+        self.running = False
+
+    def _glutMainLoop(self):
+        display = self.callbacks.get("display")
+        if display is None:
+            return
+        if "reshape" in self.callbacks:
+            self.callbacks["reshape"](*self.window_size)
+        self.running = True
+        for _ in range(self.loop_frames):
+            if not self.running:
+                break
+            self.record_frame(display)
+            timers, self.timers = self.timers, []
+            for func, value in timers:
+                func(value)
+            if self.callbacks.get("idle") is not None:
+                self.callbacks["idle"]()
+        self.running = False
+
+    # ---------- Reading the stream ----------
+
+    def calls(self, start=0, stop=None):
+        """
+        Iterate over (index, name, args) of the recorded calls in [start, stop).
+        """
+        stop = len(self.ops) if stop is None else stop
+        offsets = np.concatenate([[0], np.cumsum(self.argc, dtype=np.int64)])
+        for i in range(start, stop):
+            args = []
+            for j in range(offsets[i], offsets[i + 1]):
+                kind = self.kinds[j]
+                value = self.args[j]
+                if kind == FLOAT:
+                    args.append(value)
+                elif kind == INT:
+                    args.append(int(value))
+                else:
+                    args.append(self.objects[int(value)])
+            yield i, self.names[self.ops[i]], args
+
+    def frame_stats(self, frame):
+        """
+        FrameStats of recorded frame number `frame`.
+        """
+        first, end, seconds = self.frames[frame]
+        vertices = state = begins = draws = 0
+        for _, name, args in self.calls(first, end):
+            if name.startswith("glVertex") and name != "glVertexPointer":
+                vertices += 1
+            elif name == "glDrawArrays":
+                vertices += args[2]
+                draws += 1
+            elif name == "glCallList":
+                draws += 1
+            elif name == "glBegin":
+                begins += 1
+            elif name.startswith(STATE_PREFIXES):
+                state += 1
+        return FrameStats(end - first, vertices, state, begins, draws, seconds)
+
+    def replay(self, namespace, start=0, stop=None):
+        """
+        Execute recorded calls [start, stop) with the functions in namespace.
+
+        Display-list and buffer ids are mapped to the ones the target hands
+        out, so a stream recorded here replays into a fresh real context.
+        Returns the set of recorded names the namespace lacks; those calls
+        are skipped (e.g. window setup when replaying into raster.softgl).
+        """
+        # Lists and buffers are numbered separately (both from 1), so each
+        # gets its own map, keyed by the call that generated the ids
+        ids = {"glGenLists": {}, "glGenBuffers": {}}
+        lists, buffers = ids["glGenLists"], ids["glGenBuffers"]
+        missing = set()
+        for i, name, args in self.calls(start, stop):
+            function = namespace.get(name)
+            if function is None:
+                missing.add(name)
+                continue
+            if name in ("glNewList", "glCallList", "glDeleteLists"):
+                args[0] = lists.get(args[0], args[0])
+            elif name == "glBindBuffer":
+                args[1] = buffers.get(args[1], args[1])
+            elif name == "glDeleteBuffers":
+                recorded = np.ravel(args[1])[:args[0]]
+                args[1] = [buffers.get(int(buffer), int(buffer)) for buffer in recorded]
+            result = function(*args)
+            if i in self.results:
+                generated = ids[name]
+                for k in range(args[0]):
+                    generated[self.results[i] + k] = (result[k] if isinstance(result, (list, tuple))
+                                                      else result + k)
+        return missing
+
+
+def module_of(name):
+    """
+    Which of OpenGL.GL, OpenGL.GLU and OpenGL.GLUT exports name.
+    """
+    if name.startswith(("glut", "GLUT_")):
+        return "GLUT"
+    if name.startswith(("glu", "GLU_")):
+        return "GLU"
+    return "GL"
+
+
+def mock_modules(recorder):
+    """
+    Fake OpenGL, OpenGL.GL, OpenGL.GLU and OpenGL.GLUT modules backed by
+    recorder. "from OpenGL.GL import *" gets FUNCTIONS and the constants;
+    other gl* names are made on attribute access.
+    """
+    package = types.ModuleType("OpenGL")
+    package.__path__ = []
+    modules = {"OpenGL": package}
+    for sub in ("GL", "GLU", "GLUT"):
+        module = types.ModuleType("OpenGL." + sub)
+
+        def getattr_(name, sub=sub):
+            if name.startswith("gl") and module_of(name) == sub:
+                return recorder.function(name)
+            raise AttributeError(name)
+
+        module.__getattr__ = getattr_
+        setattr(package, sub, module)
+        modules["OpenGL." + sub] = module
+
+    for name, value in recorder.namespace().items():
+        setattr(modules["OpenGL." + module_of(name)], name, value)
+    for sub in ("GL", "GLU", "GLUT"):
+        module = modules["OpenGL." + sub]
+        module.__all__ = [name for name in vars(module) if name.startswith(("gl", "GL"))]
+    return modules
+
+
+@contextmanager
+def mock_opengl(recorder):
+    """
+    Make "import OpenGL.GL" and co. load the recorder's mock modules while
+    the block runs; the real modules (if any) are put back afterwards.
+    """
+    modules = mock_modules(recorder)
+    saved = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    try:
+        yield recorder
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+
+def run_script(path, frames=1, argv=()):
+    """
+    Run a lab script as __main__ against a fresh GLRecorder.
+
+    Parameters:
+    - path: Script to run; its folder is put on sys.path as Python would
+    - frames: Frames its glutMainLoop() renders before returning
+    - argv: Extra command-line arguments for the script
+
+    Returns the recorder. Modules the script imports are unloaded again
+    afterwards, so they see the real OpenGL on their next import.
+    """
+    recorder = GLRecorder(loop_frames=frames)
+    path = os.path.abspath(path)
+    loaded = set(sys.modules)
+    saved_argv, saved_path = sys.argv, list(sys.path)
+    sys.argv = [path] + list(argv)
+    sys.path.insert(0, os.path.dirname(path))
+    try:
+        with mock_opengl(recorder):
+            runpy.run_path(path, run_name="__main__")
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+        for name in set(sys.modules) - loaded:
+            del sys.modules[name]
+    return recorder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record the GL calls of a lab script "
+                                                 "without a display.")
+    parser.add_argument("script", help="script with a GLUT main loop, e.g. Lab2/house.py")
+    parser.add_argument("--frames", type=int, default=10, help="frames to record")
+    parser.add_argument("--headless", metavar="PATH", default=None,
+                        help="replay the stream into raster.softgl and save the last frame")
+    args, rest = parser.parse_known_args()
+
+    recorder = run_script(args.script, args.frames, rest)
+    if not recorder.frames:
+        print("%s drew no frames (no glutDisplayFunc/glutMainLoop?)" % args.script)
+        return
+    stats = [recorder.frame_stats(i) for i in range(len(recorder.frames))]
+    mean = FrameStats(*(sum(column) / len(stats) for column in zip(*stats)))
+    print("%s: %d frame(s) recorded, %d calls, %.1f KiB stream"
+          % (args.script, len(stats), len(recorder.ops), recorder.nbytes() / 1024.0))
+    print("per frame: %.0f calls, %.0f vertices, %.0f state changes, %.0f begin/end pairs, "
+          "%.0f draw calls, %.2f ms to record"
+          % (mean.calls, mean.vertices, mean.state_changes, mean.begin_end, mean.draws,
+             mean.seconds * 1000))
+
+    if args.headless:
+        from raster.framebuffer import Framebuffer
+        from raster.softgl import SoftGL
+
+        fb = Framebuffer(*recorder.window_size)
+        missing = recorder.replay(SoftGL(fb).namespace())
+        fb.save(args.headless)
+        print("replayed into %dx%d software GL -> %s" % (fb.width, fb.height, args.headless))
+        if missing:
+            print("skipped: %s" % ", ".join(sorted(missing)))
+
+
+if __name__ == "__main__":
+    main()
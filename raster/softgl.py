@@ -0,0 +1,524 @@
+import math
+
+import numpy as np
+
+from raster.line import Bresenham, Bresenham_batch, spans_to_pixels
+
+
+# The GL enums the scenes use. Values match OpenGL so code that compares or
+# stores them keeps working.
+GL_POINTS = 0x0000
+GL_LINES = 0x0001
+GL_LINE_LOOP = 0x0002
+GL_LINE_STRIP = 0x0003
+GL_TRIANGLES = 0x0004
+GL_TRIANGLE_STRIP = 0x0005
+GL_TRIANGLE_FAN = 0x0006
+GL_QUADS = 0x0007
+GL_POLYGON = 0x0009
+GL_DEPTH_BUFFER_BIT = 0x0100
+GL_COLOR_BUFFER_BIT = 0x4000
+GL_SRC_ALPHA = 0x0302
+GL_ONE_MINUS_SRC_ALPHA = 0x0303
+GL_BLEND = 0x0BE2
+GL_SCISSOR_TEST = 0x0C11
+GL_COMPILE = 0x1300
+GL_COMPILE_AND_EXECUTE = 0x1301
+GL_MODELVIEW = 0x1700
+GL_PROJECTION = 0x1701
+GL_UNSIGNED_BYTE = 0x1401
+GL_INT = 0x1404
+GL_FLOAT = 0x1406
+GL_DOUBLE = 0x140A
+GL_VERTEX_ARRAY = 0x8074
+GL_COLOR_ARRAY = 0x8076
+GL_ARRAY_BUFFER = 0x8892
+GL_STATIC_DRAW = 0x88E4
+GL_DYNAMIC_DRAW = 0x88E8
+
+CONSTANTS = {name: value for name, value in globals().items() if name.startswith("GL_")}
+
+# numpy types of the glVertexPointer/glColorPointer type enums
+ARRAY_TYPES = {
+    GL_UNSIGNED_BYTE: np.uint8,
+    GL_INT: np.int32,
+    GL_FLOAT: np.float32,
+    GL_DOUBLE: np.float64,
+}
+
+
+def _translate(tx, ty):
+    return np.array([[1.0, 0.0, tx], [0.0, 1.0, ty], [0.0, 0.0, 1.0]])
+
+
+def _scale(sx, sy):
+    return np.array([[sx, 0.0, 0.0], [0.0, sy, 0.0], [0.0, 0.0, 1.0]])
+
+
+class SoftGL:
+    """
+    Software stand-in for the immediate-mode GL subset the scenes use.
+
+    Every call is executed against a raster.framebuffer.Framebuffer instead
+    of a GL context, so a display() function written for GLUT can render
+    headless: install() rebinds the gl* names of the scene modules to the
+    methods of one SoftGL object.
+
+    What is covered:
+    - glBegin/glEnd with points, lines, line strips/loops, triangles, fans,
+      quads and polygons; glVertex2d/2f/2i and glColor3ub/3f/4f
+    - Per-vertex colors are interpolated (smooth shading) across convex
+      filled primitives; single-color primitives use the scanline fill
+    - glLineWidth and glPointSize (square footprints)
+    - Projection and modelview stacks with glOrtho/gluOrtho2D, glTranslatef,
+      glScalef and glRotatef about the Z axis (the scenes are 2D)
+    - glViewport, glClear and glClearColor
+    - glScissor with glEnable/glDisable(GL_SCISSOR_TEST): the box becomes
+      the framebuffer's clip rectangle, and primitives entirely outside it
+      are skipped before they are rasterized
+    - Client vertex arrays: glVertexPointer, glColorPointer (unsigned byte
+      or float colors), glEnable/DisableClientState and glDrawArrays
+    - Vertex buffer objects (glGenBuffers, glBindBuffer, glBufferData,
+      glDeleteBuffers): while a GL_ARRAY_BUFFER is bound, the pointer
+      argument of glVertexPointer/glColorPointer is a byte offset into it
+    - Display lists (glGenLists, glNewList, glEndList, glCallList,
+      glDeleteLists): calls made through namespace() between glNewList and
+      glEndList are stored and replayed by glCallList; as in GL, the array
+      pointer calls run immediately and glDrawArrays stores a copy of the
+      vertices it reads
+
+    Blending, depth and anything 3D are accepted and ignored.
+    """
+
+    def __init__(self, fb):
+        self.fb = fb
+        self.clear_color = (0, 0, 0, 255)
+        self.color = (255, 255, 255, 255)
+        self.line_width = 1.0
+        self.point_size = 1.0
+        self.viewport = (0, 0, fb.width, fb.height)
+        self.scissor = (0, 0, fb.width, fb.height)
+        self.scissor_test = False
+        self.stacks = {GL_MODELVIEW: [np.eye(3)], GL_PROJECTION: [np.eye(3)]}
+        self.mode = GL_MODELVIEW
+        self.primitive = None
+        self.vertices = []
+        self.colors = []
+        self.arrays = {}           # client state -> (n, k) array, when enabled
+        self.pointers = {}
+        self.lists = {}
+        self.recording = None      # (list id, execute too?) while compiling
+        self.buffers = {}          # buffer id -> uint8 bytes
+        self.array_buffer = 0      # bound GL_ARRAY_BUFFER, 0 for none
+
+    # ---------- State ----------
+
+    def glClearColor(self, r, g, b, a=1.0):
+        self.clear_color = _color_f(r, g, b, a)
+
+    def glClear(self, mask):
+        if mask & GL_COLOR_BUFFER_BIT:
+            self.fb.clear(self.clear_color)
+
+    def glColor3ub(self, r, g, b):
+        self.color = (int(r), int(g), int(b), 255)
+
+    def glColor3f(self, r, g, b):
+        self.color = _color_f(r, g, b)
+
+    def glColor4f(self, r, g, b, a):
+        self.color = _color_f(r, g, b, a)
+
+    def glLineWidth(self, width):
+        self.line_width = float(width)
+
+    def glPointSize(self, size):
+        self.point_size = float(size)
+
+    def glViewport(self, x, y, width, height):
+        self.viewport = (x, y, width, height)
+
+    def glScissor(self, x, y, width, height):
+        self.scissor = (x, y, width, height)
+        self._apply_scissor()
+
+    def glEnable(self, cap):
+        if cap == GL_SCISSOR_TEST:
+            self.scissor_test = True
+            self._apply_scissor()
+
+    def glDisable(self, cap):
+        if cap == GL_SCISSOR_TEST:
+            self.scissor_test = False
+            self._apply_scissor()
+
+    def _apply_scissor(self):
+        if not self.scissor_test:
+            self.fb.set_clip(None)
+            return
+        x, y, width, height = self.scissor
+        self.fb.set_clip((x, y, x + width - 1, y + height - 1))
+
+    def glBlendFunc(self, sfactor, dfactor):
+        pass
+
+    def glFlush(self):
+        pass
+
+    def glutSwapBuffers(self):
+        pass
+
+    def glutPostRedisplay(self):
+        pass
+
+    # ---------- Matrices ----------
+
+    def glMatrixMode(self, mode):
+        self.mode = mode
+
+    def glLoadIdentity(self):
+        self.stacks[self.mode][-1] = np.eye(3)
+
+    def glPushMatrix(self):
+        stack = self.stacks[self.mode]
+        stack.append(stack[-1].copy())
+
+    def glPopMatrix(self):
+        self.stacks[self.mode].pop()
+
+    def _multiply(self, m):
+        stack = self.stacks[self.mode]
+        stack[-1] = stack[-1] @ m
+
+    def glTranslatef(self, x, y, z=0.0):
+        self._multiply(_translate(x, y))
+
+    glTranslated = glTranslatef
+
+    def glScalef(self, x, y, z=1.0):
+        self._multiply(_scale(x, y))
+
+    glScaled = glScalef
+
+    def glRotatef(self, angle, x=0.0, y=0.0, z=1.0):
+        # Only rotations about Z change a 2D scene
+        t = math.radians(angle) * (1.0 if z >= 0 else -1.0)
+        c, s = math.cos(t), math.sin(t)
+        self._multiply(np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]]))
+
+    glRotated = glRotatef
+
+    def glOrtho(self, left, right, bottom, top, near=-1.0, far=1.0):
+        # Maps [left, right] x [bottom, top] onto normalized [-1, 1]
+        self._multiply(_scale(2.0 / (right - left), 2.0 / (top - bottom))
+                       @ _translate(-(right + left) / 2.0, -(top + bottom) / 2.0))
+
+    def gluOrtho2D(self, left, right, bottom, top):
+        self.glOrtho(left, right, bottom, top)
+
+    # ---------- Primitives ----------
+
+    def glBegin(self, mode):
+        self.primitive = mode
+        self.vertices = []
+        self.colors = []
+
+    def glVertex2f(self, x, y):
+        self.vertices.append((x, y))
+        self.colors.append(self.color)
+
+    glVertex2d = glVertex2f
+    glVertex2i = glVertex2f
+
+    def glEnd(self):
+        mode = self.primitive
+        self.primitive = None
+        if not self.vertices:
+            return
+        self._draw(mode, np.array(self.vertices, dtype=np.float64),
+                   np.array(self.colors, dtype=np.float64))
+
+    # ---------- Vertex arrays ----------
+
+    def glEnableClientState(self, array):
+        self.arrays[array] = self.pointers.get(array)
+
+    def glDisableClientState(self, array):
+        self.arrays.pop(array, None)
+
+    def glVertexPointer(self, size, type, stride, pointer):
+        self._pointer(GL_VERTEX_ARRAY, size, self._buffered(type, pointer))
+
+    def glColorPointer(self, size, type, stride, pointer):
+        pointer = self._buffered(type, pointer)
+        colors = np.asarray(pointer, dtype=np.float64).reshape(-1, size)
+        if type in (GL_FLOAT, GL_DOUBLE):
+            colors = np.rint(np.clip(colors, 0.0, 1.0) * 255.0)
+        if size == 3:
+            colors = np.concatenate([colors, np.full((len(colors), 1), 255.0)], axis=1)
+        self._pointer(GL_COLOR_ARRAY, 4, colors)
+
+    def _buffered(self, type, pointer):
+        # With a buffer bound, the pointer is an offset into its bytes
+        if not self.array_buffer:
+            return pointer
+        data = self.buffers[self.array_buffer]
+        return data[int(pointer or 0):].view(ARRAY_TYPES[type])
+
+    def glGenBuffers(self, count):
+        first = max(self.buffers, default=0) + 1
+        for i in range(first, first + count):
+            self.buffers[i] = np.empty(0, dtype=np.uint8)
+        return first if count == 1 else list(range(first, first + count))
+
+    def glBindBuffer(self, target, buffer):
+        if target == GL_ARRAY_BUFFER:
+            self.array_buffer = buffer
+
+    def glBufferData(self, target, size, data, usage):
+        raw = np.frombuffer(np.ascontiguousarray(data).tobytes(), dtype=np.uint8)
+        self.buffers[self.array_buffer] = raw[:size].copy()
+
+    def glDeleteBuffers(self, count, buffers):
+        for buffer in np.ravel(buffers)[:count]:
+            self.buffers.pop(int(buffer), None)
+            if self.array_buffer == buffer:
+                self.array_buffer = 0
+
+    def _pointer(self, array, size, pointer):
+        # Tightly packed arrays only (stride 0), which is what the scenes pass
+        data = np.asarray(pointer, dtype=np.float64).reshape(-1, size)
+        self.pointers[array] = data
+        if array in self.arrays:
+            self.arrays[array] = data
+
+    def glDrawArrays(self, mode, first, count):
+        vertices, colors = self._read_arrays(first, count)
+        self._draw_arrays(mode, vertices, colors)
+
+    def _read_arrays(self, first, count):
+        vertices = self.arrays.get(GL_VERTEX_ARRAY)
+        if vertices is None or count <= 0:
+            return None, None
+        colors = self.arrays.get(GL_COLOR_ARRAY)
+        if colors is not None:
+            colors = colors[first:first + count]
+        return vertices[first:first + count, :2], colors
+
+    def _draw_arrays(self, mode, vertices, colors):
+        if vertices is None:
+            return
+        if colors is None:
+            colors = np.broadcast_to(np.array(self.color, dtype=np.float64), (len(vertices), 4))
+        else:
+            # The current color is left at the last array color, as glColor would
+            self.color = tuple(int(c) for c in colors[-1])
+        self._draw(mode, vertices, colors)
+
+    def _draw(self, mode, vertices, colors):
+        pts = self._to_window(vertices)
+        if self.scissor_test and not self._touches_clip(pts):
+            return
+
+        if mode == GL_POINTS:
+            for color in np.unique(colors, axis=0):
+                same = np.all(colors == color, axis=1)
+                self.fb.plot(pts[same], tuple(color.astype(int)), _pixels(self.point_size))
+        elif mode in (GL_LINES, GL_LINE_STRIP, GL_LINE_LOOP):
+            if mode == GL_LINES:
+                pairs = [(i, i + 1) for i in range(0, len(pts) - 1, 2)]
+            else:
+                pairs = [(i, i + 1) for i in range(len(pts) - 1)]
+                if mode == GL_LINE_LOOP and len(pts) > 2:
+                    pairs.append((len(pts) - 1, 0))
+            if not pairs:
+                return
+            if np.all(colors == colors[0]):
+                # One color: every segment in a single batch
+                ends = np.rint(pts[np.array(pairs).reshape(-1)]).reshape(-1, 4)
+                pixels, _ = Bresenham_batch(ends)
+                self.fb.plot(pixels, tuple(colors[0].astype(int)), _pixels(self.line_width))
+                return
+            for i, j in pairs:
+                # GL uses the last vertex's color for flat lines; close enough
+                line = Bresenham(*np.rint(pts[i]), *np.rint(pts[j]))
+                self.fb.plot(line, tuple(colors[j].astype(int)), _pixels(self.line_width))
+        elif mode == GL_TRIANGLES:
+            n = len(pts) // 3 * 3
+            tri_colors = colors[:n].reshape(-1, 3, 4)
+            if np.all(tri_colors == tri_colors[:, :1]):
+                # Flat triangles (e.g. batched instances) are filled in one pass
+                self.fb.fill_triangles(pts[:n].reshape(-1, 3, 2), tri_colors[:, 0].astype(np.uint8))
+                return
+            for k in range(0, len(pts) - 2, 3):
+                self._fill(pts[k:k + 3], colors[k:k + 3])
+        elif mode == GL_TRIANGLE_STRIP:
+            for k in range(len(pts) - 2):
+                self._fill(pts[k:k + 3], colors[k:k + 3])
+        elif mode == GL_QUADS:
+            for k in range(0, len(pts) - 3, 4):
+                self._fill(pts[k:k + 4], colors[k:k + 4])
+        elif mode in (GL_POLYGON, GL_TRIANGLE_FAN):
+            # A fan around a point inside its rim covers the rim polygon
+            self._fill(pts, colors)
+
+    def _to_window(self, vertices):
+        # modelview -> projection -> viewport, then shift so pixel (i, j)
+        # is sampled at its center (i + 0.5, j + 0.5)
+        m = self.stacks[GL_PROJECTION][-1] @ self.stacks[GL_MODELVIEW][-1]
+        ndc = vertices @ m[:2, :2].T + m[:2, 2]
+        vx, vy, vw, vh = self.viewport
+        out = np.empty_like(ndc)
+        out[:, 0] = vx + (ndc[:, 0] + 1.0) * vw / 2.0 - 0.5
+        out[:, 1] = vy + (ndc[:, 1] + 1.0) * vh / 2.0 - 0.5
+        return out
+
+    def _touches_clip(self, pts):
+        # Whether the primitive's bounding box, grown by the point or line
+        # footprint, reaches the clip rectangle at all
+        pad = max(self.point_size, self.line_width) / 2.0 + 1.0
+        xmin, ymin, xmax, ymax = self.fb.clip
+        return (pts[:, 0].min() - pad <= xmax and pts[:, 0].max() + pad >= xmin
+                and pts[:, 1].min() - pad <= ymax and pts[:, 1].max() + pad >= ymin)
+
+    def _fill(self, pts, colors):
+        if len(pts) < 3:
+            return
+        if np.all(colors == colors[0]):
+            self.fb.fill_polygon(pts, tuple(colors[0].astype(int)))
+            return
+        _shade_fan(self.fb, pts, colors)
+
+    # ---------- Display lists ----------
+
+    def glGenLists(self, count):
+        first = max(self.lists, default=0) + 1
+        for i in range(first, first + count):
+            self.lists[i] = []
+        return first
+
+    def glNewList(self, list_id, mode):
+        self.lists[list_id] = []
+        self.recording = (list_id, mode == GL_COMPILE_AND_EXECUTE)
+
+    def glEndList(self):
+        self.recording = None
+
+    def glCallList(self, list_id):
+        for method, args in self.lists.get(list_id, ()):
+            method(*args)
+
+    def glDeleteLists(self, list_id, count):
+        for i in range(list_id, list_id + count):
+            self.lists.pop(i, None)
+
+    # ---------- Binding ----------
+
+    def namespace(self):
+        """
+        gl*/glu*/glut* names and GL_* constants bound to this context.
+
+        While a display list is being compiled, the bound functions store
+        their calls in it instead of (or, with GL_COMPILE_AND_EXECUTE, as
+        well as) running them.
+        """
+        names = {name: self._recordable(getattr(self, name)) for name in dir(type(self))
+                 if name.startswith("gl")}
+        names.update(CONSTANTS)
+        return names
+
+    def _recordable(self, method):
+        if method.__name__ in LIST_CONTROL or method.__name__ in CLIENT_STATE:
+            return method
+
+        def call(*args):
+            if self.recording is None:
+                return method(*args)
+            list_id, execute = self.recording
+            if method.__name__ == "glDrawArrays":
+                # The list keeps the vertices, not the client arrays
+                mode, first, count = args
+                vertices, colors = self._read_arrays(first, count)
+                self.lists[list_id].append((self._draw_arrays, (
+                    mode,
+                    None if vertices is None else vertices.copy(),
+                    None if colors is None else colors.copy(),
+                )))
+            else:
+                self.lists[list_id].append((method, args))
+            if execute:
+                return method(*args)
+
+        call.__name__ = method.__name__
+        return call
+
+
+# Display-list management calls are never recorded into a list
+LIST_CONTROL = {"glGenLists", "glNewList", "glEndList", "glDeleteLists"}
+
+# Client-side state and buffer objects are not part of a display list
+# either; they always run
+CLIENT_STATE = {"glEnableClientState", "glDisableClientState", "glVertexPointer", "glColorPointer",
+                "glGenBuffers", "glBindBuffer", "glBufferData", "glDeleteBuffers"}
+
+
+def install(ctx, *namespaces):
+    """
+    Point the GL names of the given module namespaces at a SoftGL context.
+
+    Parameters:
+    - ctx: SoftGL to draw with
+    - namespaces: Module global dicts, e.g. globals() or vars(module)
+
+    The scenes do "from OpenGL.GL import *", so their functions look the gl*
+    names up in the module globals on every call; rebinding those globals is
+    enough to send an unmodified display() to the software renderer.
+    """
+    names = ctx.namespace()
+    for namespace in namespaces:
+        namespace.update(names)
+
+
+def _color_f(r, g, b, a=1.0):
+    return tuple(int(round(255 * min(max(c, 0.0), 1.0))) for c in (r, g, b, a))
+
+
+def _pixels(size):
+    return max(1, int(round(size)))
+
+
+def _shade_fan(fb, pts, colors):
+    # Smooth shading of a convex polygon or fan, split into triangles
+    # (pts[0], pts[k], pts[k + 1]). Color is affine inside each triangle, so
+    # every triangle gets a 3x4 matrix with color = (x, y, 1) @ M. The covered
+    # pixels come from the scanline fill, and each pixel finds its triangle by
+    # its angle around pts[0] (the triangles of a convex fan are ordered by
+    # angle).
+    pixels = spans_to_pixels(fb.polygon_spans(pts))
+    if len(pixels) == 0:
+        return
+
+    k = np.arange(1, len(pts) - 1)
+    corners = np.stack([np.zeros_like(k), k, k + 1], axis=1)
+    system = np.concatenate([pts[corners], np.ones(corners.shape + (1,))], axis=2)
+    flat = np.abs(np.linalg.det(system)) < 1e-12
+    system[flat] = np.eye(3)   # degenerate triangles cover no pixel centers
+    M = np.linalg.solve(system, colors[corners]).astype(np.float32)
+
+    if len(k) == 1:
+        tri = np.zeros(len(pixels), dtype=np.intp)
+    else:
+        cx, cy = pts[0]
+        rim = pts[1:]
+        angles = np.unwrap(np.arctan2(rim[:, 1] - cy, rim[:, 0] - cx))
+        sign = 1.0 if angles[-1] >= angles[0] else -1.0
+        angles = sign * angles
+        a = sign * np.arctan2(pixels[:, 1] - cy, pixels[:, 0] - cx)
+        a = angles[0] + np.mod(a - angles[0], 2 * np.pi)
+        tri = np.clip(np.searchsorted(angles, a, side="right") - 1, 0, len(k) - 1)
+
+    px = pixels[:, 0, None].astype(np.float32)
+    py = pixels[:, 1, None].astype(np.float32)
+    shade = px * M[tri, 0] + py * M[tri, 1] + M[tri, 2]
+    np.clip(shade, 0, 255, out=shade)
+    fb.pixels[pixels[:, 1], pixels[:, 0]] = np.rint(shade).astype(np.uint8)
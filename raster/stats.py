@@ -0,0 +1,23 @@
+class FrameCounter:
+    """
+    Named running totals for per-frame statistics.
+
+    FrameCounter("drawn", "fixed") keeps one total per name, readable as an
+    attribute (counter.drawn). record(drawn, fixed) adds to them in the
+    order of the names; reset() starts a new frame and returns the totals
+    of the one just finished, as a tuple in the same order.
+    """
+
+    def __init__(self, *names):
+        self.names = names
+        self.reset()
+
+    def record(self, *amounts):
+        for name, amount in zip(self.names, amounts):
+            setattr(self, name, getattr(self, name) + amount)
+
+    def reset(self):
+        totals = tuple(getattr(self, name, 0) for name in self.names)
+        for name in self.names:
+            setattr(self, name, 0)
+        return totals
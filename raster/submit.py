@@ -0,0 +1,176 @@
+"""
+Vertex-array submission of rasterizer output.
+
+The routines in raster/ return pixels as (N, 2) arrays; drawing them with
+one glVertex2i call per pixel costs a PyOpenGL call (and its argument
+conversion) per pixel. draw_point_array() hands the whole array to GL in
+a single glDrawArrays, and PointBuffer keeps it in a vertex buffer object
+that is only uploaded again when the points change. PointBatch collects
+points one at a time, for code that produces them in a loop, and draws
+them together.
+
+Unlike the rest of the package this module needs PyOpenGL, so raster's
+__init__ does not import it. Its gl* names are module globals, so
+raster.softgl.install(ctx, vars(raster.submit)) sends it to a SoftGL.
+"""
+import numpy as np
+
+from OpenGL.GL import (
+    GL_ARRAY_BUFFER,
+    GL_DOUBLE,
+    GL_INT,
+    GL_POINTS,
+    GL_STATIC_DRAW,
+    GL_VERTEX_ARRAY,
+    glBindBuffer,
+    glBufferData,
+    glDeleteBuffers,
+    glDisableClientState,
+    glDrawArrays,
+    glEnableClientState,
+    glGenBuffers,
+    glPointSize,
+    glVertexPointer,
+)
+
+
+def pack_points(*shapes):
+    """
+    One contiguous (N, 2) int32 array of pixels.
+
+    Parameters:
+    - shapes: Point lists or (n, 2) arrays, e.g. the outputs of several
+      rasterizer calls; they are concatenated in order
+
+    Returns the packed array. Float coordinates are rounded to the nearest
+    pixel, as Framebuffer.plot() does.
+    """
+    arrays = [np.asarray(points).reshape(-1, 2) for points in shapes]
+    pts = np.concatenate(arrays) if arrays else np.empty((0, 2), dtype=np.int32)
+    if pts.dtype.kind == "f":
+        pts = np.rint(pts)
+    return np.ascontiguousarray(pts, dtype=np.int32)
+
+
+def draw_point_array(points, mode=GL_POINTS):
+    """
+    Draw pixels with one glVertexPointer/glDrawArrays call.
+
+    Parameters:
+    - points: (N, 2) array-like of pixels (see pack_points)
+    - mode: GL primitive, GL_POINTS unless the points are vertices
+
+    Uses the current color and point size, like a glBegin/glEnd loop over
+    glVertex2i would.
+    """
+    pts = pack_points(points)
+    if len(pts) == 0:
+        return
+    glEnableClientState(GL_VERTEX_ARRAY)
+    glVertexPointer(2, GL_INT, 0, pts)
+    glDrawArrays(mode, 0, len(pts))
+    glDisableClientState(GL_VERTEX_ARRAY)
+
+
+class PointBuffer:
+    """
+    Pixels kept in a vertex buffer object between frames.
+
+    draw(points) compares the points with the ones already uploaded and
+    calls glBufferData only when they differ, so a static scene crosses
+    to the GPU once and every later frame is a bind and a glDrawArrays.
+    Without VBO support (vbo=False, or a GL without glGenBuffers) it
+    falls back to draw_point_array().
+    """
+
+    def __init__(self, vbo=True):
+        self.vbo = vbo
+        self.buffer = None
+        self.points = None
+        self.uploads = 0
+
+    def draw(self, points, mode=GL_POINTS):
+        pts = pack_points(points)
+        if self.vbo and self.buffer is None:
+            # PyOpenGL functions missing from the driver are false
+            self.vbo = bool(glGenBuffers)
+            if self.vbo:
+                self.buffer = glGenBuffers(1)
+        if not self.vbo:
+            draw_point_array(pts, mode)
+            return
+        if len(pts) == 0:
+            return
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.buffer)
+        if self.points is None or not np.array_equal(pts, self.points):
+            glBufferData(GL_ARRAY_BUFFER, pts.nbytes, pts, GL_STATIC_DRAW)
+            self.points = pts
+            self.uploads += 1
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_INT, 0, None)
+        glDrawArrays(mode, 0, len(pts))
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def delete(self):
+        """
+        Free the buffer object (it is created again on the next draw).
+        """
+        if self.buffer is not None:
+            glDeleteBuffers(1, [self.buffer])
+        self.buffer = None
+        self.points = None
+
+
+class PointBatch:
+    """
+    Accumulator for points produced one at a time.
+
+    add(x, y) and extend(points) only append to Python lists; flush() draws
+    everything collected so far with one glDrawArrays(GL_POINTS) and empties
+    the batch. Coordinates are kept as float64 (sent as GL_DOUBLE), so
+    points between pixels land exactly where glVertex2f would put them.
+
+    Parameters:
+    - size: glPointSize to set before drawing, or None to keep the current one
+    """
+
+    def __init__(self, size=None):
+        self.size = size
+        self.xs = []
+        self.ys = []
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add(self, x, y):
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def extend(self, points):
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        self.xs.extend(pts[:, 0].tolist())
+        self.ys.extend(pts[:, 1].tolist())
+
+    def flush(self):
+        """
+        Draw the collected points in the current color and clear the batch.
+        Returns the number of points drawn.
+        """
+        count = len(self.xs)
+        if count == 0:
+            return 0
+        vertices = np.empty((count, 2), dtype=np.float64)
+        vertices[:, 0] = self.xs
+        vertices[:, 1] = self.ys
+        self.xs = []
+        self.ys = []
+
+        if self.size is not None:
+            glPointSize(self.size)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(2, GL_DOUBLE, 0, vertices)
+        glDrawArrays(GL_POINTS, 0, count)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        return count